@@ -0,0 +1,75 @@
+import argparse
+import time
+from dataclasses import asdict
+from typing import Any, Type, get_type_hints
+
+from nemo_library.model.column import Column
+
+from nemo_library_fox_reader.foxnemo_persistence_api import _deserializeMetaDataObject
+
+# Compares the deserialization of a getColumns response with 10k columns: the previous
+# implementation (type hints read for every object) and the current one (decoders built once per type).
+
+
+def _deserialize_uncached(value: Any, target_type: Type) -> Any:
+    if isinstance(value, list):
+        if hasattr(target_type, "__origin__") and target_type.__origin__ is list:
+            element_type = target_type.__args__[0]
+            return [_deserialize_uncached(v, element_type) for v in value]
+        return value
+    elif isinstance(value, dict):
+        if hasattr(target_type, "__annotations__"):
+            field_types = get_type_hints(target_type)
+            return target_type(
+                **{
+                    key: _deserialize_uncached(value[key], field_types[key])
+                    for key in value
+                    if key in field_types
+                }
+            )
+        return value
+    return value
+
+
+def _payload(columns: int) -> list[dict]:
+    payload = []
+    for i in range(columns):
+        column = asdict(
+            Column(
+                displayName=f"Column {i}",
+                internalName=f"column_{i:05d}",
+                description=f"Description of column {i}",
+                dataType="string",
+                columnType="ExportedColumn",
+                order=f"{i:05d}",
+                id=f"id-{i}",
+                projectId="project",
+                tenant="tenant",
+            )
+        )
+        column["unknownField"] = "ignored"
+        payload.append(column)
+    return payload
+
+
+def _measure(name: str, function, payload: list[dict], repeat: int) -> list:
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = [function(item, Column) for item in payload]
+        duration = time.perf_counter() - start
+        best = duration if best is None else min(best, duration)
+    print(f"{name:<12} {best * 1000:>8.1f} ms for {len(payload)} columns")
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure the deserialization of metadata objects.")
+    parser.add_argument("--columns", type=int, default=10000, help="number of columns in the payload")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per implementation, the best one is reported")
+    args = parser.parse_args()
+
+    payload = _payload(args.columns)
+    expected = _measure("uncached", _deserialize_uncached, payload, args.repeat)
+    result = _measure("cached", _deserializeMetaDataObject, payload, args.repeat)
+    assert result == expected, "the implementations return different objects"
@@ -0,0 +1,74 @@
+import argparse
+import logging
+import time
+
+from nemo_library.model.column import Column
+
+from nemo_library_fox_reader.foxmockserver import (
+    MOCK_BULK_ENDPOINT_PATHS,
+    FOXMockNemoServer,
+    register_mock_bulk_endpoints,
+)
+from nemo_library_fox_reader.foxnemo_persistence_api import (
+    clearProjectIDCache,
+    createColumns,
+    deleteColumns,
+    getColumns,
+    registerBulkEndpoint,
+)
+
+# Counts the requests and measures the time of creating, updating and deleting the columns of a
+# wide FOX file against the local mock NEMO server: one request per column, sent one after the other
+# or in parallel, and bulk requests.
+
+
+def _columns(count: int, description: str) -> list[Column]:
+    return [
+        Column(
+            displayName=f"Column {i}",
+            internalName=f"column_{i:05d}",
+            description=description,
+            dataType="string",
+            columnType="ExportedColumn",
+        )
+        for i in range(count)
+    ]
+
+
+def run_scenario(name: str, columns: int, max_parallel_requests: int, bulk: bool) -> None:
+    for operation in MOCK_BULK_ENDPOINT_PATHS:
+        registerBulkEndpoint("Columns", operation, None)
+    if bulk:
+        register_mock_bulk_endpoints(["Columns"])
+
+    with FOXMockNemoServer(bulk_endpoints=bulk) as server:
+        config = server.create_config()
+        clearProjectIDCache()
+        server.add_project("benchmark")
+
+        for step, call in [
+            ("create", lambda: createColumns(config, "benchmark", _columns(columns, "new"), max_parallel_requests)),
+            ("update", lambda: createColumns(config, "benchmark", _columns(columns, "changed"), max_parallel_requests)),
+            ("delete", lambda: deleteColumns(config, [c.id for c in getColumns(config, "benchmark")], max_parallel_requests)),
+        ]:
+            server.reset_counts()
+            start = time.perf_counter()
+            call()
+            duration = time.perf_counter() - start
+            print(f"{name:<28} {step:<7} {server.total_requests:>7} requests {duration:>8.2f} s")
+
+    for operation in MOCK_BULK_ENDPOINT_PATHS:
+        registerBulkEndpoint("Columns", operation, None)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure the metadata requests of wide FOX files against a local mock server.")
+    parser.add_argument("--columns", type=int, default=2000, help="number of columns")
+    parser.add_argument("--parallel", type=int, default=8, help="requests sent at the same time")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    run_scenario("one request per column", args.columns, 1, bulk=False)
+    run_scenario(f"{args.parallel} requests in parallel", args.columns, args.parallel, bulk=False)
+    run_scenario("bulk requests", args.columns, args.parallel, bulk=True)
@@ -0,0 +1,76 @@
+import argparse
+import logging
+import time
+
+from nemo_library_fox_reader.foxfileingestion import ReUploadFile
+from nemo_library_fox_reader.foxmockserver import (
+    FOXMockNemoServer,
+    load_recording,
+    register_mock_bulk_endpoints,
+)
+from nemo_library_fox_reader.foxnemo_persistence_api import clearProjectIDCache
+from nemo_library_fox_reader.foxreaderinfo import FOXReaderInfo
+from nemo_library_fox_reader.foxs3 import clear_s3_client_cache
+
+# Imports a file end to end (metadata, S3 upload, ingestion, post-processing) into a local mock
+# NEMO server and prints the number of requests per route and the wall time. The latency simulates
+# the round trip to NEMO; a recorded session (see FOXTrafficRecorder) can be replayed instead.
+
+
+def run(
+    filename: str,
+    runs: int,
+    latency: float,
+    task_duration: float,
+    bulk: bool,
+    replay: str | None,
+    version: int,
+) -> None:
+    if bulk:
+        register_mock_bulk_endpoints()
+
+    with FOXMockNemoServer(
+        latency=latency,
+        task_duration=task_duration,
+        bulk_endpoints=bulk,
+        replay=load_recording(replay) if replay else None,
+        replay_latency=bool(replay),
+    ) as server:
+        config = server.create_config()
+        upload_settings = server.create_upload_settings()
+        clearProjectIDCache()
+        clear_s3_client_cache()
+
+        for run_number in range(1, runs + 1):
+            server.reset_counts()
+            start = time.perf_counter()
+            ReUploadFile(
+                config=config,
+                projectname="benchmark",
+                filename=filename,
+                version=version,
+                foxReaderInfo=FOXReaderInfo(),
+                upload_settings=upload_settings,
+                force=True,
+            )
+            duration = time.perf_counter() - start
+
+            print(f"run {run_number}: {server.total_requests} requests in {duration:.2f} s")
+            for route, count in sorted(server.request_counts.items(), key=lambda item: -item[1]):
+                print(f"    {count:>6}  {route}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure the requests of ReUploadFile against a local mock NEMO server.")
+    parser.add_argument("filename", help="file to import, e.g. a FOX file")
+    parser.add_argument("--runs", type=int, default=2, help="number of imports; the first one creates the project")
+    parser.add_argument("--latency", type=float, default=0.02, help="seconds added to every response")
+    parser.add_argument("--task-duration", type=float, default=0.5, help="seconds until a queue task is finished")
+    parser.add_argument("--bulk", action="store_true", help="use the bulk metadata endpoints of the mock server")
+    parser.add_argument("--replay", help="traffic recorded with FOXTrafficRecorder")
+    parser.add_argument("--version", type=int, default=2, help="ingestion version (2 or 3)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    run(args.filename, args.runs, args.latency, args.task_duration, args.bulk, args.replay, args.version)
@@ -159,10 +159,29 @@ class FoxAttribute:
     def get_nemo_name(self) -> str:
         """
         Returns the Nemo name for the attribute, which is a sanitized version of the display name.
+        The name is computed once and again only after attribute_name, attribute_id or uuid changed.
 
         Returns:
             str: The sanitized Nemo name.
         """
+        key = (self.attribute_name, self.attribute_id, self.uuid)
+        # not a dataclass field, so to_dict and comparisons do not see it
+        cached = self.__dict__.get("_nemo_name_cache")
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        nemo_name = self._compute_nemo_name()
+        self._nemo_name_cache = (key, nemo_name)
+        return nemo_name
+
+    @staticmethod
+    def precompute_nemo_names(attributes: List["FoxAttribute"]) -> None:
+        """
+        Computes the Nemo names of all attributes in advance, e.g. once the attributes of a file are read.
+        """
+        for attribute in attributes:
+            attribute.get_nemo_name()
+
+    def _compute_nemo_name(self) -> str:
         nemo_name = get_internal_name(
             f"{self.attribute_name}_{self.attribute_id}_{self.uuid}"
         )
@@ -0,0 +1,245 @@
+import argparse
+import logging
+import os
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Callable
+
+from nemo_library.features.import_configuration import ImportConfigurations
+from nemo_library.utils.config import Config
+from nemo_library_fox_reader.foxfileingestion import ReUploadFile
+from nemo_library_fox_reader.foxprogressmanager import FOXProgressManager
+from nemo_library_fox_reader.foxreaderinfo import FOXReaderInfo
+from nemo_library_fox_reader.foxuploadsettings import FOXUploadSettings
+
+__all__ = [
+    "FOXBatchImportResult",
+    "FOXBatchImportSettings",
+    "ReUploadFiles",
+    "collect_fox_files",
+    "default_projectname",
+]
+
+
+@dataclass
+class FOXBatchImportSettings:
+    """
+    Limits for importing several FOX files at the same time.
+    """
+
+    # number of files that are imported at the same time
+    max_parallel_files: int = 4
+
+    # number of files that are parsed at the same time. Parsing runs in the import threads and holds
+    # the GIL, so more slots do not add CPU throughput; they only let parsing overlap with the network
+    # work of other files. Every parse keeps a whole file in memory, so this is mainly a memory limit
+    max_parallel_parses: int = 2
+
+    # number of data files that are uploaded to S3 at the same time (network bound)
+    max_parallel_uploads: int = 4
+
+    # number of imports that work on the same NEMO project at the same time. Imports into the same
+    # project change the same metadata, so the default runs them one after the other
+    max_sessions_per_project: int = 1
+
+
+@dataclass
+class FOXBatchImportResult:
+    filename: str
+    projectname: str
+    success: bool = False
+    exception: Exception | None = None
+    duration: float = 0.0
+    foxReaderInfo: FOXReaderInfo | None = None
+
+
+def collect_fox_files(paths: list[str | os.PathLike]) -> list[str]:
+    """
+    Expands directories into the FOX files they contain (recursively). Files are kept as they are.
+    """
+    filenames = []
+    for path in paths:
+        path = Path(path)
+        if path.is_dir():
+            filenames.extend(str(fox_file) for fox_file in sorted(path.rglob("*.fox")))
+        else:
+            filenames.append(str(path))
+    return filenames
+
+
+def default_projectname(filename: str) -> str:
+    return f"FOX_{Path(filename).stem}"
+
+
+def ReUploadFiles(
+    config: Config,
+    filenames: list[str],
+    projectname_for_file: Callable[[str], str] = default_projectname,
+    batch_settings: FOXBatchImportSettings | None = None,
+    upload_settings: FOXUploadSettings | None = None,
+    update_project_settings: bool = True,
+    version: int = 2,
+    import_configuration: ImportConfigurations = None,
+    format_data: bool = True,
+    statistics_only: bool = False,
+    delta_import: bool = False,
+    force: bool = False,
+) -> list[FOXBatchImportResult]:
+    """
+    Imports several files concurrently, each into its own project (see ReUploadFile).
+
+    Args:
+        config (Config): Configuration object containing connection details and headers.
+        filenames (list[str]): The files to import.
+        projectname_for_file (Callable[[str], str], optional): Returns the project name for a file. Defaults to "FOX_<file stem>".
+        batch_settings (FOXBatchImportSettings, optional): Concurrency limits. Defaults to FOXBatchImportSettings().
+        upload_settings (FOXUploadSettings, optional): Compression and upload tuning. Defaults to FOXUploadSettings().
+        update_project_settings (bool, optional): Whether to trigger the "analyze_table" task after ingestion. Defaults to True.
+        version (int, optional): The ingestion version (2 or 3). Defaults to 2.
+        import_configuration (ImportConfigurations, optional): CSV format of the uploaded data.
+        format_data (bool, optional): Whether to format the data before the upload. Defaults to True.
+        statistics_only (bool, optional): If True, statistics are collected and no ingestion is performed.
+        delta_import (bool, optional): Skips the upload of files whose data did not change since their last import.
+        force (bool, optional): Imports files even if the identical file was imported before.
+
+    Returns:
+        list[FOXBatchImportResult]: One result per file, in the order of filenames. A failing file
+        does not stop the other imports; its exception is stored in the result.
+    """
+    batch_settings = batch_settings or FOXBatchImportSettings()
+
+    # the worker threads share config and only read it. The tokens are the one thing Config sets
+    # lazily, so they are requested here once instead of by several threads at the same time
+    if not statistics_only:
+        config.connection_get_tokens()
+
+    upload_settings = replace(
+        upload_settings or FOXUploadSettings(),
+        parse_slots=threading.Semaphore(max(1, batch_settings.max_parallel_parses)),
+        upload_slots=threading.Semaphore(max(1, batch_settings.max_parallel_uploads)),
+    )
+
+    project_sessions: dict[str, threading.Semaphore] = {}
+    project_sessions_lock = threading.Lock()
+
+    def project_session(projectname: str) -> threading.Semaphore:
+        with project_sessions_lock:
+            return project_sessions.setdefault(
+                projectname,
+                threading.Semaphore(max(1, batch_settings.max_sessions_per_project)),
+            )
+
+    def import_file(filename: str) -> FOXBatchImportResult:
+        projectname = projectname_for_file(filename)
+        foxReaderInfo = FOXReaderInfo()
+        foxReaderInfo.current_file_name = Path(filename).name
+        foxReaderInfo.current_file_path = filename
+        foxReaderInfo.current_fox_version = "unknown"
+        result = FOXBatchImportResult(
+            filename=filename, projectname=projectname, foxReaderInfo=foxReaderInfo
+        )
+
+        start = time.perf_counter()
+        with project_session(projectname), foxReaderInfo.progress_manager.activate():
+            FOXProgressManager.start()
+            FOXProgressManager.info(f"Uploading file {filename} to project {projectname}")
+            try:
+                ReUploadFile(
+                    config,
+                    projectname=projectname,
+                    filename=filename,
+                    update_project_settings=update_project_settings,
+                    version=version,
+                    import_configuration=import_configuration,
+                    format_data=format_data,
+                    foxReaderInfo=foxReaderInfo,
+                    statistics_only=statistics_only,
+                    upload_settings=upload_settings,
+                    delta_import=delta_import,
+                    force=force,
+                )
+                result.success = True
+            except Exception as exception:
+                foxReaderInfo.add_exception(exception)
+                result.exception = exception
+                logging.error(f"Import of {filename} into project {projectname} failed: {exception}")
+                logging.debug(traceback.format_exc())
+        result.duration = time.perf_counter() - start
+        return result
+
+    start = time.perf_counter()
+    results: dict[int, FOXBatchImportResult] = {}
+    with ThreadPoolExecutor(
+        max_workers=max(1, batch_settings.max_parallel_files),
+        thread_name_prefix="fox-batch",
+    ) as executor:
+        futures = {
+            executor.submit(import_file, filename): index
+            for index, filename in enumerate(filenames)
+        }
+        for future in as_completed(futures):
+            result = future.result()
+            results[futures[future]] = result
+            logging.info(
+                f"[{len(results)}/{len(filenames)}] {'OK' if result.success else 'FAILED'} "
+                f"{result.filename} -> {result.projectname} ({result.duration:.1f}s)"
+            )
+    logging.info(f"Batch import of {len(filenames)} files took {time.perf_counter() - start:.1f}s")
+
+    return [results[index] for index in range(len(filenames))]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Imports FOX files concurrently into NEMO, one project per file."
+    )
+    parser.add_argument("paths", nargs="+", help="FOX files or directories (searched recursively)")
+    parser.add_argument("--config-file", default="config.ini")
+    parser.add_argument("--project-prefix", default="FOX_", help="project name = prefix + file stem")
+    parser.add_argument("--max-parallel-files", type=int, default=FOXBatchImportSettings.max_parallel_files)
+    parser.add_argument("--max-parallel-parses", type=int, default=FOXBatchImportSettings.max_parallel_parses)
+    parser.add_argument("--max-parallel-uploads", type=int, default=FOXBatchImportSettings.max_parallel_uploads)
+    parser.add_argument(
+        "--max-sessions-per-project", type=int, default=FOXBatchImportSettings.max_sessions_per_project
+    )
+    parser.add_argument("--statistics-only", action="store_true")
+    parser.add_argument("--delta", action="store_true", help="skip files whose data did not change since their last import")
+    parser.add_argument("--force", action="store_true", help="import files even if they are identical to their last import")
+    parser.add_argument("--no-update-project-settings", action="store_true")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(threadName)s - %(message)s"
+    )
+
+    filenames = collect_fox_files(args.paths)
+    results = ReUploadFiles(
+        Config(config_file=args.config_file),
+        filenames,
+        projectname_for_file=lambda filename: f"{args.project_prefix}{Path(filename).stem}",
+        batch_settings=FOXBatchImportSettings(
+            max_parallel_files=args.max_parallel_files,
+            max_parallel_parses=args.max_parallel_parses,
+            max_parallel_uploads=args.max_parallel_uploads,
+            max_sessions_per_project=args.max_sessions_per_project,
+        ),
+        update_project_settings=not args.no_update_project_settings,
+        statistics_only=args.statistics_only,
+        delta_import=args.delta,
+        force=args.force,
+    )
+
+    failed = [result for result in results if not result.success]
+    logging.info("=" * 80)
+    logging.info(f"{len(results) - len(failed)} of {len(results)} files imported")
+    for result in failed:
+        logging.info(f"FAILED {result.filename}: {result.exception}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
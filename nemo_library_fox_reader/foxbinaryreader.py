@@ -4,15 +4,13 @@ foxbinaryreader.py: Utility for reading binary data from FOX files.
 
 import struct
 import logging
-import json
-import requests
-import boto3
 from urllib.parse import urlparse
 
 from typing import BinaryIO
 from botocore.exceptions import NoCredentialsError
 from nemo_library_fox_reader.foxprogressmanager import FOXProgressManager
 from nemo_library_fox_reader.foxreaderinfo import FOXReaderInfo
+from nemo_library_fox_reader.foxs3 import get_s3_client
 from nemo_library_fox_reader.foxstatisticsinfo import IssueType
 from nemo_library.utils.config import Config
 
@@ -41,33 +39,8 @@ class FoxBinaryReader:
 
     def open_s3_file(self, file_path: str) -> BinaryIO:
 
-        headers = self.config.connection_get_headers()
-
-        # Retrieve temporary credentials from NEMO TVM
-        response = requests.get(
-            self.config.get_config_nemo_url()
-            + "/api/nemo-tokenvendor/InternalTokenVendor/sts/s3_policy",
-            headers=headers,
-        )
-
-        if response.status_code != 200:
-            raise Exception(
-                f"Request failed. Status: {response.status_code}, error: {response.text}"
-            )
-
-        aws_credentials = json.loads(response.text)
-
-        aws_access_key_id = aws_credentials["accessKeyId"]
-        aws_secret_access_key = aws_credentials["secretAccessKey"]
-        aws_session_token = aws_credentials["sessionToken"]
-
-        # Create an S3 client
-        s3 = boto3.client(
-            "s3",
-            aws_access_key_id=aws_access_key_id,
-            aws_secret_access_key=aws_secret_access_key,
-            aws_session_token=aws_session_token,
-        )
+        # S3 client with the temporary credentials from NEMO TVM (cached until shortly before they expire)
+        s3 = get_s3_client(self.config)
 
 
         try:
@@ -0,0 +1,149 @@
+import gzip
+import io
+import logging
+import os
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from nemo_library_fox_reader.foxuploadsettings import (
+    SMALL_FILE_SIZE_IN_MB,
+    FOXUploadSettings,
+)
+
+__all__ = ["ParallelGzipWriter", "compress_file"]
+
+_BYTES_PER_MB = 1024 * 1024
+
+
+def _compress_block(block: bytes, compresslevel: int) -> bytes:
+    # zlib releases the GIL while compressing, so blocks really run in parallel
+    return gzip.compress(block, compresslevel=compresslevel, mtime=0)
+
+
+class ParallelGzipWriter(io.BufferedIOBase):
+    """
+    Writable binary stream that compresses its input in fixed-size blocks on a thread pool
+    (like pigz). Every block becomes an independent gzip member; the members are written
+    in order, which results in a valid gzip stream that any gzip reader decompresses as a whole.
+
+    The writer can be wrapped in io.TextIOWrapper so pandas can write the CSV directly into it.
+    """
+
+    def __init__(
+        self,
+        file: str | os.PathLike | io.IOBase,
+        upload_settings: FOXUploadSettings | None = None,
+    ):
+        super().__init__()
+        self._settings = upload_settings or FOXUploadSettings()
+        if isinstance(file, (str, os.PathLike)):
+            self._fileobj = open(file, "wb")
+            self._owns_fileobj = True
+        else:
+            self._fileobj = file
+            self._owns_fileobj = False
+
+        self._compresslevel = self._settings.compress_level
+        self._block_size = max(1, self._settings.compress_block_size)
+        self._max_pending = max(1, self._settings.get_max_pending_blocks())
+        self._executor = (
+            ThreadPoolExecutor(
+                max_workers=self._settings.compress_threads,
+                thread_name_prefix="fox-gzip",
+            )
+            if self._settings.compress_threads > 1
+            else None
+        )
+        self._buffer = bytearray()
+        self._pending: deque[Future] = deque()
+        self._members = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        if self.closed:
+            raise ValueError("write to closed file")
+        size = memoryview(data).nbytes
+        self._buffer += data
+        self.bytes_in += size
+
+        if self._compresslevel is None:
+            # the level depends on the total size (see FOXUploadSettings.get_compress_level),
+            # so keep everything in memory until the size threshold is reached
+            if self.bytes_in < SMALL_FILE_SIZE_IN_MB * _BYTES_PER_MB:
+                return size
+            self._compresslevel = self._settings.get_compress_level(
+                self.bytes_in / _BYTES_PER_MB
+            )
+
+        while len(self._buffer) >= self._block_size:
+            block = bytes(self._buffer[: self._block_size])
+            del self._buffer[: self._block_size]
+            self._submit(block)
+        return size
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        try:
+            if self._compresslevel is None:
+                self._compresslevel = self._settings.get_compress_level(
+                    self.bytes_in / _BYTES_PER_MB
+                )
+            # an empty input still has to produce a valid (empty) gzip stream
+            if self._buffer or self._members == 0:
+                self._submit(bytes(self._buffer))
+                self._buffer.clear()
+            self._drain(0)
+            self._fileobj.flush()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+            if self._owns_fileobj:
+                self._fileobj.close()
+            super().close()
+
+    def _submit(self, block: bytes) -> None:
+        self._members += 1
+        if self._executor is None:
+            self._write_member(_compress_block(block, self._compresslevel))
+            return
+        self._pending.append(
+            self._executor.submit(_compress_block, block, self._compresslevel)
+        )
+        # bound the memory: wait for the oldest block once enough blocks are in flight
+        self._drain(self._max_pending - 1)
+
+    def _drain(self, max_pending: int) -> None:
+        while len(self._pending) > max_pending:
+            self._write_member(self._pending.popleft().result())
+
+    def _write_member(self, member: bytes) -> None:
+        self._fileobj.write(member)
+        self.bytes_out += len(member)
+
+
+def compress_file(
+    filename: str,
+    gzipped_file: str | os.PathLike | io.IOBase,
+    upload_settings: FOXUploadSettings | None = None,
+) -> None:
+    """
+    Compresses a file into a gzip file or a writable binary stream using ParallelGzipWriter.
+    """
+    upload_settings = upload_settings or FOXUploadSettings()
+    with open(filename, "rb") as f_in, ParallelGzipWriter(
+        gzipped_file, upload_settings
+    ) as f_out:
+        while True:
+            block = f_in.read(upload_settings.compress_block_size)
+            if not block:
+                break
+            f_out.write(block)
+    logging.info(
+        f"File {filename} has been compressed "
+        f"({f_out.bytes_in} -> {f_out.bytes_out} bytes, {upload_settings.compress_threads} threads)"
+    )
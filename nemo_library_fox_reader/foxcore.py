@@ -1,5 +1,6 @@
 import pandas as pd
 import logging
+from typing import Callable
 
 from nemo_library.features.deprecated import createOrUpdateReport, createOrUpdateRule
 from nemo_library.features.metadata import (
@@ -104,6 +105,15 @@ from nemo_library.utils.utils import FilterType, FilterValue
 from nemo_library.version import __version__
 from nemo_library_fox_reader.foxprogressmanager import FOXProgressManager
 from nemo_library_fox_reader.foxreaderinfo import FOXReaderInfo
+from nemo_library_fox_reader.foxuploadsettings import FOXUploadSettings
+from nemo_library_fox_reader.foxhttp import FOXHttpSettings, configure_session
+from nemo_library_fox_reader.foxbatchimport import (
+    FOXBatchImportResult,
+    FOXBatchImportSettings,
+    ReUploadFiles,
+    collect_fox_files,
+    default_projectname,
+)
 
 from deprecated import deprecated
 
@@ -141,6 +151,7 @@ class FoxNemoLibrary:
         gedys_password: str = None,
         foxReaderInfo: FOXReaderInfo = None,
         foxreader_statistics_file : str | None = None,
+        http_settings: FOXHttpSettings | None = None,
     ):
         """
         Initializes the NemoLibrary instance with configuration settings.
@@ -159,8 +170,12 @@ class FoxNemoLibrary:
             migman_additional_fields (dict[str, list[str]], optional): Additional fields for mapping. Defaults to None.
             migman_multi_projects (dict[str, list[str]], optional): Multi-project configurations. Defaults to None.
             metadata (str, optional): Metadata configuration. Defaults to None.
+            http_settings (FOXHttpSettings, optional): Connection pool, timeouts and retries of the NEMO REST calls. Defaults to FOXHttpSettings().
         """
 
+        if http_settings is not None:
+            configure_session(http_settings)
+
         self.config = Config(
             config_file=config_file,
             environment=environment,
@@ -433,6 +448,7 @@ class FoxNemoLibrary:
         trigger_only: bool = False,
         import_configuration: ImportConfigurations = None,
         format_data: bool = True,
+        upload_settings: FOXUploadSettings | None = None,
     ) -> None:
         ReUploadDataFrame(
             self.config,
@@ -445,6 +461,7 @@ class FoxNemoLibrary:
             trigger_only=trigger_only,
             import_configuration=import_configuration,
             format_data=format_data,
+            upload_settings=upload_settings,
         )
 
     def ReUploadFile(
@@ -459,7 +476,10 @@ class FoxNemoLibrary:
         import_configuration: ImportConfigurations = None,
         format_data: bool = True,
         foxReaderInfo: FOXReaderInfo | None = None,
-        statistics_only: bool = False
+        statistics_only: bool = False,
+        upload_settings: FOXUploadSettings | None = None,
+        delta_import: bool = False,
+        force: bool = False,
     ) -> None:
         """
         Re-uploads a file to a specified project in the NEMO system and triggers data ingestion.
@@ -473,6 +493,9 @@ class FoxNemoLibrary:
             version (int, optional): The ingestion version (2 or 3). Defaults to 2.
             trigger_only (bool, optional): If True, skips waiting for task completion. Defaults to False.
             statistics_only (bool, optional): If True, statistics are collected and no ingestion is performed
+            upload_settings (FOXUploadSettings, optional): Compression and upload tuning. Defaults to FOXUploadSettings().
+            delta_import (bool, optional): FOX files only. Skips the upload if the data did not change since the last import into the project. Defaults to False.
+            force (bool, optional): Imports the file even if the identical file was imported into the project before. Defaults to False.
 
         Returns:
             None
@@ -489,23 +512,75 @@ class FoxNemoLibrary:
         """
 
         # logging.info(f"ReUploadFile(core.py) statistics_only={statistics_only}")
-        FOXProgressManager.start()
-        FOXProgressManager.info(f"Uploading file {filename} to project {projectname}")
+        # infos and warnings of this import are collected by the progress manager of its FOXReaderInfo
+        progress_manager = foxReaderInfo.progress_manager if foxReaderInfo else FOXProgressManager.current()
+        with progress_manager.activate():
+            FOXProgressManager.start()
+            FOXProgressManager.info(f"Uploading file {filename} to project {projectname}")
+
+
+            ReUploadFile(
+                self.config,
+                projectname=projectname,
+                filename=filename,
+                update_project_settings=update_project_settings,
+                datasource_ids=datasource_ids,
+                global_fields_mapping=global_fields_mapping,
+                version=version,
+                trigger_only=trigger_only,
+                import_configuration=import_configuration,
+                format_data=format_data,
+                foxReaderInfo=foxReaderInfo,
+                statistics_only = statistics_only,
+                upload_settings=upload_settings,
+                delta_import=delta_import,
+                force=force,
+            )
+
+    def ReUploadFiles(
+        self,
+        paths: list[str],
+        projectname_for_file: Callable[[str], str] = default_projectname,
+        batch_settings: FOXBatchImportSettings | None = None,
+        upload_settings: FOXUploadSettings | None = None,
+        update_project_settings: bool = True,
+        version: int = 2,
+        import_configuration: ImportConfigurations = None,
+        format_data: bool = True,
+        statistics_only: bool = False,
+        delta_import: bool = False,
+        force: bool = False,
+    ) -> list[FOXBatchImportResult]:
+        """
+        Imports several FOX files concurrently, each into its own project.
 
+        Args:
+            paths (list[str]): FOX files or directories (searched recursively for *.fox files).
+            projectname_for_file (Callable[[str], str], optional): Returns the project name for a file. Defaults to "FOX_<file stem>".
+            batch_settings (FOXBatchImportSettings, optional): Maximum parallel files, parses, uploads and sessions per project.
+            upload_settings (FOXUploadSettings, optional): Compression and upload tuning. Defaults to FOXUploadSettings().
+            update_project_settings (bool, optional): Whether to trigger the "analyze_table" task after ingestion (version 2 only). Defaults to True.
+            version (int, optional): The ingestion version (2 or 3). Defaults to 2.
+            statistics_only (bool, optional): If True, statistics are collected and no ingestion is performed
+            delta_import (bool, optional): Skips the upload of files whose data did not change since their last import. Defaults to False.
+            force (bool, optional): Imports files even if the identical file was imported before. Defaults to False.
 
-        ReUploadFile(
+        Returns:
+            list[FOXBatchImportResult]: One result per file (success, exception, duration).
+        """
+        return ReUploadFiles(
             self.config,
-            projectname=projectname,
-            filename=filename,
+            collect_fox_files(paths),
+            projectname_for_file=projectname_for_file,
+            batch_settings=batch_settings,
+            upload_settings=upload_settings,
             update_project_settings=update_project_settings,
-            datasource_ids=datasource_ids,
-            global_fields_mapping=global_fields_mapping,
             version=version,
-            trigger_only=trigger_only,
             import_configuration=import_configuration,
             format_data=format_data,
-            foxReaderInfo=foxReaderInfo,
-            statistics_only = statistics_only
+            statistics_only=statistics_only,
+            delta_import=delta_import,
+            force=force,
         )
 
     # @deprecated(reason="Please use 'createReports' API instead")
@@ -0,0 +1,165 @@
+import hashlib
+import json
+from dataclasses import dataclass, field, fields
+
+from nemo_library_fox_reader.foxattribute import FoxAttribute
+from nemo_library_fox_reader.foxutils import FOXAttributeType
+
+__all__ = ["FOXDeltaPlan", "create_delta_plan", "fingerprint_attributes"]
+
+# separates the values when they are hashed, so ["ab", "c"] and ["a", "bc"] differ
+_VALUE_SEPARATOR = "\x1f"
+
+# attribute types without values of their own, they are not uploaded as data columns (see FOXFile._create_dataframe)
+_ATTRIBUTE_TYPES_WITHOUT_DATA = (
+    FOXAttributeType.Header,
+    FOXAttributeType.Link,
+    FOXAttributeType.Expression,
+)
+
+# fields describing the values themselves or filled while the data is read
+_FIELDS_NOT_IN_DEFINITION = {"values", "max_string_length", "data_is_larger_than_max_integer"}
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+def _hash_values(values: list | None) -> str:
+    return _sha256(_VALUE_SEPARATOR.join(map(str, values or [])))
+
+
+def _hash_definition(attr: FoxAttribute) -> str:
+    definition = {
+        f.name: getattr(attr, f.name)
+        for f in fields(attr)
+        if f.name not in _FIELDS_NOT_IN_DEFINITION
+    }
+    return _sha256(json.dumps(definition, sort_keys=True, default=str))
+
+
+def fingerprint_attributes(
+    attributes: list[FoxAttribute], previous: dict | None = None
+) -> dict[str, dict]:
+    """
+    Returns a fingerprint per attribute (keyed by its NEMO name): a hash of its definition and,
+    for attributes with data, the number of rows and a hash of the values. If a previous
+    fingerprint with fewer rows exists, the hash of the first (previous) rows is added as well,
+    so appended rows can be told apart from changed rows.
+    """
+    previous_attributes = (previous or {}).get("attributes", {})
+    fingerprints = {}
+    for attr in attributes:
+        fingerprint = {"definition": _hash_definition(attr)}
+        if attr.attribute_type not in _ATTRIBUTE_TYPES_WITHOUT_DATA:
+            values = attr.values or []
+            fingerprint["rows"] = len(values)
+            fingerprint["values"] = _hash_values(values)
+            previous_rows = previous_attributes.get(attr.get_nemo_name(), {}).get("rows")
+            if previous_rows is not None and previous_rows < len(values):
+                fingerprint["prefix_values"] = _hash_values(values[:previous_rows])
+        fingerprints[attr.get_nemo_name()] = fingerprint
+    return fingerprints
+
+
+@dataclass
+class FOXDeltaPlan:
+    """
+    Differences between a FOX file and the state of its last import into the same project.
+    """
+
+    has_previous_import: bool = False
+    rows: int = 0
+    previous_rows: int = 0
+    added_columns: list[str] = field(default_factory=list)
+    removed_columns: list[str] = field(default_factory=list)
+    changed_columns: list[str] = field(default_factory=list)
+    redefined_attributes: list[str] = field(default_factory=list)
+    rows_appended: bool = False
+
+    @property
+    def data_changed(self) -> bool:
+        return (
+            not self.has_previous_import
+            or self.rows != self.previous_rows
+            or bool(self.added_columns or self.removed_columns or self.changed_columns)
+        )
+
+    @property
+    def metadata_changed(self) -> bool:
+        return (
+            not self.has_previous_import
+            or bool(self.added_columns or self.removed_columns or self.redefined_attributes)
+        )
+
+    @property
+    def unchanged(self) -> bool:
+        return not self.data_changed and not self.metadata_changed
+
+    def describe(self) -> str:
+        if not self.has_previous_import:
+            return "no previous import found"
+        if self.unchanged:
+            return "nothing changed since the last import"
+        parts = []
+        if self.rows_appended:
+            parts.append(f"{self.rows - self.previous_rows} rows appended")
+        elif self.rows != self.previous_rows:
+            parts.append(f"rows {self.previous_rows} -> {self.rows}")
+        for label, names in (
+            ("added columns", self.added_columns),
+            ("removed columns", self.removed_columns),
+            ("changed columns", self.changed_columns),
+            ("changed attribute definitions", self.redefined_attributes),
+        ):
+            if names:
+                parts.append(f"{label}: {', '.join(names)}")
+        return "; ".join(parts)
+
+
+def create_delta_plan(previous: dict | None, fingerprints: dict[str, dict]) -> FOXDeltaPlan:
+    """
+    Compares the attribute fingerprints of a FOX file with the fingerprints stored at the last import.
+    """
+    plan = FOXDeltaPlan(has_previous_import=bool(previous))
+    plan.rows = max((f.get("rows", 0) for f in fingerprints.values()), default=0)
+    if not previous:
+        return plan
+
+    previous_attributes = previous.get("attributes", {})
+    plan.previous_rows = previous.get("rows", 0)
+
+    data_columns = {name for name, f in fingerprints.items() if "values" in f}
+    previous_data_columns = {name for name, f in previous_attributes.items() if "values" in f}
+    plan.added_columns = sorted(data_columns - previous_data_columns)
+    plan.removed_columns = sorted(previous_data_columns - data_columns)
+
+    appended = plan.rows > plan.previous_rows
+    for name in sorted(data_columns & previous_data_columns):
+        current, last = fingerprints[name], previous_attributes[name]
+        if current["values"] == last["values"]:
+            continue
+        if current.get("prefix_values") == last["values"]:
+            # the old rows are unchanged, new rows were added at the end
+            continue
+        plan.changed_columns.append(name)
+        appended = False
+
+    plan.rows_appended = appended and not plan.added_columns and not plan.removed_columns
+
+    plan.redefined_attributes = sorted(
+        name
+        for name, f in fingerprints.items()
+        if name in previous_attributes and f["definition"] != previous_attributes[name]["definition"]
+    )
+    removed_attributes = set(previous_attributes) - set(fingerprints)
+    added_attributes = set(fingerprints) - set(previous_attributes)
+    plan.redefined_attributes += sorted((removed_attributes | added_attributes) - data_columns - previous_data_columns)
+
+    # the definition (data type, format, separators) decides how the values are written into the
+    # uploaded table (see FOXFile._create_dataframe), so a redefined column has to be uploaded again
+    redefined_columns = set(plan.redefined_attributes) & data_columns & previous_data_columns
+    if redefined_columns - set(plan.changed_columns):
+        plan.changed_columns = sorted(set(plan.changed_columns) | redefined_columns)
+        plan.rows_appended = False
+    return plan
@@ -48,6 +48,8 @@ class FOXFile:
         # self.attributes = None
         # self.data_frame = pd.DataFrame()
         self.foxReaderInfo = foxReaderInfo
+        self.attributes_converted_to_string: list[FoxAttribute] = []
+        self._schema_read: bool | None = None
 
 
     def read(self) -> pd.DataFrame | None:
@@ -58,7 +60,28 @@ class FOXFile:
         Raises:
             ValueError: If the file format is unsupported or does not use Unicode.
         """
+        if not self.read_schema():
+            return None
+        return self.create_dataframe()
 
+    def read_schema(self) -> bool:
+        """
+        Reads the global information and the attributes of the FOX file. After this step the
+        metadata (global_information, attributes) is complete and can be reconciled with NEMO,
+        while create_dataframe builds the data. The schema is read once; later calls return
+        the first result.
+        Returns:
+            bool: False if the file could not be opened or is password protected.
+        Raises:
+            ValueError: If the file format is unsupported or does not use Unicode.
+        """
+        if self._schema_read is not None:
+            return self._schema_read
+
+        self._schema_read = self._read_schema()
+        return self._schema_read
+
+    def _read_schema(self) -> bool:
         try:
             self.binary_reader = FoxBinaryReader(config=self.config, foxReaderInfo=self.foxReaderInfo)
 
@@ -69,7 +92,7 @@ class FOXFile:
 
         except Exception as e:
             logging.error("Error reading FOX file: %s", e)
-            return None
+            return False
 
         self.global_information = None
         self.attributes = None
@@ -88,11 +111,21 @@ class FOXFile:
             FOXProgressManager.warning("This FOX file is password protected.")
             if self.foxReaderInfo:
                 self.foxReaderInfo.add_issue(IssueType.PASSWORDPROTECTED)
-            return None
+            return False
 
         self.attributes = self._read_attributes(self.global_information)
         self.global_information = self._read_global_part_2(self.global_information)
+        return True
 
+    def create_dataframe(self) -> pd.DataFrame:
+        """
+        Creates the DataFrame from the attributes read by read_schema. Attributes whose values
+        cannot be converted to their data type are switched to "string" and collected in
+        attributes_converted_to_string.
+        Returns:
+            pd.DataFrame: DataFrame containing the FOX file data.
+        """
+        self.attributes_converted_to_string = []
         self.data_frame = self._create_dataframe(
             self.global_information, self.attributes
         )
@@ -206,6 +239,7 @@ class FOXFile:
                             f"Could not convert attribute '{attr.get_nemo_name()}' to type '{attr.nemo_data_type}'  format={attr.format}  nemo_pandas_conversion_format={attr.nemo_pandas_conversion_format}: {e}"
                         )
                         attr.nemo_data_type = "string"
+                        self.attributes_converted_to_string.append(attr)
                         # print("C rows =", len(df))
                         # print("C cols  =", df.shape[1])
                         # print("C shape =", df.shape)
@@ -1294,6 +1328,9 @@ class FOXFile:
         for idx, attr in enumerate(attributes):
             attr.attribute_id = idx
 
+        # the Nemo names depend on the new ids and are needed by every later step
+        FoxAttribute.precompute_nemo_names(attributes)
+
         return attributes
 
 
@@ -1,25 +1,38 @@
-import gzip
+import contextvars
+import hashlib
+import io
 import logging
 import json
 from logging import config
 import tempfile
 from pathlib import Path
 import re
-import shutil
 import os
 import tempfile
 import time
-import requests
-import boto3
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from typing import BinaryIO, Callable
 from botocore.exceptions import NoCredentialsError
+import numpy as np
 import pandas as pd
 import datetime
-from pandas.api.types import is_datetime64_any_dtype
+from pandas.api.types import is_datetime64_any_dtype, is_object_dtype
 
+from nemo_library_fox_reader.foxcompression import ParallelGzipWriter, compress_file
+from nemo_library_fox_reader.foxdelta import FOXDeltaPlan, create_delta_plan, fingerprint_attributes
 from nemo_library_fox_reader.foxfile import FOXFile
+from nemo_library_fox_reader.foxhttp import get_session
+from nemo_library_fox_reader.foxfingerprint import sha256_of_file
+from nemo_library_fox_reader.foximportstate import FOXImportStateStore
 from nemo_library_fox_reader.foxmeta import FOXMeta
+from nemo_library_fox_reader.foxmetadatasnapshot import FOXMetadataSnapshot
 from nemo_library_fox_reader.foxprogressmanager import FOXProgressManager
 from nemo_library_fox_reader.foxreaderinfo import FOXReaderInfo
+from nemo_library_fox_reader.foxs3 import delete_from_s3, upload_file_to_s3, upload_stream_to_s3
+from nemo_library_fox_reader.foxtaskpoller import wait_for_task
+from nemo_library_fox_reader.foxuploadsettings import FOXUploadSettings
 from nemo_library_fox_reader.foxnemo_persistence_api import (
     createColumns,
     deleteColumns,
@@ -40,6 +53,11 @@ from nemo_library.features.import_configuration import ImportConfigurations
 
 __all__ = ["ReUploadDataFrame", "ReUploadFile", "synchronizeCsvColsAndImportedColumns"]
 
+# sections of the import state (see FOXImportStateStore): the attribute fingerprints of a delta import
+# and the content hash of the last imported file
+DELTA_STATE_SECTION = "delta_import"
+CONTENT_STATE_SECTION = "content"
+
 
 def ReUploadDataFrame(
     config: Config,
@@ -53,7 +71,9 @@ def ReUploadDataFrame(
     import_configuration: ImportConfigurations = None,
     format_data: bool = True,
     foxReaderInfo: FOXReaderInfo = None,
-    statistics_only: bool = False
+    statistics_only: bool = False,
+    upload_settings: FOXUploadSettings | None = None,
+    before_ingestion: Callable[[], None] | None = None,
 ) -> None:
 
     if statistics_only:
@@ -63,6 +83,9 @@ def ReUploadDataFrame(
     if import_configuration is None:
         import_configuration = ImportConfigurations()
 
+    if upload_settings is None:
+        upload_settings = FOXUploadSettings()
+
 
     # print("A rows =", len(df))
     # print("A cols  =", df.shape[1])
@@ -79,90 +102,74 @@ def ReUploadDataFrame(
         logging.info(f"Project {projectname} not found - create it")
         createProjects(config=config, projects=[Project(displayName=projectname)])
 
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_file_path = os.path.join(temp_dir, "tempfile.csv")
-
-        # try:
-        #     delasap2 = df["bestelldatum_4_2f1fd773_6caf_455c_b31c_2ef2245f3fc1"]
-        #     for v in delasap2:
-        #         delasap3 = v
-        # except Exception:
-        #     pass
-
-        # Prefer explicit data types from foxReaderInfo when available (dictionary_internal_names_to_data_types)
-        types_dict = {}
-        if foxReaderInfo is not None:
-            types_dict = getattr(foxReaderInfo, "dictionary_internal_names_to_data_types", {}) or {}
-
-        # Format datetime/date columns per-column so dates without time are written as YYYY-MM-DD
-        # and datetimes keep the time part as YYYY-MM-DD HH:MM:SS.
-        for col in df.columns:
-            try:
-                series = df[col]
-
-                # If the reader provided an explicit type for this internal column use it
-                dtype_hint = types_dict.get(col)
-                if dtype_hint in ("date", "datetime"):
-                    series_dt = pd.to_datetime(series, errors="coerce")
-                    fmt = "%Y-%m-%d" if dtype_hint == "date" else "%Y-%m-%d %H:%M:%S"
-                    df[col] = series_dt.dt.strftime(fmt).where(series_dt.notna(), "")
-                    continue
-
-                # Fallback heuristic: only attempt to format if dtype is datetime64 or column contains date/datetime Python objects
-                if is_datetime64_any_dtype(series):
-                    series_dt = series
-                else:
-                    sample = series.dropna().head(50)
-                    if len(sample) == 0:
-                        continue
-                    if all(isinstance(v, (datetime.date, datetime.datetime)) for v in sample):
-                        series_dt = pd.to_datetime(series, errors="coerce")
-                    else:
-                        continue
-
-                # If any non-midnight time exists, keep time part; otherwise use date only
-                has_time = ((series_dt.dt.hour.fillna(0) != 0) | (series_dt.dt.minute.fillna(0) != 0) | (series_dt.dt.second.fillna(0) != 0) | (series_dt.dt.microsecond.fillna(0) != 0)).any()
-                fmt = "%Y-%m-%d %H:%M:%S" if has_time else "%Y-%m-%d"
-                df[col] = series_dt.dt.strftime(fmt).where(series_dt.notna(), "")
-            except Exception:
-                # Ignore columns that cannot be treated as dates/datetimes
-                continue
-
-        df.to_csv(
-            temp_file_path,
-            index=False,
-            sep=import_configuration.field_delimiter,
-            na_rep="",
-            escapechar=import_configuration.escape_character,
-            lineterminator=import_configuration.record_delimiter,
-            quotechar=import_configuration.optionally_enclosed_by,
+    # try:
+    #     delasap2 = df["bestelldatum_4_2f1fd773_6caf_455c_b31c_2ef2245f3fc1"]
+    #     for v in delasap2:
+    #         delasap3 = v
+    # except Exception:
+    #     pass
+
+    # Prefer explicit data types from foxReaderInfo when available (dictionary_internal_names_to_data_types)
+    types_dict = {}
+    if foxReaderInfo is not None:
+        types_dict = getattr(foxReaderInfo, "dictionary_internal_names_to_data_types", {}) or {}
+
+    # Format datetime/date columns per-column so dates without time are written as YYYY-MM-DD
+    # and datetimes keep the time part as YYYY-MM-DD HH:MM:SS.
+    for col in df.columns:
+        try:
+            formatted = _format_datetime_column(df[col], types_dict.get(col))
+            if formatted is not None:
+                df[col] = formatted
+        except Exception:
+            # Ignore columns that cannot be treated as dates/datetimes
+            continue
+
+    # the CSV is compressed while pandas writes it and uploaded while it is compressed,
+    # there is no uncompressed intermediate file
+    def write_csv(fileobj: BinaryIO) -> None:
+        with io.TextIOWrapper(
+            ParallelGzipWriter(fileobj, upload_settings),
             encoding="UTF-8",
-            doublequote=False,
-        )
-        FOXProgressManager.info(f"file {temp_file_path} written. Number of records: {len(df)}")
+            newline="",
+        ) as csv_file:
+            df.to_csv(
+                csv_file,
+                index=False,
+                sep=import_configuration.field_delimiter,
+                na_rep="",
+                escapechar=import_configuration.escape_character,
+                lineterminator=import_configuration.record_delimiter,
+                quotechar=import_configuration.optionally_enclosed_by,
+                doublequote=False,
+            )
 
-        ReUploadFile(
-            config=config,
-            projectname=projectname,
-            filename=temp_file_path,
-            update_project_settings=update_project_settings,
-            datasource_ids=datasource_ids,
-            global_fields_mapping=global_fields_mapping,
-            version=version,
-            trigger_only=trigger_only,
-            import_configuration=import_configuration,
-            format_data=False,  # already formatted, if parameter was given
-            foxReaderInfo=foxReaderInfo,
-            statistics_only=statistics_only
-        )
-        FOXProgressManager.info(f"upload to project {projectname} completed")
-        
-        logging.info("==================== Summary of file ingestion: ====================================")
-        for message in FOXProgressManager.allWarnings:
-            logging.warning(message)
-        for message in FOXProgressManager.allInfos:
-            logging.info(message)
-        FOXProgressManager.finish()
+    _upload_and_ingest(
+        config=config,
+        projectname=projectname,
+        source_name="tempfile.csv.gz",
+        upload_source=write_csv,
+        s3_basename="tempfile.csv.gz",
+        update_project_settings=update_project_settings,
+        datasource_ids=datasource_ids,
+        global_fields_mapping=global_fields_mapping,
+        version=version,
+        trigger_only=trigger_only,
+        import_configuration=import_configuration,
+        foxReaderInfo=foxReaderInfo,
+        upload_settings=upload_settings,
+        before_ingestion=before_ingestion,
+    )
+    FOXProgressManager.info(f"data written and uploaded. Number of records: {len(df)}")
+    FOXProgressManager.info(f"upload to project {projectname} completed")
+
+    logging.info("==================== Summary of file ingestion: ====================================")
+    progress_manager = FOXProgressManager.current()
+    for message in progress_manager.allWarnings:
+        logging.warning(message)
+    for message in progress_manager.allInfos:
+        logging.info(message)
+    FOXProgressManager.finish()
 
 
 
@@ -178,7 +185,10 @@ def ReUploadFile(
     import_configuration: ImportConfigurations = None,
     format_data: bool = True,
     foxReaderInfo: FOXReaderInfo | None = None,
-    statistics_only: bool = False
+    statistics_only: bool = False,
+    upload_settings: FOXUploadSettings | None = None,
+    delta_import: bool = False,
+    force: bool = False,
 ) -> None:
     """
     Re-uploads a file to a specified project in the NEMO system and triggers data ingestion.
@@ -193,6 +203,9 @@ def ReUploadFile(
         version (int, optional): The ingestion version (2 or 3). Defaults to 2.
         trigger_only (bool, optional): If True, skips waiting for task completion. Defaults to False.
         statistics_only (bool, optional): If True, statistics are collected and no ingestion is performed
+        upload_settings (FOXUploadSettings, optional): Compression and upload tuning. Defaults to FOXUploadSettings().
+        delta_import (bool, optional): FOX files only. Compares the file with the fingerprints stored at the last import into the project and skips the upload if the data did not change. Defaults to False.
+        force (bool, optional): Imports the file even if the identical file was imported into the project before. Defaults to False.
 
     Returns:
         None
@@ -201,11 +214,13 @@ def ReUploadFile(
         Exception: If any step of the file upload, data ingestion, or subsequent tasks fails.
 
     Notes:
-        - Compresses the file into gzip format before uploading.
+        - Compresses the file into gzip format before uploading (files ending with .csv.gz are uploaded as they are).
         - Retrieves temporary AWS S3 credentials from NEMO's Token Vendor and uploads the file to S3.
         - Sends a request to ingest the uploaded data and optionally waits for task completion.
         - Triggers "analyze_table" task if version 2 and `update_project_settings` is True.
         - Logs and raises exceptions for any errors encountered during the process.
+        - A local file with the same content (sha256) and the same import options as the last
+          successful import into the project is not imported again unless force is True.
     """
 
   
@@ -213,10 +228,80 @@ def ReUploadFile(
     if import_configuration is None:
         import_configuration = ImportConfigurations()
 
+    if upload_settings is None:
+        upload_settings = FOXUploadSettings()
+
+    content_state = None
+    if not statistics_only and not filename.lower().startswith("s3://"):
+        content_state = _get_content_state(
+            filename,
+            version,
+            format_data,
+            import_configuration,
+            update_project_settings=update_project_settings,
+            datasource_ids=datasource_ids,
+            global_fields_mapping=global_fields_mapping,
+        )
+        if not force and _is_imported_content(config, projectname, content_state, upload_settings):
+            FOXProgressManager.info(
+                f"File {filename} is identical to the last import into project {projectname}. Nothing to do (use force to import it again)"
+            )
+            return
+
+    # the metadata of the project is read once and shared by the steps of the import
+    snapshot = FOXMetadataSnapshot(config, projectname) if upload_settings.metadata_snapshot else None
+    with snapshot.activate() if snapshot is not None else nullcontext():
+        imported = _reupload_file(
+            config=config,
+            projectname=projectname,
+            filename=filename,
+            update_project_settings=update_project_settings,
+            datasource_ids=datasource_ids,
+            global_fields_mapping=global_fields_mapping,
+            version=version,
+            trigger_only=trigger_only,
+            import_configuration=import_configuration,
+            format_data=format_data,
+            foxReaderInfo=foxReaderInfo,
+            statistics_only=statistics_only,
+            upload_settings=upload_settings,
+            delta_import=delta_import,
+        )
+
+    # the content is recorded only if it reached NEMO. With trigger_only the ingestion may still fail
+    if content_state is not None and imported and not trigger_only:
+        content_state["project_id"] = getProjectID(config, projectname)
+        FOXImportStateStore(upload_settings.import_state_directory).set_section(
+            config, projectname, CONTENT_STATE_SECTION, content_state
+        )
+
+
+def _reupload_file(
+    config: Config,
+    projectname: str,
+    filename: str,
+    update_project_settings: bool,
+    datasource_ids: list[dict] | None,
+    global_fields_mapping: list[dict] | None,
+    version: int,
+    trigger_only: bool,
+    import_configuration: ImportConfigurations,
+    format_data: bool,
+    foxReaderInfo: FOXReaderInfo | None,
+    statistics_only: bool,
+    upload_settings: FOXUploadSettings,
+    delta_import: bool,
+) -> bool:
+    """
+    Imports the file, see ReUploadFile. Returns True if the content of the file is in the project
+    afterwards (ingested, or found unchanged by a delta import), False if the import stopped early,
+    e.g. because the FOX file could not be read.
+    """
     # HANA supports csv-files only. If the file has a different suffix, we need to convert this into csv first
 
     ext = Path(filename).suffix.lower()  # Holt die Endung und macht sie klein
-    if ext != ".csv":
+    is_compressed_csv = filename.lower().endswith(".csv.gz")
+    if ext != ".csv" and not is_compressed_csv:
         if ext in [".xls", ".xlsx"]:
             df = pd.read_excel(filename)
         elif ext == ".json":
@@ -227,20 +312,83 @@ def ReUploadFile(
             df = pd.read_hdf(filename)
         elif ext in [".fox"]:
             foxfile = FOXFile(filename, config=config, foxReaderInfo=foxReaderInfo)
+            delta_state = None
             try:
                 
                 foxreader_statistics_file = config.get_foxreader_statistics_file()
                 # if foxreader_statistics_file:
                 #     statistics_only = True
                     # pass
-                
-                df = foxfile.read()
+
+                if delta_import and not statistics_only:
+                    delta = _plan_delta_import(config, projectname, foxfile, upload_settings)
+                    if delta is None:
+                        return False
+                    plan, delta_state = delta
+                    if plan.unchanged:
+                        FOXProgressManager.info(f"File {filename} did not change since the last import into project {projectname}. Import skipped")
+                        return True
+                    if not plan.data_changed:
+                        FOXProgressManager.info(f"Data of file {filename} did not change. Updating the metadata of project {projectname} only")
+                        # the dataframe is not built on this path, so the attributes whose values could not be
+                        # converted at the last import are switched to "string" here, as FOXFile.create_dataframe does
+                        converted_names = set(delta_state["converted_attributes"])
+                        for attr in foxfile.attributes:
+                            if attr.get_nemo_name() in converted_names:
+                                attr.nemo_data_type = "string"
+                        meta = FOXMeta(
+                            foxfile,
+                            foxReaderInfo=foxReaderInfo,
+                            max_parallel_requests=upload_settings.metadata_max_parallel_requests,
+                            use_async_client=upload_settings.async_metadata_client,
+                        )
+                        meta.reconcile_metadata(config=config, projectname=projectname)
+                        _update_project_after_ingestion(config, projectname, foxReaderInfo)
+                        _save_delta_state(config, projectname, delta_state, upload_settings)
+                        return True
+                    if plan.rows_appended:
+                        # the ingestion replaces the whole table, there is no way to append rows
+                        logging.info("Rows were appended only, but the ingestion needs the complete table")
+
+                if upload_settings.pipelined_fox_import and not statistics_only:
+                    imported = _pipelined_fox_import(
+                        config=config,
+                        projectname=projectname,
+                        foxfile=foxfile,
+                        update_project_settings=update_project_settings,
+                        datasource_ids=datasource_ids,
+                        global_fields_mapping=global_fields_mapping,
+                        version=version,
+                        trigger_only=trigger_only,
+                        import_configuration=import_configuration,
+                        format_data=format_data,
+                        foxReaderInfo=foxReaderInfo,
+                        upload_settings=upload_settings,
+                    )
+                    if imported and delta_state is not None:
+                        delta_state["converted_attributes"] = [
+                            attr.get_nemo_name() for attr in foxfile.attributes_converted_to_string
+                        ]
+                        _save_delta_state(config, projectname, delta_state, upload_settings)
+                    return imported
+
+                with upload_settings.parse_slot():
+                    df = foxfile.read()
 
                 if df is not None:
-                    meta = FOXMeta(foxfile, foxReaderInfo=foxReaderInfo)
+                    if delta_state is not None:
+                        delta_state["converted_attributes"] = [
+                            attr.get_nemo_name() for attr in foxfile.attributes_converted_to_string
+                        ]
+                    meta = FOXMeta(
+                        foxfile,
+                        foxReaderInfo=foxReaderInfo,
+                        max_parallel_requests=upload_settings.metadata_max_parallel_requests,
+                        use_async_client=upload_settings.async_metadata_client,
+                    )
                     meta.reconcile_metadata(config=config, projectname=projectname, statistics_only=statistics_only)
                 else:
-                    return
+                    return False
                     
             finally:
                 foxfile.close()
@@ -260,9 +408,12 @@ def ReUploadFile(
             import_configuration=import_configuration,
             format_data=format_data,
             foxReaderInfo=foxReaderInfo,
-            statistics_only=statistics_only
+            statistics_only=statistics_only,
+            upload_settings=upload_settings,
         )
-        return  # stop procesisng here
+        if ext == ".fox" and delta_state is not None:
+            _save_delta_state(config, projectname, delta_state, upload_settings)
+        return not statistics_only  # stop procesisng here
 
     # format data? we need to import first and then use the upload dataframe api
     if format_data:
@@ -282,29 +433,148 @@ def ReUploadFile(
             import_configuration=import_configuration,
             format_data=format_data,
             foxReaderInfo=foxReaderInfo,
-            statistics_only=statistics_only
+            statistics_only=statistics_only,
+            upload_settings=upload_settings,
         )
-        return  # stop procesisng here
+        return not statistics_only  # stop procesisng here
 
     # if parameter statistics_only is True, then no ingestion takes place
     if statistics_only:
         logging.info("statistics_only is True => no ingestion takes place")
-        return
+        return False
     
-    project_id = None
-    headers = None
-    project_id = None
-    gzipped_filename = None
-    compress_level = 3
-    try:
-        filesize = _get_file_size(filename)
+    filesize = _get_file_size(filename)
+    logging.info(f"Size of the file: {filesize} MB")
+
+    # .csv.gz files are uploaded as they are, plain csv files are compressed while they are uploaded
+    if is_compressed_csv:
+        upload_source = filename
+        s3_basename = os.path.basename(filename)
+    else:
+        logging.info(f"Compress Level: {upload_settings.get_compress_level(filesize)}")
+
+        def upload_source(fileobj: BinaryIO) -> None:
+            compress_file(filename, fileobj, upload_settings)
+
+        s3_basename = os.path.basename(filename) + ".gz"
+
+    _upload_and_ingest(
+        config=config,
+        projectname=projectname,
+        source_name=filename,
+        upload_source=upload_source,
+        s3_basename=s3_basename,
+        update_project_settings=update_project_settings,
+        datasource_ids=datasource_ids,
+        global_fields_mapping=global_fields_mapping,
+        version=version,
+        trigger_only=trigger_only,
+        import_configuration=import_configuration,
+        foxReaderInfo=foxReaderInfo,
+        upload_settings=upload_settings,
+    )
+    return True
+
+
+def _pipelined_fox_import(
+    config: Config,
+    projectname: str,
+    foxfile: FOXFile,
+    update_project_settings: bool,
+    datasource_ids: list[dict] | None,
+    global_fields_mapping: list[dict] | None,
+    version: int,
+    trigger_only: bool,
+    import_configuration: ImportConfigurations,
+    format_data: bool,
+    foxReaderInfo: FOXReaderInfo | None,
+    upload_settings: FOXUploadSettings,
+) -> bool:
+    """
+    Imports a FOX file with overlapping stages. As soon as the schema is read, the metadata is
+    reconciled with NEMO on a worker thread, while the calling thread builds the DataFrame and
+    writes, compresses and uploads the CSV. The ingestion starts when both stages are done.
+    Returns False if the schema could not be read.
+    """
+    with upload_settings.parse_slot():
+        if not foxfile.read_schema():
+            return False
+
+    meta = FOXMeta(
+        foxfile,
+        foxReaderInfo=foxReaderInfo,
+        max_parallel_requests=upload_settings.metadata_max_parallel_requests,
+        use_async_client=upload_settings.async_metadata_client,
+    )
+    meta.prepare_metadata()
+
+    # both stages need the project, so it is created before they start
+    meta.ensure_project(config=config, projectname=projectname)
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="fox-metadata") as executor:
+        # the worker reports to the same progress manager as this import
+        metadata_future = executor.submit(
+            contextvars.copy_context().run, meta.apply_metadata, config, projectname
+        )
+
+        with upload_settings.parse_slot():
+            df = foxfile.create_dataframe()
+        foxfile.close()
 
-        logging.info(f"Size of the file: {filesize} MB")
+        # attributes whose values could not be converted are uploaded as strings. The metadata
+        # was prepared before the conversion, so their columns are updated once the worker is done
+        converted_attributes = list(foxfile.attributes_converted_to_string)
+        if foxReaderInfo is not None:
+            for attr in converted_attributes:
+                foxReaderInfo.dictionary_internal_names_to_data_types[attr.get_nemo_name()] = "string"
 
-        if filesize < 5:
-            compress_level = 0
-            logging.info(f"Compress Level: {compress_level}")
+        def finish_metadata() -> None:
+            metadata_future.result()
+            meta.apply_converted_attributes(config, projectname, converted_attributes)
 
+        ReUploadDataFrame(
+            config=config,
+            projectname=projectname,
+            df=df,
+            update_project_settings=update_project_settings,
+            datasource_ids=datasource_ids,
+            global_fields_mapping=global_fields_mapping,
+            version=version,
+            trigger_only=trigger_only,
+            import_configuration=import_configuration,
+            format_data=format_data,
+            foxReaderInfo=foxReaderInfo,
+            upload_settings=upload_settings,
+            before_ingestion=finish_metadata,
+        )
+    return True
+
+
+def _upload_and_ingest(
+    config: Config,
+    projectname: str,
+    source_name: str,
+    upload_source: str | Callable[[BinaryIO], None],
+    s3_basename: str,
+    update_project_settings: bool,
+    datasource_ids: list[dict] | None,
+    global_fields_mapping: list[dict] | None,
+    version: int,
+    trigger_only: bool,
+    import_configuration: ImportConfigurations,
+    foxReaderInfo: FOXReaderInfo | None,
+    upload_settings: FOXUploadSettings,
+    before_ingestion: Callable[[], None] | None = None,
+) -> None:
+    """
+    Uploads gzip compressed csv data to S3, triggers the ingestion into the project and runs
+    the follow-up tasks. upload_source is either the name of a .csv.gz file or a function writing
+    the compressed data into a binary stream (see _upload_data). before_ingestion is called
+    between upload and ingestion, e.g. to wait for the metadata of a pipelined FOX import.
+    """
+    project_id = None
+    headers = None
+    try:
         project_id = getProjectID(config, projectname)
         if not project_id:
             logging.info(f"Project {projectname} not found - create it")
@@ -314,179 +584,96 @@ def ReUploadFile(
         headers = config.connection_get_headers()
 
         logging.info(
-            f"Upload of file '{filename}' into project '{projectname}' initiated..."
+            f"Upload of file '{source_name}' into project '{projectname}' initiated..."
         )
 
-        # Zip the file before uploading
-        gzipped_filename = filename + ".gz"
-        with open(filename, "rb") as f_in:
-            with gzip.open(
-                gzipped_filename, "wb", compresslevel=compress_level
-            ) as f_out:
-                shutil.copyfileobj(f_in, f_out)
-        logging.info(f"File {filename} has been compressed to {gzipped_filename}")
-        time.sleep(1)
-
-        # Retrieve temporary credentials from NEMO TVM
-        response = requests.get(
-            config.get_config_nemo_url()
-            + "/api/nemo-tokenvendor/InternalTokenVendor/sts/s3_policy",
-            headers=headers,
-        )
+        # unique key, so concurrent imports of the same tenant do not overwrite each other's data
+        s3filename = config.get_tenant() + f"/ingestv{version}/{uuid.uuid4().hex}_{s3_basename}"
+        # the data is removed again once the ingestion has ended (or was not accepted). An ingestion that
+        # is not waited for (trigger_only) or whose end is unknown may still read it, so its data stays
+        uploaded = False
+        ingestion_pending = False
+        try:
+            try:
+                with upload_settings.upload_slot():
+                    _upload_data(config, upload_source, s3filename, upload_settings)
+                uploaded = True
+                logging.info(f"File {source_name} uploaded successfully to s3 ({s3filename})")
+            except FileNotFoundError:
+                log_error(f"The file {source_name} was not found.", FileNotFoundError)
+            except NoCredentialsError:
+                log_error(f"The file {source_name} was not found.", NoCredentialsError)
 
-        if response.status_code != 200:
-            raise Exception(
-                f"Request failed. Status: {response.status_code}, error: {response.text}"
-            )
+            if before_ingestion is not None:
+                before_ingestion()
 
-        aws_credentials = json.loads(response.text)
+            # Prepare data for ingestion
 
-        aws_access_key_id = aws_credentials["accessKeyId"]
-        aws_secret_access_key = aws_credentials["secretAccessKey"]
-        aws_session_token = aws_credentials["sessionToken"]
+            data = {
+                "project_id": project_id,
+                "s3_filepath": f"s3://{upload_settings.s3_bucket}/{s3filename}",
+                "configuration": import_configuration.to_dict(),
+            }
 
-        # Create an S3 client
-        s3 = boto3.client(
-            "s3",
-            aws_access_key_id=aws_access_key_id,
-            aws_secret_access_key=aws_secret_access_key,
-            aws_session_token=aws_session_token,
-        )
+            if version == 3:
+                if datasource_ids is not None:
+                    data["data_source_identifiers"] = datasource_ids
+                if global_fields_mapping is not None:
+                    data["global_fields_mappings"] = global_fields_mapping
 
-        try:
-            # Upload the file
-            s3filename = (
-                config.get_tenant()
-                + f"/ingestv{version}/"
-                + os.path.basename(gzipped_filename)
-            )
-            s3.upload_file(
-                gzipped_filename,
-                "nemoinfrastructurestack-nemouploadbucketa98fe899-1s2ocvunlg3vs",
-                s3filename,
+            endpoint_url = (
+                "/api/nemo-queue/ingest_data_kubernetes_v3"
+                if version == 3
+                else "/api/nemo-queue/ingest_data_kubernetes_v2"
             )
-            logging.info(f"File {filename} uploaded successfully to s3 ({s3filename})")
-        except FileNotFoundError:
-            log_error(f"The file {filename} was not found.", FileNotFoundError)
-        except NoCredentialsError:
-            log_error(f"The file {filename} was not found.", NoCredentialsError)
-
-        # Prepare data for ingestion
-
-        data = {
-            "project_id": project_id,
-            "s3_filepath": f"s3://nemoinfrastructurestack-nemouploadbucketa98fe899-1s2ocvunlg3vs/{s3filename}",
-            "configuration": import_configuration.to_dict(),
-        }
-
-        if version == 3:
-            if datasource_ids is not None:
-                data["data_source_identifiers"] = datasource_ids
-            if global_fields_mapping is not None:
-                data["global_fields_mappings"] = global_fields_mapping
-
-        endpoint_url = (
-            "/api/nemo-queue/ingest_data_kubernetes_v3"
-            if version == 3
-            else "/api/nemo-queue/ingest_data_kubernetes_v2"
-        )
 
-        response = requests.post(
-            config.get_config_nemo_url() + endpoint_url,
-            headers=headers,
-            json=data,
-        )
-        if response.status_code != 200:
-            raise Exception(
-                f"Request failed. Status: {response.status_code}, error: {response.text}"
+            response = get_session().post(
+                config.get_config_nemo_url() + endpoint_url,
+                headers=headers,
+                json=data,
             )
+            if response.status_code != 200:
+                raise Exception(
+                    f"Request failed. Status: {response.status_code}, error: {response.text}"
+                )
+            ingestion_pending = True
         
-        # if foxReaderInfo is not None:
-        #     for info in foxReaderInfo.statistics_infos:
-        #         if info.issue == "FUNCTIONCALL":
-        #             logging.info(f"FUNCTIONCALL '{info.extra_info}' in attribute {info.attribute}  ")
+            # if foxReaderInfo is not None:
+            #     for info in foxReaderInfo.statistics_infos:
+            #         if info.issue == "FUNCTIONCALL":
+            #             logging.info(f"FUNCTIONCALL '{info.extra_info}' in attribute {info.attribute}  ")
                     
-        logging.info("Ingestion successful")
-
-        # Wait for task to be completed if not trigger_only
-        if version == 2 or not trigger_only:
-            taskid = response.text.replace('"', "")
-            while True:
-                data = {
-                    "sort_by": "submit_at",
-                    "is_sort_ascending": "False",
-                    "page": 1,
-                    "page_size": 20,
-                }
-                response = requests.get(
-                    config.get_config_nemo_url() + "/api/nemo-queue/task_runs",
-                    headers=headers,
-                    json=data,
-                )
-                if response.status_code != 200:
-                    raise Exception(
-                        f"Request failed. Status: {response.status_code}, error: {response.text}"
-                    )
-                resultjs = json.loads(response.text)
-                df = pd.json_normalize(resultjs["records"])
-
-
-
-                # # Debugging: log DataFrame metadata and a small sample so we can
-                # # inspect what the task_runs endpoint returned for troubleshooting.
-                # try:
-                #     logging.debug(f"task_runs DataFrame shape: {df.shape}")
-                #     logging.debug(f"task_runs DataFrame columns: {list(df.columns)}")
-                #     # log dtypes for each column
-                #     logging.debug("task_runs DataFrame dtypes:\n" + df.dtypes.to_string())
-                #     # log the first few rows (avoid logging too many rows)
-                #     logging.debug("task_runs DataFrame head:\n" + df.head(10).to_string())
-
-                #     # If possible, write the raw records JSON to a temporary file for later inspection
-                #     try:
-                #         tmpf = tempfile.NamedTemporaryFile(prefix="nemo_task_runs_", suffix=".json", delete=False)
-                #         with open(tmpf.name, "w", encoding="utf-8") as jf:
-                #             json.dump(resultjs.get("records", resultjs), jf, ensure_ascii=False, indent=2)
-                #         logging.info(f"Wrote raw task_runs JSON to {tmpf.name} for inspection")
-                #     except Exception as e:
-                #         logging.debug(f"Could not write raw task_runs JSON to temp file: {e}")
-                # except Exception as e:
-                #     logging.debug(f"Exception while debugging task_runs DataFrame: {e}")
-
-
-
-                df_filtered = df[df["id"] == taskid]
-                if len(df_filtered) != 1:
-                    raise Exception(
-                        f"Data ingestion request failed, task ID not found in tasks list"
-                    )
-                status = df_filtered["status"].iloc[0]
+            logging.info("Ingestion successful")
+
+            # Wait for task to be completed if not trigger_only
+            if version == 2 or not trigger_only:
+                taskid = response.text.replace('"', "")
+                task = wait_for_task(config, taskid, upload_settings)
+                ingestion_pending = False
+                status = task.get("status")
                 logging.info(f"Status of ingestion: {status}")
                 if status == "failed":
                     FOXProgressManager.warning("Data ingestion request failed, status: FAILED")
                     log_error("Data ingestion request failed, status: FAILED")
-                if status == "finished":
-                    if version == 2:
-                        records = str(int(df_filtered["records"].iloc[0]))
+                if version == 2:
+                    records = str(int(task["records"]))
 
-                        setNumberOfRecords(config, projectname, records)
-                        FOXProgressManager.info(f"Ingestion {project_id} finished. {records} records loaded")
-                    else:
-                        logging.info(f"Ingestion {project_id} finished.")
-                    break
-                time.sleep(1 if version == 2 else 5)
+                    setNumberOfRecords(config, projectname, records)
+                    FOXProgressManager.info(f"Ingestion {project_id} finished. {records} records loaded")
+                else:
+                    logging.info(f"Ingestion {project_id} finished.")
+        finally:
+            if uploaded and not ingestion_pending:
+                delete_from_s3(config, s3filename, upload_settings)
 
-        delete_duplicate_columns_generated_by_nemo(config, projectname)
-        update_defined_columns(config, projectname)
-        couple_attributes(config, projectname, foxReaderInfo)
-        delete_permanently_hidden_columns(config, projectname, foxReaderInfo)
+        _update_project_after_ingestion(config, projectname, foxReaderInfo)
         
         # Trigger Analyze Table Task for version 2 if required
         if version == 2 and update_project_settings:
             data = {
                 "project_id": project_id,
             }
-            response = requests.post(
+            response = get_session().post(
                 config.get_config_nemo_url()
                 + "/api/nemo-queue/analyze_table_kubernetes",
                 headers=headers,
@@ -500,59 +687,155 @@ def ReUploadFile(
 
             # Wait for task to be completed
             taskid = response.text.replace('"', "")
-            while True:
-                data = {
-                    "sort_by": "submit_at",
-                    "is_sort_ascending": "False",
-                    "page": 1,
-                    "page_size": 20,
-                }
-                response = requests.get(
-                    config.get_config_nemo_url() + "/api/nemo-queue/task_runs",
-                    headers=headers,
-                    json=data,
-                )
-                if response.status_code != 200:
-                    raise Exception(
-                        f"Request failed. Status: {response.status_code}, error: {response.text}"
-                    )
-                resultjs = json.loads(response.text)
-                df = pd.json_normalize(resultjs["records"])
-                df_filtered = df[df["id"] == taskid]
-                if len(df_filtered) != 1:
-                    raise Exception(
-                        f"Analyze_table request failed, task ID not found in tasks list"
-                    )
-                status = df_filtered["status"].iloc[0]
-                logging.info(f"Status: {status}")
-                if status == "failed":
-                    log_error("Analyze_table request failed, status: FAILED")
-                if status == "finished":
-                    logging.info("Analyze_table finished.")
-                    break
-                time.sleep(1)
+            task = wait_for_task(config, taskid, upload_settings)
+            status = task.get("status")
+            logging.info(f"Status: {status}")
+            if status == "failed":
+                log_error("Analyze_table request failed, status: FAILED")
+            logging.info("Analyze_table finished.")
 
     except Exception as e:
         if project_id is None:
             log_error("Upload stopped, no project_id available")
         raise log_error(f"Upload aborted: {e}")
 
-    finally:
-        if gzipped_filename:
-            os.remove(gzipped_filename)
+
+def _update_project_after_ingestion(config: Config, projectname: str, foxReaderInfo: FOXReaderInfo | None) -> None:
+    """
+    Cleans up and completes the columns of the project once the data (or the metadata) is in place.
+    The steps share one read of the columns (see FOXMetadataSnapshot).
+    """
+    snapshot = FOXMetadataSnapshot.current(config, projectname)
+    if snapshot is None:
+        snapshot = FOXMetadataSnapshot(config, projectname)
+    else:
+        # the ingestion adds columns of its own
+        snapshot.invalidate("Columns")
+
+    with snapshot.activate():
+        delete_duplicate_columns_generated_by_nemo(config, projectname)
+        update_defined_columns(config, projectname)
+        couple_attributes(config, projectname, foxReaderInfo)
+        delete_permanently_hidden_columns(config, projectname, foxReaderInfo)
+
+
+def _get_content_state(
+    filename: str,
+    version: int,
+    format_data: bool,
+    import_configuration: ImportConfigurations,
+    update_project_settings: bool = True,
+    datasource_ids: list[dict] | None = None,
+    global_fields_mapping: list[dict] | None = None,
+) -> dict:
+    """
+    Describes what an import of the file sends to NEMO: the content hash of the file and
+    a hash of the options that change how the content is ingested or how the project is
+    updated afterwards.
+    """
+    options = json.dumps(
+        {
+            "version": version,
+            "format_data": format_data,
+            "import_configuration": import_configuration.to_dict(),
+            "update_project_settings": update_project_settings,
+            "datasource_ids": datasource_ids,
+            "global_fields_mapping": global_fields_mapping,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return {
+        "sha256": sha256_of_file(filename),
+        "size": os.path.getsize(filename),
+        "options": hashlib.sha256(options.encode("utf-8")).hexdigest(),
+    }
+
+
+def _is_imported_content(
+    config: Config,
+    projectname: str,
+    content_state: dict,
+    upload_settings: FOXUploadSettings,
+) -> bool:
+    previous = FOXImportStateStore(upload_settings.import_state_directory).get_section(
+        config, projectname, CONTENT_STATE_SECTION
+    )
+    if not previous:
+        return False
+    if any(previous.get(key) != content_state[key] for key in ("sha256", "size", "options")):
+        return False
+    # the project may have been deleted or re-created in the meantime
+    return previous.get("project_id") == getProjectID(config, projectname)
+
+
+def _plan_delta_import(
+    config: Config,
+    projectname: str,
+    foxfile: FOXFile,
+    upload_settings: FOXUploadSettings,
+) -> tuple[FOXDeltaPlan, dict] | None:
+    """
+    Reads the schema of the FOX file and compares its attribute fingerprints with the state
+    stored at the last import into the project. Returns the plan and the state to store once
+    the import succeeded, or None if the file cannot be read.
+    """
+    with upload_settings.parse_slot():
+        if not foxfile.read_schema():
+            return None
+
+    store = FOXImportStateStore(upload_settings.import_state_directory)
+    previous = store.get_section(config, projectname, DELTA_STATE_SECTION)
+    if previous and previous.get("project_id") != getProjectID(config, projectname):
+        # the project was deleted or re-created since, the stored state does not describe it
+        previous = None
+
+    fingerprints = fingerprint_attributes(foxfile.attributes, previous)
+    plan = create_delta_plan(previous, fingerprints)
+    FOXProgressManager.info(f"Delta import into project {projectname}: {plan.describe()}")
+
+    for fingerprint in fingerprints.values():
+        fingerprint.pop("prefix_values", None)
+    # attributes converted to "string" at the last import. The list is kept as long as only the
+    # metadata is updated and replaced by the conversions of the next full import
+    converted_attributes = [
+        name for name in (previous or {}).get("converted_attributes", []) if name in fingerprints
+    ]
+    return plan, {"rows": plan.rows, "attributes": fingerprints, "converted_attributes": converted_attributes}
+
+
+def _save_delta_state(
+    config: Config,
+    projectname: str,
+    delta_state: dict,
+    upload_settings: FOXUploadSettings,
+) -> None:
+    delta_state["project_id"] = getProjectID(config, projectname)
+    FOXImportStateStore(upload_settings.import_state_directory).set_section(
+        config, projectname, DELTA_STATE_SECTION, delta_state
+    )
+
+
+def _group_columns_by_import_name(cols: list[Column]) -> dict[str, list[Column]]:
+    cols_by_import_name: dict[str, list[Column]] = {}
+    for col in cols:
+        cols_by_import_name.setdefault(col.importName, []).append(col)
+    return cols_by_import_name
 
 
 def delete_duplicate_columns_generated_by_nemo(config: Config, projectname: str) -> None: 
     try:
         cols = getColumns(config, projectname)
+        cols_by_import_name = _group_columns_by_import_name(cols)
         columns_to_delete = []
         for col in cols:
             if col.columnType == "ExportedColumn":
-                col_duplicate = next((c for c in cols if c.importName == col.importName and c.id != col.id), None)
+                col_duplicate = next((c for c in cols_by_import_name[col.importName] if c.id != col.id), None)
                 if col_duplicate is not None:
                     logging.info(f"Duplicate defined column found ' id={col.id} id={col_duplicate.id}  {col_duplicate.internalName}'   {col.internalName} ")
                     columns_to_delete.append(col.id)
 
+        # one call, the persistence layer sends the deletions in parallel or in bulk requests
         deleteColumns(config, columns_to_delete)
 
         if len(columns_to_delete) > 0:
@@ -566,16 +849,17 @@ def delete_duplicate_columns_generated_by_nemo(config: Config, projectname: str)
 def delete_permanently_hidden_columns(config: Config, projectname: str, foxReaderInfo: FOXReaderInfo | None = None) -> None:
     try:
         if foxReaderInfo is not None and foxReaderInfo.list_of_ids_permanently_hidden_columns is not None and len(foxReaderInfo.list_of_ids_permanently_hidden_columns) > 0:
-            cols = getColumns(config, projectname)
+            cols_by_import_name = _group_columns_by_import_name(getColumns(config, projectname))
             columns_to_delete = []
             for attr in foxReaderInfo.list_of_ids_permanently_hidden_columns:
-                col = next((c for c in cols if c.importName == attr.get_nemo_name()), None)
+                col = cols_by_import_name.get(attr.get_nemo_name(), [None])[0]
                 if col is not None:
                     logging.info(f"Permanently hidden column found to delete '{col.internalName}'  id={col.id}")
                     columns_to_delete.append(col.id)
             
             if len(columns_to_delete) > 0:
-                deleteColumns(config, columns_to_delete)
+                # an attribute may be listed more than once, every column is deleted once
+                deleteColumns(config, list(dict.fromkeys(columns_to_delete)))
                 logging.info(f"Delete permanently hidden columns successful")
 
     except Exception as e:
@@ -601,7 +885,7 @@ def update_defined_columns(config: Config, projectname: str) -> None:
                 #     "conflictState": col.conflictState,
                 # }
                 # headers = config.connection_get_headers()
-                # response = requests.put(
+                # response = get_session().put(
                 #     config.get_config_nemo_url()
                 #     + f"/api/nemo-persistence/metadata/AttributeTree/projects/{{projectId}}/definedColumns/{{columnId}}".format(
                 #         projectId=getProjectID(config, projectname), columnId=col_id
@@ -638,6 +922,30 @@ def couple_attributes(config: Config, projectname: str, foxReaderInfo: FOXReader
         FOXProgressManager.warning(f"Failed to couple attributes:: {e}")
         pass
 
+
+def _upload_data(
+    config: Config,
+    upload_source: str | Callable[[BinaryIO], None],
+    s3filename: str,
+    upload_settings: FOXUploadSettings,
+) -> None:
+    """
+    Uploads a file or data written by a function. With upload_settings.stream_upload the
+    function writes directly into the multipart upload, so producing (compressing) and uploading
+    overlap; otherwise the data is written into a temporary file first.
+    """
+    if isinstance(upload_source, str):
+        upload_file_to_s3(config, upload_source, s3filename, upload_settings)
+    elif upload_settings.stream_upload:
+        upload_stream_to_s3(config, upload_source, s3filename, upload_settings)
+    else:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_file_path = os.path.join(temp_dir, os.path.basename(s3filename))
+            with open(temp_file_path, "wb") as temp_file:
+                upload_source(temp_file)
+            upload_file_to_s3(config, temp_file_path, s3filename, upload_settings)
+
+
 def _get_file_size(filepath: str):
     # filesize in byte
     filesize_in_byte = os.path.getsize(filepath)
@@ -646,6 +954,91 @@ def _get_file_size(filepath: str):
     return filesize_in_mb
 
 
+def _format_datetime_column(series: pd.Series, dtype_hint: str | None) -> pd.Series | None:
+    """
+    Renders a date/datetime column as strings ("" for missing values) or returns None if the
+    column is not treated as a date column. Parsing and strftime run once per distinct value
+    and the results are broadcast to the rows through the factorized codes.
+    """
+    # If the reader provided an explicit type for this internal column use it
+    if dtype_hint in ("date", "datetime"):
+        codes, uniques = _factorize_datetimes(series)
+        fmt = "%Y-%m-%d" if dtype_hint == "date" else "%Y-%m-%d %H:%M:%S"
+        return _broadcast_strftime(series, codes, uniques, fmt)
+
+    # Fallback heuristic: only attempt to format if dtype is datetime64 or column contains date/datetime Python objects
+    if not is_datetime64_any_dtype(series):
+        if not (is_object_dtype(series) or isinstance(series.dtype, pd.CategoricalDtype)):
+            return None
+        sample = series.dropna().head(50)
+        if len(sample) == 0:
+            return None
+        if not all(isinstance(v, (datetime.date, datetime.datetime)) for v in sample):
+            return None
+
+    codes, uniques = _factorize_datetimes(series)
+
+    # If any non-midnight time exists, keep time part; otherwise use date only
+    fmt = "%Y-%m-%d %H:%M:%S" if _has_time_of_day(uniques) else "%Y-%m-%d"
+    return _broadcast_strftime(series, codes, uniques, fmt)
+
+
+def _factorize_datetimes(series: pd.Series) -> tuple[np.ndarray, pd.DatetimeIndex]:
+    """
+    Returns the factorization codes of a column and its distinct values as timestamps.
+    Values that cannot be parsed become NaT, like pd.to_datetime(..., errors="coerce").
+    """
+    codes, uniques = pd.factorize(series)
+    if not isinstance(uniques, pd.DatetimeIndex):
+        uniques = pd.DatetimeIndex(
+            pd.to_datetime(np.asarray(uniques, dtype=object), errors="coerce")
+        )
+    return codes, uniques
+
+
+def _has_time_of_day(uniques: pd.DatetimeIndex) -> bool:
+    """
+    Checks with integer arithmetic on the datetime64 values whether any timestamp has a
+    time part (hour, minute, second or microsecond) other than midnight.
+    """
+    if uniques.tz is not None:
+        # look at the local wall time, like the .dt accessors do
+        uniques = uniques.tz_localize(None)
+    values = uniques.to_numpy()
+    values = values[~np.isnat(values)]
+    if len(values) == 0:
+        return False
+
+    unit = np.datetime_data(values.dtype)[0]
+    ticks = values.view("int64")
+    if unit == "ns":
+        # nanoseconds were never taken into account
+        ticks = ticks // 1_000
+        unit = "us"
+    ticks_per_day = {"s": 86_400, "ms": 86_400_000, "us": 86_400_000_000}.get(unit)
+    if ticks_per_day is None:
+        # coarser units (days etc.) cannot carry a time part
+        return False
+    return bool((ticks % ticks_per_day != 0).any())
+
+
+def _broadcast_strftime(
+    series: pd.Series,
+    codes: np.ndarray,
+    uniques: pd.DatetimeIndex,
+    fmt: str,
+) -> pd.Series:
+    """
+    Formats the distinct timestamps once and maps them back onto the rows. Missing and
+    unparsable values are written as empty strings.
+    """
+    formatted = np.asarray(uniques.strftime(fmt), dtype=object)
+    formatted[np.asarray(uniques.isna())] = ""
+    # code -1 (missing value) picks the trailing empty string
+    formatted = np.append(formatted, "")
+    return pd.Series(formatted[codes], index=series.index, dtype=object)
+
+
 def _format_data(
     df: pd.DataFrame,
     import_configuration: ImportConfigurations,
@@ -693,13 +1086,45 @@ def _format_data(
                 value = value.replace(char, "")
         return value
 
+    # Every step above replaces single characters only, so the whole pipeline can be
+    # expressed as one str.translate table (built by running the pipeline on each char).
+    # This keeps the output identical, including the escape character being escaped last.
+    if all(len(char) == 1 for char in SPECIAL_CHARS + REMOVE_CHARS):
+        translation_table = str.maketrans(
+            {char: escape_special_chars(char) for char in SPECIAL_CHARS + REMOVE_CHARS}
+        )
+
+        def escape_value(value):
+            if isinstance(value, str):
+                return value.translate(translation_table)
+            return value
+
+    else:
+        escape_value = escape_special_chars
+
     str_columns = df.select_dtypes(include=["object", "string"]).columns
     for col in str_columns:
-        df[col] = df[col].map(escape_special_chars)
+        df[col] = _escape_distinct_values(df[col], escape_value)
 
     return df
 
 
+def _escape_distinct_values(series: pd.Series, escape_value) -> pd.Series:
+    """
+    Applies escape_value once per distinct value of a pure string column and maps the
+    results back onto the rows. Columns with mixed content are mapped cell by cell.
+    """
+    if pd.api.types.infer_dtype(series, skipna=True) != "string":
+        return series.map(escape_value)
+
+    uniques = pd.unique(series.dropna())
+    if len(uniques) == len(series):
+        return series.map(escape_value)
+
+    # a dict lookup is vectorized by pandas; missing values are not in the dict and stay missing
+    return series.map({value: escape_value(value) for value in uniques})
+
+
 def synchronizeCsvColsAndImportedColumns(
     config: Config,
     projectname: str,
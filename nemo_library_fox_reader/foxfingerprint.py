@@ -0,0 +1,63 @@
+import hashlib
+import os
+from dataclasses import asdict, dataclass
+from typing import BinaryIO
+
+__all__ = ["FileFingerprint", "sha256_of_file", "sha256_of_stream"]
+
+_HASH_BLOCK_SIZE = 1024 * 1024
+
+
+def sha256_of_stream(stream: BinaryIO, block_size: int = _HASH_BLOCK_SIZE) -> str:
+    digest = hashlib.sha256()
+    while True:
+        block = stream.read(block_size)
+        if not block:
+            return digest.hexdigest()
+        digest.update(block)
+
+
+def sha256_of_file(path: str | os.PathLike, block_size: int = _HASH_BLOCK_SIZE) -> str:
+    """
+    Returns the sha256 of the file content. The file is read block by block.
+    """
+    with open(path, "rb") as f:
+        return sha256_of_stream(f, block_size)
+
+
+@dataclass
+class FileFingerprint:
+    """
+    Identifies the content of a local file. Size and modification time are cheap to check;
+    the content hash decides when they differ (e.g. after a copy that changed the mtime only).
+    """
+
+    path: str
+    size: int
+    mtime_ns: int
+    sha256: str | None = None
+
+    @classmethod
+    def from_file(cls, path: str | os.PathLike, with_hash: bool = True) -> "FileFingerprint":
+        stat = os.stat(path)
+        return cls(
+            path=str(path),
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            sha256=sha256_of_file(path) if with_hash else None,
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "FileFingerprint":
+        return cls(
+            path=data["path"],
+            size=data["size"],
+            mtime_ns=data["mtime_ns"],
+            sha256=data.get("sha256"),
+        )
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    def same_stat(self, other: "FileFingerprint") -> bool:
+        return self.size == other.size and self.mtime_ns == other.mtime_ns
@@ -0,0 +1,119 @@
+import threading
+from dataclasses import dataclass, field
+from http.cookiejar import DefaultCookiePolicy
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+__all__ = ["FOXHttpSettings", "close_session", "configure_session", "get_session"]
+
+
+@dataclass
+class FOXHttpSettings:
+    """
+    Connection pooling, timeouts and retries of the HTTP session used for all NEMO REST calls.
+    """
+
+    # number of hosts with a connection pool, and connections kept open per host. Should be at least
+    # the number of threads calling NEMO at the same time (parallel imports, metadata workers)
+    pool_connections: int = 10
+    pool_maxsize: int = 32
+
+    # seconds to wait for a connection and for the response
+    connect_timeout: float = 10.0
+    read_timeout: float = 300.0
+
+    # retries of failed requests with exponential backoff (backoff_factor * 2^n seconds).
+    # Responses with these status codes are retried for the allowed methods only; POST is not
+    # retried because it is not idempotent. Connection errors are retried for all methods
+    retries: int = 3
+    backoff_factor: float = 0.5
+    retry_status_codes: tuple[int, ...] = (429, 502, 503, 504)
+    retry_methods: frozenset[str] = field(
+        default_factory=lambda: frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+    )
+
+
+class _TimeoutHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that applies a default timeout to requests that do not set one.
+    """
+
+    def __init__(self, timeout: tuple[float, float], **kwargs):
+        self._timeout = timeout
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self._timeout
+        return super().send(request, **kwargs)
+
+
+def _create_session(settings: FOXHttpSettings) -> requests.Session:
+    retry = Retry(
+        total=settings.retries,
+        connect=settings.retries,
+        read=settings.retries,
+        status=settings.retries,
+        backoff_factor=settings.backoff_factor,
+        status_forcelist=settings.retry_status_codes,
+        allowed_methods=settings.retry_methods,
+        raise_on_status=False,
+        respect_retry_after_header=True,
+    )
+    adapter = _TimeoutHTTPAdapter(
+        timeout=(settings.connect_timeout, settings.read_timeout),
+        pool_connections=settings.pool_connections,
+        pool_maxsize=settings.pool_maxsize,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    # the session is shared by all tenants and users of the process and NEMO authenticates every
+    # request by its headers, so no cookie set for one caller may be sent with the requests of another
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """
+    Returns the HTTP session shared by all NEMO REST calls. Connections are kept alive and reused,
+    so consecutive calls do not pay for a new TCP and TLS handshake.
+    """
+    global _session
+    session = _session
+    if session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _create_session(FOXHttpSettings())
+            session = _session
+    return session
+
+
+def configure_session(settings: FOXHttpSettings) -> requests.Session:
+    """
+    Replaces the shared session by one with the given settings.
+    """
+    global _session
+    with _session_lock:
+        old_session, _session = _session, _create_session(settings)
+    if old_session is not None:
+        old_session.close()
+    return _session
+
+
+def close_session() -> None:
+    """
+    Closes the connections of the shared session. The next call creates a new session.
+    """
+    global _session
+    with _session_lock:
+        old_session, _session = _session, None
+    if old_session is not None:
+        old_session.close()
@@ -0,0 +1,77 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+
+from nemo_library.utils.config import Config
+
+__all__ = ["FOXImportStateStore", "default_import_state_directory"]
+
+
+def default_import_state_directory() -> Path:
+    return Path.home() / ".nemo_library_fox_reader" / "import_state"
+
+
+# one lock per state file, shared by all stores of the process. The steps of an import create their own store
+_state_file_locks: dict[Path, threading.Lock] = {}
+_state_file_locks_lock = threading.Lock()
+
+
+def _get_state_file_lock(path: Path) -> threading.Lock:
+    with _state_file_locks_lock:
+        return _state_file_locks.setdefault(path.resolve(), threading.Lock())
+
+
+class FOXImportStateStore:
+    """
+    Stores what was imported into a NEMO project (fingerprints, content hashes) in a local JSON file
+    per project, so the next import of the same project can find out what changed.
+    The state of a project is a dictionary of sections; every feature reads and writes its own section.
+    Updates of a section are serialized within the process and the file is replaced atomically, so a
+    reader never sees a partly written file. Separate processes importing the same project are not
+    synchronized; the last one to write a section wins.
+    """
+
+    def __init__(self, directory: str | os.PathLike | None = None):
+        self.directory = Path(directory) if directory else default_import_state_directory()
+
+    def load(self, config: Config, projectname: str) -> dict:
+        path = self._get_path(config, projectname)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logging.warning(f"Ignoring unreadable import state {path}: {e}")
+            return {}
+
+    def get_section(self, config: Config, projectname: str, section: str) -> dict | None:
+        return self.load(config, projectname).get(section)
+
+    def set_section(self, config: Config, projectname: str, section: str, value: dict | None) -> None:
+        """
+        Replaces (or removes, if value is None) one section of the state of a project.
+        """
+        path = self._get_path(config, projectname)
+        with _get_state_file_lock(path):
+            state = self.load(config, projectname)
+            state["nemo_url"] = config.get_config_nemo_url()
+            state["tenant"] = config.get_tenant()
+            state["projectname"] = projectname
+            if value is None:
+                state.pop(section, None)
+            else:
+                state[section] = value
+
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+            os.replace(temp_path, path)
+
+    def _get_path(self, config: Config, projectname: str) -> Path:
+        key = f"{config.get_config_nemo_url()}|{config.get_tenant()}|{projectname}"
+        return self.directory / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.json"
@@ -6,17 +6,12 @@ import math
 
 from nemo_library.features.focus import focusMoveAttributeBefore
 from nemo_library_fox_reader.foxfile import FOXFile
+from nemo_library_fox_reader.foxmetadatasnapshot import FOXMetadataSnapshot
 from nemo_library_fox_reader.foxprogressmanager import FOXProgressManager
 from nemo_library_fox_reader.foxreaderinfo import FOXReaderInfo
 from nemo_library_fox_reader.foxstatisticsinfo import IssueType
 from nemo_library_fox_reader.foxnemo_persistence_api import (
-    createAttributeGroups,
-    createAttributeLinks,
-    createColumns,
     createProjects,
-    deleteAttributeGroups,
-    deleteAttributeLinks,
-    deleteColumns,
     getAttributeGroups,
     getAttributeLinks,
     getColumns,
@@ -50,10 +45,31 @@ class FOXMeta:
     class for reconcile metadata of FOX file with NEMO project.
     """
 
-    def __init__(self, fox: FOXFile, foxReaderInfo: FOXReaderInfo | None = None):
+    def __init__(
+        self,
+        fox: FOXFile,
+        foxReaderInfo: FOXReaderInfo | None = None,
+        max_parallel_requests: int | None = None,
+        use_async_client: bool = False,
+    ):
         self.global_information = fox.global_information
         self.attributes = fox.attributes
         self.foxReaderInfo = foxReaderInfo
+        # create, update and delete requests sent to NEMO at the same time (None = setMetadataRequestParallelism)
+        self.max_parallel_requests = max_parallel_requests
+        # columns, attribute groups and links are read and sent with the asyncio client
+        # (foxnemo_persistence_api_async) instead of the requests based functions
+        if use_async_client:
+            # imported on demand, the asyncio client needs aiohttp
+            from nemo_library_fox_reader import foxnemo_persistence_api_async as persistence_api
+        else:
+            from nemo_library_fox_reader import foxnemo_persistence_api as persistence_api
+        self._persistence_api = persistence_api
+        self._metadata_prepared = False
+        # attributes by attribute_id and by the attribute_id of their parent (None = top level),
+        # see _index_attributes
+        self._attributes_by_id: dict[int, FoxAttribute] | None = None
+        self._children_by_parent_id: dict[int | None, list[FoxAttribute]] = {}
         # logging.info(f"FOXMeta __init__ foxReaderInfo={self.foxReaderInfo}")
 
     def reconcile_metadata(
@@ -70,16 +86,30 @@ class FOXMeta:
             projectname (str): Name of the NEMO project to reconcile.
             statistics_only (bool, optional): If True, statistics are collected and no ingestion is performed
         """
+        self.prepare_metadata()
+
+        # if parameter statistics_only is True, then no ingestion takes place
+        if statistics_only:
+            logging.info("statistics_only is True => no ingestion takes place")
+            return
+
+        self.apply_metadata(config=config, projectname=projectname)
+
+    def prepare_metadata(self) -> None:
+        """
+        Builds the NEMO columns, attribute groups and links from the FOX file attributes.
+        Does not call NEMO and depends on the schema only, so it can run before the data is read.
+        The preparation is done once per instance.
+        """
+        if self._metadata_prepared:
+            return
 
         # adjust parent relationships
       ##  logging.info("Setting parent relationships for FOX attributes...")
         self._set_parent_relationships()
 
         for attr in self.attributes:
-            if attr.nemo_data_type == "string" and attr.max_string_length > 0:
-                 ln2 = int(math.log(attr.max_string_length) / math.log(2))
-                 pow2length = 2 ** (ln2 + 1)
-                 attr.max_string_length =  max(attr.max_string_length + 1, pow2length) # we add 1 to the max string length to avoid issues with truncation in NEMO. This is a workaround and should be properly handled in the future when we have better support for string attributes in NEMO.
+            self._round_max_string_length(attr)
 
         # read meatadata from FOX file
         # sequence is important here, because we do not support all attribute types and formuale yet
@@ -96,24 +126,23 @@ class FOXMeta:
         # attributegroups_fox = self._get_fox_columns_HEADER()
         attributelinks_fox = self._get_fox_columns_LINK()
 
+        # the object of an attribute by internal name: a column, else an attribute group, else a link.
+        # The first object of a name wins
+        objects_by_internal_name: dict[str, tuple[object, str]] = {}
+        for objects, endpoint in [
+            (columns_fox, "Columns"),
+            (attributegroups_fox, "AttributeGroups"),
+            (attributelinks_fox, "AttributeLinks"),
+        ]:
+            for obj in objects:
+                objects_by_internal_name.setdefault(obj.internalName, (obj, endpoint))
+
         dictionary_object_to_create_to_endpoint = [] #:dict[object, str] = {}
         for attr, i in zip(self.attributes, range(len(self.attributes))):
-            attr_nemo_name = attr.get_nemo_name()
-
-            object_to_create = next((col for col in columns_fox if col.internalName == attr_nemo_name), None)
+            object_to_create, endpoint = objects_by_internal_name.get(attr.get_nemo_name(), (None, None))
             if object_to_create is not None:
                 object_to_create.order = f"{(i + 1):05d}"
-                dictionary_object_to_create_to_endpoint.append((object_to_create, "Columns"))
-            else:
-                object_to_create = next((col for col in attributegroups_fox if col.internalName == attr_nemo_name), None)
-                if object_to_create is not None:
-                    object_to_create.order = f"{(i + 1):05d}"
-                    dictionary_object_to_create_to_endpoint.append((object_to_create, "AttributeGroups"))
-                else:
-                    object_to_create = next((col for col in attributelinks_fox if col.internalName == attr_nemo_name), None)
-                    if object_to_create is not None:
-                        object_to_create.order = f"{(i + 1):05d}"
-                        dictionary_object_to_create_to_endpoint.append((object_to_create, "AttributeLinks"))
+                dictionary_object_to_create_to_endpoint.append((object_to_create, endpoint))
             
         if self.foxReaderInfo:
             self.foxReaderInfo.dictionary_internal_names_to_data_types = {}
@@ -128,12 +157,16 @@ class FOXMeta:
                     f"Attribute {attr.attribute_name} (ID: {attr.attribute_id}) ist not unsupported. It will not be imported."
                 )
 
-        # if parameter statistics_only is True, then no ingestion takes place
-        if statistics_only:
-            logging.info("statistics_only is True => no ingestion takes place")
-            return
-        
-        # create a project if it does not exist
+        self.columns_fox = columns_fox
+        self.attributegroups_fox = attributegroups_fox
+        self.attributelinks_fox = attributelinks_fox
+        self.dictionary_object_to_create_to_endpoint = dictionary_object_to_create_to_endpoint
+        self._metadata_prepared = True
+
+    def ensure_project(self, config: Config, projectname: str) -> None:
+        """
+        Creates the NEMO project if it does not exist.
+        """
         if not getProjectID(config=config, projectname=projectname):
             createProjects(
                 config=config,
@@ -145,12 +178,39 @@ class FOXMeta:
                 ],
             )
 
+    def apply_metadata(self, config: Config, projectname: str) -> None:
+        """
+        Creates, updates and deletes the columns, attribute groups and links of the NEMO project
+        so that they match the prepared FOX file metadata. Afterwards the order is adjusted and the
+        couple requests are prepared. The metadata of the project is read once, for the comparison
+        as well as for the creates and the attribute IDs (see FOXMetadataSnapshot), unless the
+        caller activated a snapshot of the project already.
+        Args:
+            config (Config): NEMO configuration object.
+            projectname (str): Name of the NEMO project to reconcile.
+        """
+        if FOXMetadataSnapshot.current(config, projectname) is not None:
+            self._apply_metadata(config=config, projectname=projectname)
+            return
+        with FOXMetadataSnapshot(config, projectname).activate():
+            self._apply_metadata(config=config, projectname=projectname)
+
+    def _apply_metadata(self, config: Config, projectname: str) -> None:
+        self.prepare_metadata()
+        columns_fox = self.columns_fox
+        attributegroups_fox = self.attributegroups_fox
+        attributelinks_fox = self.attributelinks_fox
+        dictionary_object_to_create_to_endpoint = self.dictionary_object_to_create_to_endpoint
+
+        # create a project if it does not exist
+        self.ensure_project(config=config, projectname=projectname)
+
         # load current metadata from NEMO project
         nemo_lists = {}
         methods = {
-            "columns": getColumns,
-            "attributegroups": getAttributeGroups,
-            "attributelinks": getAttributeLinks,
+            "columns": self._persistence_api.getColumns,
+            "attributegroups": self._persistence_api.getAttributeGroups,
+            "attributelinks": self._persistence_api.getAttributeLinks,
         }
         for name, method in methods.items():
             nemo_lists[name] = method(
@@ -220,12 +280,13 @@ class FOXMeta:
                 f"Found  {key} {len(deletions[key])} deletions, {len(updates[key])} updates, and {len(creates[key])} new {key} in FOX file."
             )
 
-        # Start with deletions
+        # Start with deletions. Every kind of object is a wave of its own: links are deleted before
+        # the groups and columns they point to. The requests of a wave are sent in parallel
         logging.info(f"start deletions")
         delete_functions = {
-            "attributelinks": deleteAttributeLinks,
-            "attributegroups": deleteAttributeGroups,
-            "columns": deleteColumns,
+            "attributelinks": self._persistence_api.deleteAttributeLinks,
+            "attributegroups": self._persistence_api.deleteAttributeGroups,
+            "columns": self._persistence_api.deleteColumns,
             # "exported_columns": deleteColumns,
             # "defined_columns": deleteColumns,
             # "other_columns": deleteColumns,
@@ -234,14 +295,19 @@ class FOXMeta:
         for key, delete_function in delete_functions.items():
             if deletions[key]:
                 objects_to_delete = [data_nemo.id for data_nemo in deletions[key]]
-                delete_function(config=config, **{key: objects_to_delete})
+                delete_function(
+                    config=config,
+                    max_parallel_requests=self.max_parallel_requests,
+                    **{key: objects_to_delete},
+                )
 
-        # Now do updates and creates in a reverse  order
+        # Now do updates and creates in a reverse  order: groups before the columns in them,
+        # columns before the links pointing to them
         logging.info(f"start creates and updates")
         create_functions = {
-            "attributegroups": createAttributeGroups,
-            "columns": createColumns,
-            "attributelinks": createAttributeLinks,
+            "attributegroups": self._persistence_api.createAttributeGroups,
+            "columns": self._persistence_api.createColumns,
+            "attributelinks": self._persistence_api.createAttributeLinks,
         }
 
         if self.foxReaderInfo and self.foxReaderInfo.operation_mode_create_objects_in_attribute_order:
@@ -259,16 +325,15 @@ class FOXMeta:
 
         else:
             for key, create_function in create_functions.items():
-                # create new objects first
+                # new and changed objects have different internal names, so they are sent together
                 if creates[key]:
                     logging.info(f"Creating new {key}  {creates[key]} ")
+                if creates[key] or updates[key]:
                     create_function(
-                        config=config, projectname=projectname, **{key: creates[key]}
-                    )
-                # now the changes
-                if updates[key]:
-                    create_function(
-                        config=config, projectname=projectname, **{key: updates[key]}
+                        config=config,
+                        projectname=projectname,
+                        max_parallel_requests=self.max_parallel_requests,
+                        **{key: creates[key] + updates[key]},
                     )
 
         if self.foxReaderInfo:
@@ -284,6 +349,8 @@ class FOXMeta:
                 self._adjust_order(config=config, projectname=projectname)
             except Exception as e:
                 FOXProgressManager.warning(f"Failed to adjust order of attributes: {e}")
+            # moving the attributes has changed their order in NEMO
+            FOXMetadataSnapshot.current(config, projectname).invalidate()
 
         try:
             self._couple_attributes(config=config, projectname=projectname, attributes=self.attributes)
@@ -291,6 +358,150 @@ class FOXMeta:
             FOXProgressManager.warning(f"Failed to couple attributes: {e}")
 
 
+    def apply_converted_attributes(self, config: Config, projectname: str, attributes: list[FoxAttribute]) -> None:
+        """
+        Sends the metadata of attributes whose data type has been switched to "string" while the data
+        was converted to NEMO, after apply_metadata: their rebuilt columns (see update_converted_attributes)
+        and the links that reference them (see _update_links_to_converted_attributes).
+        Args:
+            config (Config): NEMO configuration object.
+            projectname (str): Name of the NEMO project.
+            attributes (list[FoxAttribute]): The converted attributes.
+        """
+        columns = self.update_converted_attributes(attributes)
+        replaced_columns, attributelinks = self._update_links_to_converted_attributes(attributes)
+
+        # links are deleted before the columns they point to and created after them, as in apply_metadata
+        if replaced_columns:
+            column_ids = [
+                column.id
+                for column in self._persistence_api.getColumns(config=config, projectname=projectname)
+                if column.internalName in replaced_columns
+            ]
+            if column_ids:
+                self._persistence_api.deleteColumns(
+                    config=config, columns=column_ids, max_parallel_requests=self.max_parallel_requests
+                )
+        if columns:
+            self._persistence_api.createColumns(
+                config=config, projectname=projectname, columns=columns, max_parallel_requests=self.max_parallel_requests
+            )
+        if not attributelinks:
+            return
+        self._persistence_api.createAttributeLinks(
+            config=config,
+            projectname=projectname,
+            attributelinks=attributelinks,
+            max_parallel_requests=self.max_parallel_requests,
+        )
+        if self.foxReaderInfo:
+            self._fill_dictionary_internal_names_to_attribute_ids(config=config, projectname=projectname)
+
+        # the new links are created at the end of their group, the groups are put in order again
+        if self.foxReaderInfo is None or not self.foxReaderInfo.operation_mode_not_moving_attributes:
+            link_names = {link.internalName for link in attributelinks}
+            parent_indexes = {
+                attr.parent_index if attr.level > 0 else None
+                for attr in self.attributes
+                if attr.get_nemo_name() in link_names
+            }
+            for parent_index in parent_indexes:
+                try:
+                    self._adjust_order(
+                        config=config, projectname=projectname, start_attr=self._get_attribute_by_id(parent_index)
+                    )
+                except Exception as e:
+                    FOXProgressManager.warning(f"Failed to adjust order of attributes: {e}")
+            snapshot = FOXMetadataSnapshot.current(config, projectname)
+            if snapshot is not None:
+                snapshot.invalidate()
+
+    def update_converted_attributes(self, attributes: list[FoxAttribute]) -> list[Column]:
+        """
+        Rebuilds the prepared columns of attributes whose data type has been switched to "string"
+        while the data was converted (see FOXFile.create_dataframe), after the metadata has been prepared.
+        Of the derived attributes only links depend on the data type of the attribute they reference,
+        see _update_links_to_converted_attributes. Summary columns take their data type from their own
+        format and expression formulas do not depend on the types of the referenced attributes.
+        Args:
+            attributes (list[FoxAttribute]): The converted attributes.
+        Returns:
+            list[Column]: The rebuilt columns. They still have to be sent to NEMO (createColumns).
+        """
+        self.prepare_metadata()
+        positions: dict[str, int] = {}
+        for index, col in enumerate(self.columns_fox):
+            positions.setdefault(col.internalName, index)
+
+        columns = []
+        for attr in attributes:
+            if attr.attribute_type != FOXAttributeType.Normal:
+                continue
+            self._round_max_string_length(attr)
+            column = self._get_fox_column_NORMAL(attr)
+            index = positions.get(column.internalName)
+            if index is not None:
+                column.order = self.columns_fox[index].order
+                self.columns_fox[index] = column
+            if self.foxReaderInfo:
+                self.foxReaderInfo.dictionary_internal_names_to_data_types[column.internalName] = column.dataType
+            columns.append(column)
+        return columns
+
+    def _update_links_to_converted_attributes(
+        self, attributes: list[FoxAttribute]
+    ) -> tuple[set[str], list[AttributeLink]]:
+        """
+        A link to a date or datetime attribute is prepared as a column that extracts a part of the date
+        (see _get_fox_columns_LINKS_with_DATEDETAILS). If that attribute has been converted to "string",
+        the link becomes an attribute link, as it would have been had the conversion happened before the
+        preparation. Updates the prepared metadata.
+        Returns:
+            tuple[set[str], list[AttributeLink]]: The internal names of the replaced columns and the new links.
+        """
+        self.prepare_metadata()
+        converted_ids = {attr.attribute_id for attr in attributes}
+        if not converted_ids:
+            return set(), []
+        positions = {column.internalName: index for index, column in enumerate(self.columns_fox)}
+
+        replaced_columns: dict[str, Column] = {}
+        attributelinks = []
+        for attr in self.attributes:
+            if attr.attribute_type != FOXAttributeType.Link:
+                continue
+            index = positions.get(attr.get_nemo_name())
+            if index is None:
+                continue
+            referenced_attr = self._get_referenced_attribute(attr.original_attribute_index)
+            if referenced_attr.attribute_id not in converted_ids or referenced_attr.nemo_data_type in ["date", "datetime"]:
+                continue
+            column = self.columns_fox[index]
+            link = self._get_fox_link(attr, referenced_attr)
+            link.order = column.order
+            replaced_columns[column.internalName] = link
+            attributelinks.append(link)
+
+        if replaced_columns:
+            self.columns_fox = [column for column in self.columns_fox if column.internalName not in replaced_columns]
+            self.attributelinks_fox.extend(attributelinks)
+            self.dictionary_object_to_create_to_endpoint = [
+                (replaced_columns[obj.internalName], "AttributeLinks")
+                if endpoint == "Columns" and obj.internalName in replaced_columns
+                else (obj, endpoint)
+                for obj, endpoint in self.dictionary_object_to_create_to_endpoint
+            ]
+            if self.foxReaderInfo:
+                for internal_name in replaced_columns:
+                    self.foxReaderInfo.dictionary_internal_names_to_data_types.pop(internal_name, None)
+        return set(replaced_columns), attributelinks
+
+    def _round_max_string_length(self, attr: FoxAttribute) -> None:
+        if attr.nemo_data_type == "string" and attr.max_string_length > 0:
+            ln2 = int(math.log(attr.max_string_length) / math.log(2))
+            pow2length = 2 ** (ln2 + 1)
+            attr.max_string_length = max(attr.max_string_length + 1, pow2length) # we add 1 to the max string length to avoid issues with truncation in NEMO. This is a workaround and should be properly handled in the future when we have better support for string attributes in NEMO.
+
     def _fill_dictionary_internal_names_to_attribute_ids(self,config: Config, projectname: str) -> None:
         """
         Fills the foxReaderInfo dictionary mapping internal names to attribute IDs.
@@ -367,6 +578,29 @@ class FOXMeta:
             logging.debug(f"Updated level stack after processing: {updated_stack}")
 
         logging.info("Finished assigning parent-child relationships.")
+        self._index_attributes()
+
+    def _index_attributes(self) -> None:
+        """
+        Indexes the attributes by attribute_id and by the attribute_id of their parent, so parents,
+        children and referenced attributes are found without scanning all attributes. The first
+        attribute of an attribute_id wins. Call again after attribute_id or parent_index changed.
+        """
+        self._attributes_by_id = {}
+        self._children_by_parent_id = {}
+        for attr in self.attributes:
+            self._attributes_by_id.setdefault(attr.attribute_id, attr)
+            self._children_by_parent_id.setdefault(attr.parent_index, []).append(attr)
+
+    def _get_attribute_by_id(self, attribute_id: int | None) -> FoxAttribute | None:
+        if self._attributes_by_id is None:
+            self._index_attributes()
+        return self._attributes_by_id.get(attribute_id)
+
+    def _get_children(self, parent_id: int | None) -> list[FoxAttribute]:
+        if self._attributes_by_id is None:
+            self._index_attributes()
+        return self._children_by_parent_id.get(parent_id, [])
 
     def _get_parent_internal_name(self, attr: FoxAttribute) -> str:
         """
@@ -375,10 +609,7 @@ class FOXMeta:
         """
         if attr.level == 0:
             return None
-        parent_attr = next(
-            (a for a in self.attributes if a.attribute_id == attr.parent_index),
-            None,
-        )
+        parent_attr = self._get_attribute_by_id(attr.parent_index)
         if parent_attr:
             return parent_attr.get_nemo_name()
         return None
@@ -390,10 +621,7 @@ class FOXMeta:
         """
         if attr.level == 0:
             return None
-        parent_attr = next(
-            (a for a in self.attributes if a.attribute_id == attr.parent_index),
-            None,
-        )
+        parent_attr = self._get_attribute_by_id(attr.parent_index)
         if parent_attr:
             return parent_attr.uuid
         return None
@@ -412,19 +640,25 @@ class FOXMeta:
         if self.foxReaderInfo is not None:
             self.foxReaderInfo.couple_attributes_requests = []
 
+            positions: dict[str, int] = {}
+            for index, attr in enumerate(attributes):
+                positions.setdefault(attr.uuid, index)
+
             for coupled_attributes in self.foxReaderInfo.coupled_attributes_in_fox_file:
                 
                 attributeIds = [a.get_nemo_name() for a in coupled_attributes if a.permanently_hidden == 0]
                 if len(attributeIds) == 0:
                     continue
 
-                previous_element_id = None
+                # the coupled attributes are placed after the attribute preceding the first of them
+                # (after the last attribute, if the first one is not in the list)
+                index = positions.get(coupled_attributes[0].uuid)
                 containing_group_internal_name = None
-                for attr in attributes:
-                    if attr.uuid == coupled_attributes[0].uuid:
-                        containing_group_internal_name = self._get_parent_internal_name(attr)
-                        break
-                    previous_element_id = attr.get_nemo_name()
+                if index is not None:
+                    containing_group_internal_name = self._get_parent_internal_name(attributes[index])
+                else:
+                    index = len(attributes)
+                previous_element_id = attributes[index - 1].get_nemo_name() if index > 0 else None
 
                 couple_request = CoupleAttributesRequest(
                     attributeIds=attributeIds,
@@ -450,8 +684,8 @@ class FOXMeta:
 
         # iterate all attributes that have the start_attr as parent
         last_attr = None
-        for attr in reversed(self.attributes):
-            if (attr != start_attr) and (attr.parent_index == (start_attr.attribute_id if start_attr else None)           ):
+        for attr in reversed(self._get_children(start_attr.attribute_id if start_attr else None)):
+            if attr != start_attr:
 
                 try:
                     focusMoveAttributeBefore(
@@ -487,23 +721,27 @@ class FOXMeta:
         imported_columns = []
         for attr in self.attributes:
             if attr.attribute_type == FOXAttributeType.Normal:
-                imported_columns.append(
-                    Column(
-                        displayName=get_display_name(attr.attribute_name),
-                        importName=attr.get_nemo_name(),
-                        internalName=attr.get_nemo_name(),
-                        dataType=attr.nemo_data_type,
-                        parentAttributeGroupInternalName=self._get_parent_internal_name(
-                            attr
-                        ),
-                        columnType="ExportedColumn",
-                        unit=attr.nemo_unit,
-                        stringSize=attr.max_string_length if attr.nemo_data_type == "string" else 0,
-                    )
-                )
+                imported_columns.append(self._get_fox_column_NORMAL(attr))
                 logging.info(f"Added normal column: '{attr.get_nemo_name()}' with data type '{attr.nemo_data_type}' and format '{attr.format}'")    
         return imported_columns
 
+    def _get_fox_column_NORMAL(self, attr: FoxAttribute) -> Column:
+        """
+        Returns the ImportedColumn object of a normal FOX file attribute.
+        """
+        return Column(
+            displayName=get_display_name(attr.attribute_name),
+            importName=attr.get_nemo_name(),
+            internalName=attr.get_nemo_name(),
+            dataType=attr.nemo_data_type,
+            parentAttributeGroupInternalName=self._get_parent_internal_name(
+                attr
+            ),
+            columnType="ExportedColumn",
+            unit=attr.nemo_unit,
+            stringSize=attr.max_string_length if attr.nemo_data_type == "string" else 0,
+        )
+
     def _get_fox_columns_HEADER(self) -> list[AttributeGroup]:
         """
         Returns a list of AttributeGroup objects from the FOX file attributes.
@@ -1108,18 +1346,22 @@ class FOXMeta:
 
                 if not is_link_to_date_with_date_format:
 #                    logging.info(f">>>>>>>>>>>>>>>>>>>>>>>>>>>>> Link detected {attr.attribute_name} {referenced_attr.attribute_name}")
-                    attribute_links.append(
-                        AttributeLink(
-                            displayName=get_display_name(attr.attribute_name),
-                            internalName=attr.get_nemo_name(),
-                            sourceAttributeInternalName=referenced_attr.get_nemo_name(),
-                            parentAttributeGroupInternalName=self._get_parent_internal_name(
-                                attr
-                            ),
-                            sourceMetadataType="column",
-                        )
-                    )
+                    attribute_links.append(self._get_fox_link(attr, referenced_attr))
         return attribute_links
+
+    def _get_fox_link(self, attr: FoxAttribute, referenced_attr: FoxAttribute) -> AttributeLink:
+        """
+        Returns the AttributeLink object of a FOX link attribute to the referenced attribute.
+        """
+        return AttributeLink(
+            displayName=get_display_name(attr.attribute_name),
+            internalName=attr.get_nemo_name(),
+            sourceAttributeInternalName=referenced_attr.get_nemo_name(),
+            parentAttributeGroupInternalName=self._get_parent_internal_name(
+                attr
+            ),
+            sourceMetadataType="column",
+        )
         
     def _get_attribute_group_type(self, attr: FoxAttribute) -> str:
         """
@@ -1129,14 +1371,12 @@ class FOXMeta:
         # an "Analysis" group is defined as a group where at least one attribute is of type "Summary"
         # and the second summary attribute is a header
 
-        for child_attr in self.attributes:
-            if child_attr.parent_index == attr.attribute_id:
-                if child_attr.attribute_type == FOXAttributeType.Summary:
-                    # check if the referenced attribute in attribute2_index is of type Header
-                    for ref_attr in self.attributes:
-                        if ref_attr.attribute_id == child_attr.attribute2_index:
-                            if ref_attr.attribute_type == FOXAttributeType.Header:
-                                return "Analysis"
+        for child_attr in self._get_children(attr.attribute_id):
+            if child_attr.attribute_type == FOXAttributeType.Summary:
+                # check if the referenced attribute in attribute2_index is of type Header
+                ref_attr = self._get_attribute_by_id(child_attr.attribute2_index)
+                if ref_attr is not None and ref_attr.attribute_type == FOXAttributeType.Header:
+                    return "Analysis"
 
         return "Standard"  # default type
 
@@ -1153,14 +1393,7 @@ class FOXMeta:
         Returns:
             FoxAttribute: _description_
         """
-        referenced_attribute = next(
-            (
-                a
-                for a in self.attributes
-                if a.attribute_id == original_attribute_index
-            ),
-            None,
-        )
+        referenced_attribute = self._get_attribute_by_id(original_attribute_index)
         if not referenced_attribute:
             raise ValueError(
                 f"Referenced attribute with ID {original_attribute_index} not found for link attribute."
@@ -0,0 +1,120 @@
+import json
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable
+
+from nemo_library.utils.config import Config
+
+__all__ = ["FOXMetadataSnapshot"]
+
+
+class FOXMetadataSnapshot:
+    """
+    The metadata objects (columns, attribute groups, attribute links, ...) of one NEMO project,
+    read once and shared by the steps of an import. While the snapshot is active (see activate()),
+    the get functions of foxnemo_persistence_api return its objects instead of requesting them
+    again, and the create, update and delete functions keep it up to date with the objects they
+    send and NEMO returns. An endpoint is read again only after it was invalidated:
+
+        with FOXMetadataSnapshot(config, projectname).activate():
+            FOXMeta(foxfile).reconcile_metadata(config, projectname)
+
+    Changes made by NEMO itself (e.g. the columns added by an ingestion) or by other clients are
+    not seen; call invalidate() after them.
+    """
+
+    def __init__(self, config: Config, projectname: str):
+        self.nemo_url = config.get_config_nemo_url()
+        self.tenant = config.get_tenant()
+        self.projectname = projectname
+        self._lock = threading.RLock()
+        # objects as sent by NEMO by endpoint and id. Endpoints not read yet or invalidated are missing
+        self._objects: dict[str, dict[str, dict]] = {}
+
+    @staticmethod
+    def current(config: Config, projectname: str | None = None) -> "FOXMetadataSnapshot | None":
+        """
+        Returns the active snapshot if it belongs to the NEMO environment and tenant of config (and
+        to the project, if projectname is given), otherwise None.
+        """
+        snapshot = _current_snapshot.get()
+        if snapshot is None:
+            return None
+        if snapshot.nemo_url != config.get_config_nemo_url() or snapshot.tenant != config.get_tenant():
+            return None
+        if projectname is not None and snapshot.projectname != projectname:
+            return None
+        return snapshot
+
+    @contextmanager
+    def activate(self):
+        """
+        Makes this snapshot the active one until the with-block ends. New threads do not inherit
+        it; run their work with contextvars.copy_context().run to keep it.
+        """
+        token = _current_snapshot.set(self)
+        try:
+            yield self
+        finally:
+            _current_snapshot.reset(token)
+
+    def get_objects(self, endpoint: str, fetch: Callable[[], list[dict]]) -> list[dict]:
+        """
+        Returns copies of the objects of the endpoint. They are read with fetch if the endpoint
+        was not read yet or was invalidated.
+        """
+        with self._lock:
+            objects = self._objects.get(endpoint)
+            if objects is None:
+                objects = {obj.get("id"): obj for obj in fetch()}
+                self._objects[endpoint] = objects
+            # the callers change the objects they get, the snapshot must not change with them
+            return json.loads(json.dumps(list(objects.values())))
+
+    def get_cached_objects(self, endpoint: str) -> list[dict] | None:
+        """
+        Returns copies of the objects of the endpoint, or None if it has to be read. For callers that
+        cannot read it within get_objects, e.g. the asyncio client: they read the objects and pass
+        them to get_objects.
+        """
+        with self._lock:
+            objects = self._objects.get(endpoint)
+            return None if objects is None else json.loads(json.dumps(list(objects.values())))
+
+    def put(self, endpoint: str, objects: list[dict]) -> None:
+        """
+        Adds created or replaces updated objects. Objects without an id cannot be placed, the
+        endpoint is read again then.
+        """
+        with self._lock:
+            existing = self._objects.get(endpoint)
+            if existing is None:
+                return
+            if not all(obj.get("id") for obj in objects):
+                self._objects.pop(endpoint, None)
+                return
+            for obj in objects:
+                existing[obj["id"]] = json.loads(json.dumps(obj))
+
+    def remove(self, endpoint: str, ids: list[str]) -> None:
+        with self._lock:
+            existing = self._objects.get(endpoint)
+            if existing is not None:
+                for obj_id in ids:
+                    existing.pop(obj_id, None)
+
+    def invalidate(self, endpoint: str | None = None) -> None:
+        """
+        Drops the objects of the endpoint (or of all endpoints), they are read again when needed.
+        """
+        with self._lock:
+            if endpoint is None:
+                self._objects.clear()
+            else:
+                self._objects.pop(endpoint, None)
+
+
+_current_snapshot: ContextVar[FOXMetadataSnapshot | None] = ContextVar(
+    "fox_metadata_snapshot", default=None
+)
@@ -0,0 +1,641 @@
+import gzip
+import hashlib
+import json
+import re
+import threading
+import time
+import uuid
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+from xml.sax.saxutils import escape
+
+__all__ = [
+    "FOXMockNemoServer",
+    "FOXTrafficRecorder",
+    "MOCK_BULK_ENDPOINT_PATHS",
+    "load_recording",
+    "register_mock_bulk_endpoints",
+]
+
+_METADATA = "/api/nemo-persistence/metadata"
+
+# metadata endpoints of the mock server that take lists of objects (create, update) or IDs (delete),
+# by endpoint and operation: method and path below /api/nemo-persistence/metadata/
+MOCK_BULK_ENDPOINT_PATHS = {
+    "create": ("POST", "{endpoint}/bulk"),
+    "update": ("PUT", "{endpoint}/bulk"),
+    "delete": ("POST", "{endpoint}/bulk/delete"),
+}
+
+
+@dataclass
+class _MockRequest:
+    method: str
+    path: str
+    query: dict[str, list[str]]
+    headers: dict[str, str]
+    body: bytes
+
+    def json(self):
+        return json.loads(self.body) if self.body else None
+
+
+@dataclass
+class _MockResponse:
+    status: int
+    body: bytes = b""
+    headers: dict[str, str] = field(default_factory=dict)
+    content_type: str = "application/json"
+
+
+def _json_response(status: int, result=None) -> _MockResponse:
+    return _MockResponse(status, b"" if result is None else json.dumps(result).encode("utf-8"))
+
+
+def _list_response(request: _MockRequest, result: list) -> _MockResponse:
+    # lists carry an ETag; a request with the current one as If-None-Match gets 304 without a body
+    body = json.dumps(result).encode("utf-8")
+    etag = f'"{hashlib.sha1(body).hexdigest()}"'
+    if request.headers.get("if-none-match") == etag:
+        return _MockResponse(304, headers={"ETag": etag})
+    return _MockResponse(200, body, headers={"ETag": etag})
+
+
+class FOXMockNemoServer:
+    """
+    Local stand-in of NEMO for measuring the requests of this package without a NEMO environment.
+    Serves the project, metadata, attribute tree, couple, project property, queue (ingest, analyze,
+    task_runs) and token vendor endpoints, plus a minimal S3 API for the upload bucket (path style,
+    single and multipart uploads). Project and metadata lists carry an ETag and unchanged lists are
+    answered with 304 Not Modified. Everything is kept in memory and every request is counted by
+    method and route:
+
+        with FOXMockNemoServer(latency=0.02) as server:
+            config = server.create_config()
+            ReUploadFile(config, projectname, filename, upload_settings=server.create_upload_settings())
+            print(server.request_counts)
+
+    Args:
+        latency: seconds added to every response, to simulate the round trip to NEMO.
+        latency_by_route: latency of single routes ("METHOD route" as in request_counts, or "S3").
+        task_duration: seconds until an ingest or analyze task is reported as finished.
+        bulk_endpoints: also accept lists of objects, see MOCK_BULK_ENDPOINT_PATHS.
+        replay: recorded traffic (see FOXTrafficRecorder, load_recording). Recorded responses are
+            returned for matching requests, in recorded order; other requests are served by the mock.
+        replay_latency: wait as long as the recorded request took, instead of latency.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        tenant: str = "mock",
+        latency: float = 0.0,
+        latency_by_route: dict[str, float] | None = None,
+        task_duration: float = 0.0,
+        bulk_endpoints: bool = False,
+        replay: list[dict] | None = None,
+        replay_latency: bool = False,
+    ):
+        self.tenant = tenant
+        self.latency = latency
+        self.latency_by_route = dict(latency_by_route or {})
+        self.task_duration = task_duration
+        self.bulk_endpoints = bulk_endpoints
+        self.replay_latency = replay_latency
+        self.request_counts: Counter[str] = Counter()
+        self.projects: dict[str, dict] = {}
+        # metadata objects by endpoint and id
+        self.metadata: dict[str, dict[str, dict]] = {}
+        self.project_properties: dict[tuple[str, str], object] = {}
+        self.tasks: dict[str, dict] = {}
+        # S3 objects by bucket and key, and open multipart uploads by upload id
+        self.s3_objects: dict[tuple[str, str], bytes] = {}
+        self._multipart_uploads: dict[str, dict[int, bytes]] = {}
+        self._replay: dict[tuple[str, str], deque] = {}
+        for entry in replay or []:
+            self._replay.setdefault((entry["method"], entry["path"]), deque()).append(entry)
+        self._lock = threading.RLock()
+        self._httpd = ThreadingHTTPServer((host, port), _MockRequestHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.mock = self
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def total_requests(self) -> int:
+        with self._lock:
+            return sum(self.request_counts.values())
+
+    def start(self) -> "FOXMockNemoServer":
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._httpd.serve_forever, name="nemo-mock-server", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> "FOXMockNemoServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+    def reset_counts(self) -> None:
+        with self._lock:
+            self.request_counts.clear()
+
+    def create_config(self):
+        """
+        Returns a NEMO configuration pointing to this server. No login takes place.
+        """
+        from nemo_library.utils.config import Config
+
+        url = self.url
+
+        class _MockConfig(Config):
+            def get_config_nemo_url(self) -> str:
+                return url
+
+            def connection_get_tokens(self) -> tuple[str | None, str | None, str | None]:
+                return "mock-id-token", "mock-access-token", "mock-refresh-token"
+
+        return _MockConfig(
+            config_file=None,
+            environment="prod",
+            tenant=self.tenant,
+            userid="mock",
+            password="mock",
+        )
+
+    def create_upload_settings(self, **kwargs):
+        """
+        Returns upload settings that send the data to the S3 stand-in of this server.
+        """
+        from nemo_library_fox_reader.foxuploadsettings import FOXUploadSettings
+
+        kwargs.setdefault("s3_endpoint_url", self.url)
+        kwargs.setdefault("task_poll_min_interval", 0.05)
+        kwargs.setdefault("task_poll_max_interval", 0.5)
+        return FOXUploadSettings(**kwargs)
+
+    def add_project(self, displayName: str) -> str:
+        with self._lock:
+            project_id = uuid.uuid4().hex
+            self.projects[project_id] = {"id": project_id, "displayName": displayName, "tenant": self.tenant}
+            return project_id
+
+    def get_objects(self, endpoint: str, project_id: str | None = None) -> list[dict]:
+        with self._lock:
+            return [
+                obj
+                for obj in self.metadata.get(endpoint, {}).values()
+                if project_id is None or obj.get("projectId") == project_id
+            ]
+
+    # request handling, called by _MockRequestHandler
+
+    def _handle(self, request: _MockRequest) -> _MockResponse:
+        started = time.monotonic()
+        recorded = self._next_recorded(request)
+        if recorded is not None:
+            route, response = "replay", _MockResponse(
+                recorded["status"],
+                recorded.get("response", "").encode("utf-8"),
+                content_type=recorded.get("content_type", "application/json"),
+            )
+            delay = recorded.get("elapsed", 0.0) if self.replay_latency else self.latency
+            with self._lock:
+                self.request_counts[f"{request.method} {request.path} (replay)"] += 1
+        else:
+            route, response = self._dispatch(request)
+            delay = self.latency_by_route.get(route, self.latency)
+        remaining = delay - (time.monotonic() - started)
+        if remaining > 0:
+            time.sleep(remaining)
+        return response
+
+    def _next_recorded(self, request: _MockRequest) -> dict | None:
+        if not self._replay:
+            return None
+        with self._lock:
+            queue = self._replay.get((request.method, request.path))
+            return queue.popleft() if queue else None
+
+    def _dispatch(self, request: _MockRequest) -> tuple[str, _MockResponse]:
+        if not request.path.startswith("/api/"):
+            with self._lock:
+                self.request_counts[f"{request.method} S3"] += 1
+                return "S3", self._handle_s3(request)
+
+        for route_method, pattern, route, handler in _ROUTES:
+            if route_method != request.method:
+                continue
+            match = pattern.fullmatch(request.path)
+            if match is None:
+                continue
+            if "/bulk" in route and not self.bulk_endpoints:
+                continue
+            key = f"{request.method} {route}"
+            with self._lock:
+                self.request_counts[key] += 1
+                return key, handler(self, request, **match.groupdict())
+        with self._lock:
+            self.request_counts[f"{request.method} (unknown)"] += 1
+        return "unknown", _json_response(
+            404, {"error": f"{request.method} {request.path} is not supported by the mock server"}
+        )
+
+    # projects
+
+    def _get_projects(self, request: _MockRequest) -> _MockResponse:
+        return _list_response(request, list(self.projects.values()))
+
+    def _create_project(self, request: _MockRequest) -> _MockResponse:
+        body = request.json()
+        project_id = self.add_project(body.get("displayName", ""))
+        self.projects[project_id].update({k: v for k, v in body.items() if k != "id"})
+        return _json_response(201, self.projects[project_id])
+
+    def _update_project(self, request: _MockRequest, id: str) -> _MockResponse:
+        if id not in self.projects:
+            return _json_response(404, {"error": f"project {id} not found"})
+        self.projects[id].update({k: v for k, v in request.json().items() if k != "id"})
+        return _json_response(200, self.projects[id])
+
+    def _delete_project(self, request: _MockRequest, id: str) -> _MockResponse:
+        if self.projects.pop(id, None) is None:
+            return _json_response(404, {"error": f"project {id} not found"})
+        for objects in self.metadata.values():
+            for obj_id in [obj_id for obj_id, obj in objects.items() if obj.get("projectId") == id]:
+                del objects[obj_id]
+        return _json_response(204)
+
+    def _set_project_property(self, request: _MockRequest, project_id: str, name: str) -> _MockResponse:
+        self.project_properties[(project_id, name)] = request.json()
+        return _json_response(200)
+
+    # metadata
+
+    def _get_metadata(self, request: _MockRequest, endpoint: str, project_id: str, postfix: str) -> _MockResponse:
+        if project_id not in self.projects:
+            return _json_response(404, {"error": f"project {project_id} not found"})
+        return _list_response(request, self.get_objects(endpoint, project_id))
+
+    def _create_metadata(self, request: _MockRequest, endpoint: str) -> _MockResponse:
+        return _json_response(201, self._create_object(endpoint, request.json()))
+
+    def _create_object(self, endpoint: str, body: dict) -> dict:
+        obj = dict(body)
+        obj["id"] = uuid.uuid4().hex
+        self.metadata.setdefault(endpoint, {})[obj["id"]] = obj
+        return obj
+
+    def _update_metadata(self, request: _MockRequest, endpoint: str, id: str) -> _MockResponse:
+        if not self._update_object(endpoint, id, request.json()):
+            return _json_response(404, {"error": f"{endpoint} {id} not found"})
+        return _json_response(200, self.metadata[endpoint][id])
+
+    def _update_object(self, endpoint: str, id: str, body: dict) -> bool:
+        objects = self.metadata.get(endpoint, {})
+        if id not in objects:
+            return False
+        objects[id] = dict(body, id=id)
+        return True
+
+    def _delete_metadata(self, request: _MockRequest, endpoint: str, id: str) -> _MockResponse:
+        if self.metadata.get(endpoint, {}).pop(id, None) is None:
+            return _json_response(404, {"error": f"{endpoint} {id} not found"})
+        return _json_response(204)
+
+    def _bulk_create_metadata(self, request: _MockRequest, endpoint: str) -> _MockResponse:
+        return _json_response(201, [self._create_object(endpoint, obj) for obj in request.json()])
+
+    def _bulk_update_metadata(self, request: _MockRequest, endpoint: str) -> _MockResponse:
+        updated = [self._update_object(endpoint, obj.get("id"), obj) for obj in request.json()]
+        if not all(updated):
+            return _json_response(404, {"error": "some objects were not found"})
+        return _json_response(200)
+
+    def _bulk_delete_metadata(self, request: _MockRequest, endpoint: str) -> _MockResponse:
+        deleted = [self.metadata.get(endpoint, {}).pop(obj_id, None) is not None for obj_id in request.json()]
+        if not all(deleted):
+            return _json_response(404, {"error": "some objects were not found"})
+        return _json_response(204)
+
+    # attribute tree
+
+    def _get_attribute_tree(self, request: _MockRequest, project_id: str) -> _MockResponse:
+        tree = [
+            {
+                "id": obj["id"],
+                "internalColumnName": obj.get("internalName"),
+                "label": obj.get("displayName"),
+                "parentAttributeGroupInternalName": obj.get("parentAttributeGroupInternalName"),
+            }
+            for endpoint in ("AttributeGroup", "Columns")
+            for obj in self.get_objects(endpoint, project_id)
+        ]
+        return _json_response(200, tree)
+
+    def _move_attribute(self, request: _MockRequest, project_id: str) -> _MockResponse:
+        return _json_response(204)
+
+    def _couple_attributes(self, request: _MockRequest, project_id: str) -> _MockResponse:
+        return _json_response(200)
+
+    # queue and token vendor
+
+    def _create_task(self, request: _MockRequest, task_type: str) -> _MockResponse:
+        body = request.json() or {}
+        task_id = uuid.uuid4().hex
+        self.tasks[task_id] = {
+            "id": task_id,
+            "task_type": task_type,
+            "project_id": body.get("project_id"),
+            "records": self._count_records(body.get("s3_filepath")),
+            "submit_at": datetime.now(timezone.utc).isoformat(),
+            "finished_at": time.monotonic() + self.task_duration,
+        }
+        return _MockResponse(200, json.dumps(task_id).encode("utf-8"))
+
+    def _count_records(self, s3_filepath: str | None) -> int:
+        """
+        Number of data rows of an uploaded CSV file (without the header).
+        """
+        match = re.fullmatch(r"s3://([^/]+)/(.*)", s3_filepath or "")
+        data = self.s3_objects.get((match.group(1), match.group(2))) if match else None
+        if not data:
+            return 0
+        if data[:2] == b"\x1f\x8b":
+            data = gzip.decompress(data)
+        return max(0, data.count(b"\n") - 1)
+
+    def _get_task_runs(self, request: _MockRequest) -> _MockResponse:
+        body = request.json() or {}
+        page = int(body.get("page", 1))
+        page_size = int(body.get("page_size", 50))
+        now = time.monotonic()
+        tasks = sorted(self.tasks.values(), key=lambda task: task["submit_at"], reverse=True)
+        records = [
+            {
+                "id": task["id"],
+                "task_type": task["task_type"],
+                "project_id": task["project_id"],
+                "records": task["records"],
+                "submit_at": task["submit_at"],
+                "status": "finished" if now >= task["finished_at"] else "running",
+            }
+            for task in tasks[(page - 1) * page_size : page * page_size]
+        ]
+        return _json_response(200, {"records": records})
+
+    def _get_s3_credentials(self, request: _MockRequest) -> _MockResponse:
+        return _json_response(
+            200,
+            {
+                "accessKeyId": "mock-access-key",
+                "secretAccessKey": "mock-secret-key",
+                "sessionToken": "mock-session-token",
+                "expiration": (datetime.now(timezone.utc) + timedelta(hours=1)).isoformat(),
+            },
+        )
+
+    # S3 (path style: /<bucket>/<key>)
+
+    def _handle_s3(self, request: _MockRequest) -> _MockResponse:
+        bucket, _, key = request.path.lstrip("/").partition("/")
+        key = unquote(key)
+        upload_id = request.query.get("uploadId", [None])[0]
+
+        if request.method == "POST" and "uploads" in request.query:
+            upload_id = uuid.uuid4().hex
+            self._multipart_uploads[upload_id] = {}
+            return _xml_response(
+                "InitiateMultipartUploadResult",
+                {"Bucket": bucket, "Key": key, "UploadId": upload_id},
+            )
+        if request.method == "PUT" and upload_id:
+            if upload_id not in self._multipart_uploads:
+                return _s3_error(404, "NoSuchUpload")
+            data = _decode_s3_body(request)
+            self._multipart_uploads[upload_id][int(request.query["partNumber"][0])] = data
+            return _MockResponse(200, headers={"ETag": f'"{uuid.uuid4().hex}"'})
+        if request.method == "POST" and upload_id:
+            parts = self._multipart_uploads.pop(upload_id, None)
+            if parts is None:
+                return _s3_error(404, "NoSuchUpload")
+            self.s3_objects[(bucket, key)] = b"".join(parts[number] for number in sorted(parts))
+            return _xml_response(
+                "CompleteMultipartUploadResult",
+                {"Bucket": bucket, "Key": key, "ETag": f'"{uuid.uuid4().hex}"'},
+            )
+        if request.method == "DELETE" and upload_id:
+            self._multipart_uploads.pop(upload_id, None)
+            return _MockResponse(204)
+        if request.method == "PUT":
+            self.s3_objects[(bucket, key)] = _decode_s3_body(request)
+            return _MockResponse(200, headers={"ETag": f'"{uuid.uuid4().hex}"'})
+        if request.method in ("GET", "HEAD"):
+            data = self.s3_objects.get((bucket, key))
+            if data is None:
+                return _s3_error(404, "NoSuchKey")
+            return _MockResponse(200, data, content_type="application/octet-stream")
+        if request.method == "DELETE":
+            self.s3_objects.pop((bucket, key), None)
+            return _MockResponse(204)
+        return _s3_error(400, "NotImplemented")
+
+
+def _xml_response(root: str, values: dict[str, str]) -> _MockResponse:
+    elements = "".join(f"<{name}>{escape(str(value))}</{name}>" for name, value in values.items())
+    body = (
+        f'<?xml version="1.0" encoding="UTF-8"?>'
+        f'<{root} xmlns="http://s3.amazonaws.com/doc/2006-03-01/">{elements}</{root}>'
+    )
+    return _MockResponse(200, body.encode("utf-8"), content_type="application/xml")
+
+
+def _s3_error(status: int, code: str) -> _MockResponse:
+    body = f'<?xml version="1.0" encoding="UTF-8"?><Error><Code>{code}</Code><Message>{code}</Message></Error>'
+    return _MockResponse(status, body.encode("utf-8"), content_type="application/xml")
+
+
+def _decode_s3_body(request: _MockRequest) -> bytes:
+    """
+    Removes the aws-chunked encoding (chunk signatures, checksum trailers) boto3 may use for uploads.
+    """
+    if "aws-chunked" not in request.headers.get("content-encoding", "") and not request.headers.get(
+        "x-amz-decoded-content-length"
+    ):
+        return request.body
+    data, position = [], 0
+    while True:
+        line_end = request.body.index(b"\r\n", position)
+        size = int(request.body[position:line_end].split(b";")[0], 16)
+        if size == 0:
+            return b"".join(data)
+        data.append(request.body[line_end + 2 : line_end + 2 + size])
+        position = line_end + 2 + size + 2
+
+
+def _route(method: str, route: str, handler) -> tuple:
+    pattern = re.escape(route)
+    for name in ("endpoint", "id", "project_id", "name", "task_type"):
+        pattern = pattern.replace(re.escape(f"{{{name}}}"), f"(?P<{name}>[^/]+)")
+    pattern = pattern.replace(re.escape("{postfix}"), "(?P<postfix>(/[^/]+)?)")
+    return method, re.compile(pattern), route, handler
+
+
+# the more specific routes first
+_ROUTES = [
+    _route("GET", "/api/nemo-projects/projects", FOXMockNemoServer._get_projects),
+    _route("PUT", "/api/nemo-projects/projects/{id}", FOXMockNemoServer._update_project),
+    _route("PUT", "/api/nemo-persistence/ProjectProperty/project/{project_id}/{name}", FOXMockNemoServer._set_project_property),
+    _route("GET", "/api/nemo-persistence/focus/AttributeTree/projects/{project_id}/attributes", FOXMockNemoServer._get_attribute_tree),
+    _route("PUT", f"{_METADATA}/AttributeTree/projects/{{project_id}}/attributes/move", FOXMockNemoServer._move_attribute),
+    _route("POST", f"{_METADATA}/AttributeTree/projects/{{project_id}}/attributes/couple", FOXMockNemoServer._couple_attributes),
+    _route("POST", f"{_METADATA}/Project", FOXMockNemoServer._create_project),
+    _route("DELETE", f"{_METADATA}/Project/{{id}}", FOXMockNemoServer._delete_project),
+    _route("POST", f"{_METADATA}/{{endpoint}}/bulk/delete", FOXMockNemoServer._bulk_delete_metadata),
+    _route("POST", f"{_METADATA}/{{endpoint}}/bulk", FOXMockNemoServer._bulk_create_metadata),
+    _route("PUT", f"{_METADATA}/{{endpoint}}/bulk", FOXMockNemoServer._bulk_update_metadata),
+    _route("GET", f"{_METADATA}/{{endpoint}}/project/{{project_id}}{{postfix}}", FOXMockNemoServer._get_metadata),
+    _route("POST", f"{_METADATA}/{{endpoint}}", FOXMockNemoServer._create_metadata),
+    _route("PUT", f"{_METADATA}/{{endpoint}}/{{id}}", FOXMockNemoServer._update_metadata),
+    _route("DELETE", f"{_METADATA}/{{endpoint}}/{{id}}", FOXMockNemoServer._delete_metadata),
+    _route("POST", "/api/nemo-queue/{task_type}", FOXMockNemoServer._create_task),
+    _route("GET", "/api/nemo-queue/task_runs", FOXMockNemoServer._get_task_runs),
+    _route("GET", "/api/nemo-tokenvendor/InternalTokenVendor/sts/s3_policy", FOXMockNemoServer._get_s3_credentials),
+]
+
+
+class _MockRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # responses are small; without TCP_NODELAY every keep-alive request waits for the delayed ACK
+    disable_nagle_algorithm = True
+
+    def _read_body(self) -> bytes:
+        if "chunked" in self.headers.get("Transfer-Encoding", "").lower():
+            chunks = []
+            while True:
+                size = int(self.rfile.readline().split(b";")[0], 16)
+                if size == 0:
+                    # trailers end with an empty line
+                    while self.rfile.readline() not in (b"\r\n", b"\n", b""):
+                        pass
+                    return b"".join(chunks)
+                chunks.append(self.rfile.read(size))
+                self.rfile.readline()
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def _dispatch(self) -> None:
+        url = urlsplit(self.path)
+        request = _MockRequest(
+            method=self.command,
+            path=url.path,
+            query=parse_qs(url.query, keep_blank_values=True),
+            headers={name.lower(): value for name, value in self.headers.items()},
+            body=self._read_body(),
+        )
+        response = self.server.mock._handle(request)
+        self.send_response(response.status)
+        self.send_header("Content-Type", response.content_type)
+        for name, value in response.headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(response.body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(response.body)
+
+    do_GET = do_POST = do_PUT = do_DELETE = do_HEAD = _dispatch
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+class FOXTrafficRecorder:
+    """
+    Records the requests sent through the shared HTTP session (foxhttp.get_session) of a real
+    import, to replay them later with FOXMockNemoServer(replay=...). Requests of boto3 (S3) and of
+    nemo_library functions do not use that session and are not recorded.
+
+        with FOXTrafficRecorder("import.jsonl"):
+            ReUploadFile(config, projectname, filename)
+    """
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        self.entries: list[dict] = []
+        self._lock = threading.Lock()
+        self._session = None
+
+    def __enter__(self) -> "FOXTrafficRecorder":
+        from nemo_library_fox_reader.foxhttp import get_session
+
+        self._session = get_session()
+        self._session.hooks["response"].append(self._record)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._session.hooks["response"].remove(self._record)
+        self.save()
+
+    def _record(self, response, *args, **kwargs):
+        url = urlsplit(response.request.url)
+        entry = {
+            "method": response.request.method,
+            "path": url.path,
+            "query": url.query,
+            "status": response.status_code,
+            "content_type": response.headers.get("Content-Type", "application/json"),
+            "response": response.text,
+            "elapsed": response.elapsed.total_seconds(),
+        }
+        with self._lock:
+            self.entries.append(entry)
+        return response
+
+    def save(self) -> None:
+        with self._lock, open(self.filename, "w", encoding="utf-8") as f:
+            for entry in self.entries:
+                f.write(json.dumps(entry) + "\n")
+
+
+def load_recording(filename: str) -> list[dict]:
+    """
+    Reads traffic recorded by FOXTrafficRecorder.
+    """
+    with open(filename, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def register_mock_bulk_endpoints(endpoints: list[str] | None = None, max_objects: int = 500) -> None:
+    """
+    Registers the bulk endpoints of the mock server (MOCK_BULK_ENDPOINT_PATHS) with the persistence API.
+    Only for measurements against FOXMockNemoServer(bulk_endpoints=True); NEMO has no such endpoints.
+    """
+    from nemo_library_fox_reader.foxnemo_persistence_api import FOXBulkEndpoint, registerBulkEndpoint
+
+    for endpoint in endpoints or ["Columns", "AttributeGroup", "AttributeLink"]:
+        for operation, (method, path) in MOCK_BULK_ENDPOINT_PATHS.items():
+            registerBulkEndpoint(
+                endpoint,
+                operation,
+                FOXBulkEndpoint(method=method, path=path.format(endpoint=endpoint), max_objects=max_objects),
+            )
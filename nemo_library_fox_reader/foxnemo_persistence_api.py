@@ -1,11 +1,21 @@
+import contextvars
 import json
 import logging
 import re
-from typing import Any, Type, TypeVar, get_type_hints
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Callable, Type, TypeVar, get_type_hints
+from urllib.parse import urlencode
 
 import requests
 
 
+
 from nemo_library.model.application import Application
 from nemo_library.model.attribute_group import AttributeGroup
 from nemo_library.model.attribute_link import AttributeLink
@@ -24,34 +34,151 @@ from nemo_library.utils.config import Config
 from nemo_library.utils.utils import FilterType, FilterValue, log_error
 from nemo_library_fox_reader.models.couple_attributes_request import CoupleAttributesRequest
 from nemo_library_fox_reader.foxprogressmanager import FOXProgressManager
+from nemo_library_fox_reader.foxhttp import get_session
+from nemo_library_fox_reader.foxmetadatasnapshot import FOXMetadataSnapshot
 
 
 T = TypeVar("T")
 
 
+@dataclass
+class _ProjectIDCacheEntry:
+    ids: dict[str, str]
+    expires_at: float | None
+
+
+# project IDs by display name per NEMO environment and tenant, see getProjectID
+_project_id_cache: dict[tuple[str, str], _ProjectIDCacheEntry] = {}
+_project_id_cache_lock = threading.Lock()
+_project_id_cache_ttl: float | None = 300.0
+
+
+@dataclass
+class _ListResponseCacheEntry:
+    etag: str
+    text: str
+    # memory taken by the body (sys.getsizeof)
+    size: int
+
+
+# bodies of list requests (metadata objects, projects) and their ETag by URL, tenant and user, see _get_list.
+# The cache is shared by all threads and the asyncio client and holds at most _list_response_cache_max_bytes
+# of bodies, the least recently used are dropped first (see setListResponseCacheSize)
+_list_response_cache: OrderedDict[tuple[str, str, str], _ListResponseCacheEntry] = OrderedDict()
+_list_response_cache_lock = threading.Lock()
+_list_response_cache_bytes = 0
+_list_response_cache_max_bytes = 64 * 1024 * 1024
+
+# create, update and delete requests of metadata objects sent at the same time, see setMetadataRequestParallelism
+_metadata_max_parallel_requests = 8
+
+
+@dataclass
+class FOXBulkEndpoint:
+    """
+    A metadata endpoint of NEMO that creates, updates or deletes many objects in one request.
+    The body is a JSON list: the objects (create, update) or their IDs (delete).
+    """
+
+    method: str
+    # relative to /api/nemo-persistence/metadata/, e.g. "Columns/bulk"
+    path: str
+    # objects per request, larger lists are sent in chunks
+    max_objects: int = 500
+    expected_status_codes: tuple[int, ...] = (200, 201, 204)
+
+
+_BULK_OPERATIONS = ("create", "update", "delete")
+
+# bulk endpoints by metadata endpoint and operation, see registerBulkEndpoint
+_bulk_endpoints: dict[tuple[str, str], FOXBulkEndpoint] = {}
+
+
 def _deserializeMetaDataObject(value: Any, target_type: Type) -> Any:
     """
     Recursively deserializes JSON data into a nested DataClass structure.
+    The decoder of a target type is built once and reused, see _get_decoder.
     """
-    if isinstance(value, list):
-        # Check if we expect a list of DataClasses
-        if hasattr(target_type, "__origin__") and target_type.__origin__ is list:
-            element_type = target_type.__args__[0]
-            return [_deserializeMetaDataObject(v, element_type) for v in value]
-        return value  # Regular list without DataClasses
-    elif isinstance(value, dict):
-        # Check if the target type is a DataClass
-        if hasattr(target_type, "__annotations__"):
-            field_types = get_type_hints(target_type)
-            return target_type(
-                **{
-                    key: _deserializeMetaDataObject(value[key], field_types[key])
-                    for key in value
-                    if key in field_types
-                }
-            )
-        return value  # Regular dictionary
-    return value  # Primitive values
+    return _get_decoder(target_type)(value)
+
+
+# decoders by target type, see _get_decoder
+_decoders: dict[Any, Callable[[Any], Any]] = {}
+
+
+def _get_decoder(target_type: Any) -> Callable[[Any], Any]:
+    """
+    Returns the function converting JSON data into target_type. The type hints of a DataClass
+    are read once, when its decoder is built, instead of for every object.
+    """
+    try:
+        return _decoders[target_type]
+    except KeyError:
+        decoder = _decoders[target_type] = _build_decoder(target_type)
+        return decoder
+    except TypeError:
+        # unhashable type annotation
+        return _build_decoder(target_type)
+
+
+def _is_list_type(target_type: Any) -> bool:
+    return getattr(target_type, "__origin__", None) is list
+
+
+def _is_plain_type(target_type: Any) -> bool:
+    """
+    True if values of the type are taken over as they are (no list of DataClasses, no DataClass).
+    """
+    return not _is_list_type(target_type) and not hasattr(target_type, "__annotations__")
+
+
+def _build_decoder(target_type: Any) -> Callable[[Any], Any]:
+    if _is_list_type(target_type):
+        # a list of DataClasses
+        element_type = target_type.__args__[0]
+        if _is_plain_type(element_type):
+
+            def decode_list(value: Any) -> Any:
+                return list(value) if isinstance(value, list) else value
+
+        else:
+
+            def decode_list(value: Any) -> Any:
+                if not isinstance(value, list):
+                    return value
+                element_decoder = _get_decoder(element_type)
+                return [element_decoder(v) for v in value]
+
+        return decode_list
+
+    if hasattr(target_type, "__annotations__"):
+        # a DataClass: fields with plain values are passed as they are, the others are decoded.
+        # Nested decoders are looked up when they are used, so recursive types work
+        field_types = get_type_hints(target_type)
+        plain_fields = frozenset(key for key, field_type in field_types.items() if _is_plain_type(field_type))
+        nested_fields = {key: field_type for key, field_type in field_types.items() if key not in plain_fields}
+
+        def decode_dataclass(value: Any) -> Any:
+            if not isinstance(value, dict):
+                return value
+            if not nested_fields:
+                return target_type(**{key: item for key, item in value.items() if key in plain_fields})
+            kwargs = {}
+            for key, item in value.items():
+                if key in plain_fields:
+                    kwargs[key] = item
+                elif key in nested_fields:
+                    kwargs[key] = _get_decoder(nested_fields[key])(item)
+            return target_type(**kwargs)
+
+        return decode_dataclass
+
+    # primitive values and regular dictionaries
+    return _identity
+
+
+def _identity(value: Any) -> Any:
+    return value
 
 
 def _generic_metadata_create_or_update(
@@ -60,6 +187,7 @@ def _generic_metadata_create_or_update(
     objects: list[T],
     endpoint: str,
     get_existing_func,
+    max_parallel_requests: int | None = None,
 ) -> None:
     """
     Generic function to create or update metadata entries.
@@ -68,92 +196,307 @@ def _generic_metadata_create_or_update(
     :param projectname: Name of the project
     :param objects: List of objects to create or update
     :param endpoint: API endpoint (e.g., "Tiles" or "Pages")
-    :param get_existing_func: Function to check if an object already exists
+    :param get_existing_func: Function returning the existing objects of the project
+    :param max_parallel_requests: Number of requests sent at the same time (see setMetadataRequestParallelism)
+
+    Objects whose parent attribute group is created in the same call are sent after their parent.
+    Objects with the same internal name are sent one after the other, so the later ones update the first.
+    If a bulk endpoint is registered for creates or updates (see registerBulkEndpoint), the other
+    objects of a wave are sent to it in chunks.
+    All objects are tried; failed requests are reported together at the end.
+    The active FOXMetadataSnapshot of the project is updated with the created and updated objects.
     """
 
     # Initialize request
     headers = config.connection_get_headers()
     project_id = getProjectID(config, projectname)
     params = {"translationHandling": "UseAuxiliaryTranslationFields"}
+    snapshot = FOXMetadataSnapshot.current(config, projectname)
+
+    # the existing objects are read once (or taken from the snapshot) and looked up by internal name
+    existing_objects = _index_by_internal_name(get_existing_func(config=config, projectname=projectname))
+
+    def _create_or_update(same_name_objects: list[T]) -> None:
+        existing_object = existing_objects.get(same_name_objects[0].internalName, [])
+        for i, obj in enumerate(same_name_objects):
+            # logging.info(
+            #     f"Create/update {endpoint[:-1] if endpoint.endswith("s") else endpoint} '{obj.displayName if hasattr(obj, 'displayName') else obj.internalName}'"
+            # )
+
+            obj.tenant = config.get_tenant()
+            obj.projectId = project_id
+
+            if i > 0:
+                # the object was sent before in this call, so it has to be read again to get its id
+                existing_object = _index_by_internal_name(
+                    get_existing_func(config=config, projectname=projectname)
+                ).get(obj.internalName, [])
+
+            if len(existing_object) == 1:
+                # Update existing object
+                obj.id = existing_object[0].id
+                obj_as_json = obj.to_dict()
+                response = get_session().put(
+                    f"{config.get_config_nemo_url()}/api/nemo-persistence/metadata/{endpoint}/{obj.id}",
+                    json=obj_as_json,
+                    headers=headers,
+                    params=params,
+                )
+                _record_in_snapshot(snapshot, endpoint, response, [obj_as_json])
+                # if response.status_code != 200:
+                #     log_error(
+                #         f"PUT Request failed.\nURL: {f"{config.get_config_nemo_url()}/api/nemo-persistence/metadata/{endpoint}/{obj.id}"}\nobject: {json.dumps(obj.to_dict())}\nStatus: {response.status_code}, error: {response.text}"
+                #     )
+
+            else:
+                # Create new object
+                url = f"{config.get_config_nemo_url()}/api/nemo-persistence/metadata/{endpoint}"
+                obj_as_json = obj.to_dict()
+                response = get_session().post(
+                    url,
+                    json=obj_as_json,
+                    headers=headers,
+                    params=params,
+                )
+                _record_in_snapshot(snapshot, endpoint, response, [obj_as_json])
+                try:
+                    internal_name = obj.internalName
+                    logging.info(f"Persistence API POST Endpoint: {endpoint}  {internal_name}  Status: {response.status_code}")
+                except Exception as e:
+                    pass
+                # if response.status_code != 201:
+                #     log_error(
+                #         f"POST Request failed.\nURL: {f"{config.get_config_nemo_url()}/api/nemo-persistence/metadata/{endpoint}"}\nobject: {json.dumps(obj.to_dict())}\nStatus: {response.status_code}, error: {response.text}"
+                #     )
+
+    errors = []
+    for wave in _dependency_waves(objects):
+        requests_to_run = []
+        bulk_objects: dict[str, list[T]] = {"create": [], "update": []}
+        for same_name_objects in wave:
+            existing_object = existing_objects.get(same_name_objects[0].internalName, [])
+            operation = "update" if len(existing_object) == 1 else "create"
+            if len(same_name_objects) == 1 and (endpoint, operation) in _bulk_endpoints:
+                obj = same_name_objects[0]
+                obj.tenant = config.get_tenant()
+                obj.projectId = project_id
+                if operation == "update":
+                    obj.id = existing_object[0].id
+                bulk_objects[operation].append(obj)
+            else:
+                requests_to_run.append(
+                    (f"{endpoint} {same_name_objects[0].internalName}", partial(_create_or_update, same_name_objects))
+                )
+        for operation, objs in bulk_objects.items():
+            requests_to_run.extend(
+                _bulk_requests(config, headers, endpoint, operation, [obj.to_dict() for obj in objs], snapshot)
+            )
+        errors.extend(_run_metadata_requests(requests_to_run, max_parallel_requests))
+
+    if errors:
+        log_error(f"Create/update of {len(errors)} {endpoint} failed:\n" + "\n".join(errors))
+
+
+def _record_in_snapshot(
+    snapshot: FOXMetadataSnapshot | None,
+    endpoint: str,
+    response: requests.Response,
+    sent_objects: list[dict],
+) -> None:
+    """
+    Puts the objects of a successful create or update request into the snapshot: the objects NEMO
+    returned, or the objects sent if they carry their id (updates). Otherwise the snapshot of the
+    endpoint cannot be kept up to date and is invalidated.
+    """
+    if snapshot is None:
+        return
+    if response.status_code not in (200, 201):
+        snapshot.invalidate(endpoint)
+        return
+    try:
+        returned = response.json() if response.text else None
+    except ValueError:
+        returned = None
+    if isinstance(returned, dict):
+        returned = [returned]
+    if (
+        isinstance(returned, list)
+        and len(returned) == len(sent_objects)
+        and all(isinstance(obj, dict) and obj.get("id") for obj in returned)
+    ):
+        snapshot.put(endpoint, returned)
+    elif all(obj.get("id") for obj in sent_objects):
+        snapshot.put(endpoint, sent_objects)
+    else:
+        snapshot.invalidate(endpoint)
+
+
+def _index_by_internal_name(objects: list[T]) -> dict[str, list[T]]:
+    index: dict[str, list[T]] = {}
     for obj in objects:
-        # logging.info(
-        #     f"Create/update {endpoint[:-1] if endpoint.endswith("s") else endpoint} '{obj.displayName if hasattr(obj, 'displayName') else obj.internalName}'"
-        # )
+        index.setdefault(getattr(obj, "internalName", None) or "", []).append(obj)
+    return index
 
-        obj.tenant = config.get_tenant()
-        obj.projectId = project_id
 
-        # Check if the object already exists
-        existing_object = get_existing_func(
-            config=config,
-            projectname=projectname,
-            filter=obj.internalName,
-            filter_type=FilterType.EQUAL,
-            filter_value=FilterValue.INTERNALNAME,
-        )
+def _dependency_waves(objects: list[T]) -> list[list[list[T]]]:
+    """
+    Groups the objects by internal name and sorts the groups into waves: a group depends on the group
+    of its parent attribute group (if that is in the list too) and is put into a later wave.
+    The groups of a wave do not depend on each other and can be sent at the same time.
+    """
+    groups = _index_by_internal_name(objects)
+    depths: dict[str, int] = {}
+
+    def _depth(internal_name: str, visiting: set[str]) -> int:
+        if internal_name in depths:
+            return depths[internal_name]
+        parent = getattr(groups[internal_name][0], "parentAttributeGroupInternalName", None)
+        depth = 0
+        if parent and parent != internal_name and parent in groups and parent not in visiting:
+            depth = _depth(parent, visiting | {internal_name}) + 1
+        depths[internal_name] = depth
+        return depth
+
+    waves: list[list[list[T]]] = []
+    for internal_name, same_name_objects in groups.items():
+        depth = _depth(internal_name, set())
+        while len(waves) <= depth:
+            waves.append([])
+        waves[depth].append(same_name_objects)
+    return waves
+
+
+def _bulk_requests(
+    config: Config,
+    headers: dict,
+    endpoint: str,
+    operation: str,
+    payloads: list,
+    snapshot: FOXMetadataSnapshot | None = None,
+) -> list[tuple[str, Callable[[], None]]]:
+    """
+    Returns one request per chunk of payloads for the bulk endpoint of the operation.
+    The snapshot, if any, is updated with the objects of the successful requests.
+    """
+    if not payloads:
+        return []
+    bulk_endpoint = _bulk_endpoints[(endpoint, operation)]
+    url = f"{config.get_config_nemo_url()}/api/nemo-persistence/metadata/{bulk_endpoint.path}"
+    chunk_size = max(1, bulk_endpoint.max_objects)
 
-        if len(existing_object) == 1:
-            # Update existing object
-            obj.id = existing_object[0].id
-            response = requests.put(
-                f"{config.get_config_nemo_url()}/api/nemo-persistence/metadata/{endpoint}/{obj.id}",
-                json=obj.to_dict(),
-                headers=headers,
-                params=params,
+    def _send(chunk: list) -> None:
+        response = get_session().request(
+            bulk_endpoint.method,
+            url,
+            json=chunk,
+            headers=headers,
+            params={"translationHandling": "UseAuxiliaryTranslationFields"},
+        )
+        if response.status_code not in bulk_endpoint.expected_status_codes:
+            if snapshot is not None:
+                snapshot.invalidate(endpoint)
+            raise ValueError(
+                f"{bulk_endpoint.method} Request failed.\nURL: {url}\nStatus: {response.status_code}, error: {response.text}"
             )
-            # if response.status_code != 200:
-            #     log_error(
-            #         f"PUT Request failed.\nURL: {f"{config.get_config_nemo_url()}/api/nemo-persistence/metadata/{endpoint}/{obj.id}"}\nobject: {json.dumps(obj.to_dict())}\nStatus: {response.status_code}, error: {response.text}"
-            #     )
+        if snapshot is not None:
+            if operation == "delete":
+                snapshot.remove(endpoint, chunk)
+            else:
+                _record_in_snapshot(snapshot, endpoint, response, chunk)
+
+    return [
+        (
+            f"{endpoint} {operation} of objects {start + 1}-{start + len(payloads[start:start + chunk_size])}",
+            partial(_send, payloads[start:start + chunk_size]),
+        )
+        for start in range(0, len(payloads), chunk_size)
+    ]
 
-        else:
-            # Create new object
-            url = f"{config.get_config_nemo_url()}/api/nemo-persistence/metadata/{endpoint}"
-            obj_as_json = obj.to_dict()
-            response = requests.post(
-                url,
-                json=obj_as_json,
-                headers=headers,
-                params=params,
-            )
+
+def _run_metadata_requests(
+    requests_to_run: list[tuple[str, Callable[[], None]]],
+    max_parallel_requests: int | None = None,
+) -> list[str]:
+    """
+    Runs independent requests, up to max_parallel_requests at the same time.
+    Returns the errors of the failed requests; a failed request does not stop the others.
+    """
+    max_parallel_requests = max_parallel_requests or _metadata_max_parallel_requests
+    errors = []
+    if max_parallel_requests <= 1 or len(requests_to_run) <= 1:
+        for description, request in requests_to_run:
             try:
-                internal_name = obj.internalName
-                logging.info(f"Persistence API POST Endpoint: {endpoint}  {internal_name}  Status: {response.status_code}")
+                request()
             except Exception as e:
-                pass
-            # if response.status_code != 201:
-            #     log_error(
-            #         f"POST Request failed.\nURL: {f"{config.get_config_nemo_url()}/api/nemo-persistence/metadata/{endpoint}"}\nobject: {json.dumps(obj.to_dict())}\nStatus: {response.status_code}, error: {response.text}"
-            #     )
+                errors.append(f"{description}: {e}")
+        return errors
+
+    with ThreadPoolExecutor(
+        max_workers=min(max_parallel_requests, len(requests_to_run)),
+        thread_name_prefix="nemo-metadata",
+    ) as executor:
+        futures = {
+            executor.submit(contextvars.copy_context().run, request): description
+            for description, request in requests_to_run
+        }
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                errors.append(f"{futures[future]}: {e}")
+    return errors
 
 
-def _generic_metadata_delete(config: Config, ids: list[str], endpoint: str) -> None:
+def _generic_metadata_delete(
+    config: Config,
+    ids: list[str],
+    endpoint: str,
+    max_parallel_requests: int | None = None,
+) -> None:
     """
     Generic function to delete metadata entries.
 
     :param config: Configuration containing connection details
     :param ids: List of IDs to be deleted
     :param endpoint: API endpoint (e.g., "Metrics" or "Columns")
+    :param max_parallel_requests: Number of requests sent at the same time (see setMetadataRequestParallelism)
+
+    The IDs are sent in chunks if a bulk endpoint is registered (see registerBulkEndpoint).
+    All IDs are tried; failed requests are reported together at the end.
+    The deleted objects are removed from the active FOXMetadataSnapshot.
     """
 
     # Initialize request
     headers = config.connection_get_headers()
+    snapshot = FOXMetadataSnapshot.current(config)
 
-    for obj_id in ids:
+    def _delete(obj_id: str) -> None:
         # logging.info(
         #     f"Deleting {endpoint[:-1] if endpoint.endswith("s") else endpoint} with ID {obj_id}"
         # )
 
-        response = requests.delete(
+        response = get_session().delete(
             f"{config.get_config_nemo_url()}/api/nemo-persistence/metadata/{endpoint}/{obj_id}",
             headers=headers,
             params={"translationHandling": "UseAuxiliaryTranslationFields"},
         )
 
         if response.status_code != 204:
-            log_error(
+            if snapshot is not None:
+                snapshot.invalidate(endpoint)
+            raise ValueError(
                 f"DELETE Request failed.\nURL: {f"{config.get_config_nemo_url()}/api/nemo-persistence/metadata/{endpoint}/{obj_id}"}\nStatus: {response.status_code}, error: {response.text}"
             )
+        if snapshot is not None:
+            snapshot.remove(endpoint, [obj_id])
+
+    if (endpoint, "delete") in _bulk_endpoints:
+        requests_to_run = _bulk_requests(config, headers, endpoint, "delete", list(ids), snapshot)
+    else:
+        requests_to_run = [(f"{endpoint} {obj_id}", partial(_delete, obj_id)) for obj_id in ids]
+    errors = _run_metadata_requests(requests_to_run, max_parallel_requests)
+    if errors:
+        log_error(f"Delete of {len(errors)} {endpoint} failed:\n" + "\n".join(errors))
 
 
 def _generic_metadata_get(
@@ -177,51 +520,166 @@ def _generic_metadata_get(
     :param filter_type: Type of filter (EQUAL, STARTSWITH, etc.)
     :param filter_value: The attribute to filter on (e.g., DISPLAYNAME)
     :return: A list of objects of the specified return_type
+
+    While a FOXMetadataSnapshot of the project is active, the objects are taken from it.
     """
 
+    snapshot = FOXMetadataSnapshot.current(config, projectname)
+    if snapshot is not None:
+        data = snapshot.get_objects(
+            endpoint, partial(_get_metadata_list, config, projectname, endpoint, endpoint_postfix)
+        )
+    else:
+        data = _get_metadata_list(config, projectname, endpoint, endpoint_postfix)
+
+    # Apply filter to the data
+    filtered_data = _filter_items(data, filter, filter_type, filter_value)
+
+    return [_deserializeMetaDataObject(item, return_type) for item in filtered_data]
+
+
+def _get_metadata_list(
+    config: Config, projectname: str, endpoint: str, endpoint_postfix: str
+) -> list[dict]:
     # Initialize request
-    headers = config.connection_get_headers()
     project_id = getProjectID(config, projectname)
     params = {"translationHandling": "UseAuxiliaryTranslationFields"}
 
-    response = requests.get(
+    # the persistence API has no filter parameters, the list is filtered below. Unchanged lists are
+    # not downloaded again, see _get_list
+    status_code, text = _get_list(
+        config,
         f"{config.get_config_nemo_url()}/api/nemo-persistence/metadata/{endpoint}/project/{project_id}{endpoint_postfix}",
-        headers=headers,
         params=params,
     )
 
-    if response.status_code != 200:
+    if status_code != 200:
         log_error(
-            f"GET Request failed.\nURL:{f"{config.get_config_nemo_url()}/api/nemo-persistence/metadata/{endpoint}/project/{project_id}{endpoint_postfix}"}\nStatus: {response.status_code}, error: {response.text}"
+            f"GET Request failed.\nURL:{f"{config.get_config_nemo_url()}/api/nemo-persistence/metadata/{endpoint}/project/{project_id}{endpoint_postfix}"}\nStatus: {status_code}, error: {text}"
         )
         return []
 
-    data = json.loads(response.text)
+    return json.loads(text)
 
-    def match_filter(value: str, filter: str, filter_type: FilterType) -> bool:
-        """Applies the given filter to the value."""
-        if filter == "*":
-            return True
-        elif filter_type == FilterType.EQUAL:
-            return value == filter
-        elif filter_type == FilterType.STARTSWITH:
-            return value.startswith(filter)
-        elif filter_type == FilterType.ENDSWITH:
-            return value.endswith(filter)
-        elif filter_type == FilterType.CONTAINS:
-            return filter in value
-        elif filter_type == FilterType.REGEX:
-            return re.search(filter, value) is not None
-        return False
 
-    # Apply filter to the data
-    filtered_data = [
-        item
-        for item in data
-        if match_filter(item.get(filter_value.value, ""), filter, filter_type)
-    ]
+def _get_list(config: Config, url: str, params: dict | None = None) -> tuple[int, str]:
+    """
+    Sends a GET request for a list of objects and returns status code and body. Bodies with an ETag
+    are cached and revalidated with If-None-Match, so a list that has not changed since the last
+    request is not downloaded again (304 Not Modified returns the cached body with status 200).
+    The cache holds 64 MB of bodies by default, see setListResponseCacheSize.
+    """
+    key, headers, entry = _prepare_list_request(config, url, params)
+    response = get_session().get(url, headers=headers, params=params)
+    return _handle_list_response(key, entry, response.status_code, response.headers.get("ETag"), response.text)
 
-    return [_deserializeMetaDataObject(item, return_type) for item in filtered_data]
+
+def _prepare_list_request(
+    config: Config, url: str, params: dict | None
+) -> tuple[tuple[str, str, str], dict, _ListResponseCacheEntry | None]:
+    """
+    Returns the cache key, the headers (with If-None-Match if the body is cached) and the cached
+    entry of a list request. Shared with the asyncio client, see _get_list.
+    """
+    headers = config.connection_get_headers()
+    key = (
+        f"{url}?{urlencode(params)}" if params else url,
+        config.get_tenant(),
+        config.get_userid(),
+    )
+    with _list_response_cache_lock:
+        entry = _list_response_cache.get(key)
+    if entry is not None:
+        headers = {**headers, "If-None-Match": entry.etag}
+    return key, headers, entry
+
+
+def _handle_list_response(
+    key: tuple[str, str, str],
+    entry: _ListResponseCacheEntry | None,
+    status_code: int,
+    etag: str | None,
+    text: str,
+) -> tuple[int, str]:
+    """
+    Caches the body of a list response and returns status code and body, see _get_list.
+    """
+    global _list_response_cache_bytes
+    with _list_response_cache_lock:
+        if status_code == 304 and entry is not None:
+            if key in _list_response_cache:
+                _list_response_cache.move_to_end(key)
+            return 200, entry.text
+        previous = _list_response_cache.pop(key, None)
+        if previous is not None:
+            _list_response_cache_bytes -= previous.size
+        size = sys.getsizeof(text)
+        # a body larger than the whole cache is not kept, it would only push out all others
+        if status_code == 200 and etag and size <= _list_response_cache_max_bytes:
+            _list_response_cache[key] = _ListResponseCacheEntry(etag=etag, text=text, size=size)
+            _list_response_cache_bytes += size
+            _evict_list_responses()
+    return status_code, text
+
+
+def _evict_list_responses() -> None:
+    """
+    Drops the least recently used bodies until the cache fits into its size. Call with the lock held.
+    """
+    global _list_response_cache_bytes
+    while _list_response_cache and _list_response_cache_bytes > _list_response_cache_max_bytes:
+        _, entry = _list_response_cache.popitem(last=False)
+        _list_response_cache_bytes -= entry.size
+
+
+def clearListResponseCache() -> None:
+    """
+    Clears the cached project and metadata lists. They are revalidated with the server on every
+    request anyway, clearing them only frees the memory.
+    """
+    global _list_response_cache_bytes
+    with _list_response_cache_lock:
+        _list_response_cache.clear()
+        _list_response_cache_bytes = 0
+
+
+def setListResponseCacheSize(max_bytes: int) -> None:
+    """
+    Sets the memory (in bytes) the cached project and metadata lists may take, 64 MB by default.
+    The least recently used lists are dropped first, 0 turns the cache off.
+    """
+    global _list_response_cache_max_bytes
+    with _list_response_cache_lock:
+        _list_response_cache_max_bytes = max(0, max_bytes)
+        _evict_list_responses()
+
+
+def _compile_filter(filter: str, filter_type: FilterType) -> Callable[[str], bool]:
+    """Returns a function that applies the given filter to a value. Regular expressions are compiled once."""
+    if filter == "*":
+        return lambda value: True
+    elif filter_type == FilterType.EQUAL:
+        return lambda value: value == filter
+    elif filter_type == FilterType.STARTSWITH:
+        return lambda value: value.startswith(filter)
+    elif filter_type == FilterType.ENDSWITH:
+        return lambda value: value.endswith(filter)
+    elif filter_type == FilterType.CONTAINS:
+        return lambda value: filter in value
+    elif filter_type == FilterType.REGEX:
+        pattern = re.compile(filter)
+        return lambda value: pattern.search(value) is not None
+    return lambda value: False
+
+
+def _filter_items(
+    data: list[dict], filter: str, filter_type: FilterType, filter_value: FilterValue
+) -> list[dict]:
+    if filter == "*":
+        return list(data)
+    match = _compile_filter(filter, filter_type)
+    key = filter_value.value
+    return [item for item in data if match(item.get(key, ""))]
 
 
 def getProjectID(
@@ -243,18 +701,93 @@ def getProjectID(
 
     Notes:
         - This function relies on the `getProjects` function to fetch the full project list.
-        - If multiple or no entries match the given project name, an error is logged, and the first matching ID is returned.
+        - If multiple or no entries match the given project name, None is returned.
+        - The IDs of all projects are cached after the first lookup (see setProjectIDCacheTTL).
+          createProjects and deleteProjects clear the cache; call clearProjectIDCache if projects
+          are changed by other means.
     """
-    projects = getProjects(
-        config,
-        filter=projectname,
-        filter_type=FilterType.EQUAL,
-        filter_value=FilterValue.DISPLAYNAME,
-    )
-    if len(projects) != 1:
-        return None
+    found, project_id = _get_cached_project_id(config, projectname)
+    if found:
+        return project_id
+    # unknown names are looked up again, the project may have been created in the meantime
+    return _cache_project_ids(config, getProjects(config)).get(projectname)
+
+
+def _get_cached_project_id(config: Config, projectname: str) -> tuple[bool, str | None]:
+    key = (config.get_config_nemo_url(), config.get_tenant())
+    with _project_id_cache_lock:
+        entry = _project_id_cache.get(key)
+        if entry is not None and (entry.expires_at is None or time.monotonic() < entry.expires_at):
+            if projectname in entry.ids:
+                return True, entry.ids[projectname]
+    return False, None
 
-    return projects[0].id
+
+def _cache_project_ids(config: Config, projects: list[Project]) -> dict[str, str]:
+    """
+    Caches the IDs of all projects by display name. Names used by more than one project are left out.
+    """
+    ids: dict[str, str] = {}
+    ambiguous_names = set()
+    for project in projects:
+        if project.displayName in ids:
+            ambiguous_names.add(project.displayName)
+        ids[project.displayName] = project.id
+    for name in ambiguous_names:
+        del ids[name]
+
+    with _project_id_cache_lock:
+        _project_id_cache[(config.get_config_nemo_url(), config.get_tenant())] = _ProjectIDCacheEntry(
+            ids=ids,
+            expires_at=None if _project_id_cache_ttl is None else time.monotonic() + _project_id_cache_ttl,
+        )
+    return ids
+
+
+def clearProjectIDCache(config: Config | None = None) -> None:
+    """
+    Clears the cached project IDs of the NEMO environment and tenant of config, or all of them.
+    """
+    with _project_id_cache_lock:
+        if config is None:
+            _project_id_cache.clear()
+        else:
+            _project_id_cache.pop((config.get_config_nemo_url(), config.get_tenant()), None)
+
+
+def setMetadataRequestParallelism(max_parallel_requests: int) -> None:
+    """
+    Sets the number of create, update and delete requests of metadata objects sent at the same time,
+    unless a call passes max_parallel_requests itself. 1 sends them one after the other.
+    """
+    global _metadata_max_parallel_requests
+    _metadata_max_parallel_requests = max(1, max_parallel_requests)
+
+
+def registerBulkEndpoint(
+    endpoint: str, operation: str, bulk_endpoint: FOXBulkEndpoint | None
+) -> None:
+    """
+    Registers (or removes, if bulk_endpoint is None) a bulk endpoint for an operation ("create", "update"
+    or "delete") of a metadata endpoint (e.g. "Columns"). The create and delete functions of that
+    endpoint then send their objects in chunks of bulk_endpoint.max_objects instead of one request
+    per object. Without a bulk endpoint the objects are sent one by one, max_parallel_requests at a time.
+    """
+    if operation not in _BULK_OPERATIONS:
+        raise ValueError(f"Unknown bulk operation '{operation}'. Must be one of {list(_BULK_OPERATIONS)}")
+    if bulk_endpoint is None:
+        _bulk_endpoints.pop((endpoint, operation), None)
+    else:
+        _bulk_endpoints[(endpoint, operation)] = bulk_endpoint
+
+
+def setProjectIDCacheTTL(ttl: float | None) -> None:
+    """
+    Sets the number of seconds the project IDs are cached. None caches them until the cache is cleared.
+    """
+    global _project_id_cache_ttl
+    _project_id_cache_ttl = ttl
+    clearProjectIDCache()
 
 
 def getAttributeGroups(
@@ -470,67 +1003,93 @@ def getVariances(
     )
 
 
-def deleteColumns(config: Config, columns: list[str]) -> None:
+def deleteColumns(
+    config: Config, columns: list[str], max_parallel_requests: int | None = None
+) -> None:
     """Deletes a list of Columns by their IDs."""
-    _generic_metadata_delete(config, columns, "Columns")
+    _generic_metadata_delete(config, columns, "Columns", max_parallel_requests)
 
 
-def deleteMetrics(config: Config, metrics: list[str]) -> None:
+def deleteMetrics(
+    config: Config, metrics: list[str], max_parallel_requests: int | None = None
+) -> None:
     """Deletes a list of Metrics by their IDs."""
-    _generic_metadata_delete(config, metrics, "Metrics")
+    _generic_metadata_delete(config, metrics, "Metrics", max_parallel_requests)
 
 
-def deleteTiles(config: Config, tiles: list[str]) -> None:
+def deleteTiles(
+    config: Config, tiles: list[str], max_parallel_requests: int | None = None
+) -> None:
     """Deletes a list of Tiles by their IDs."""
-    _generic_metadata_delete(config, tiles, "Tiles")
+    _generic_metadata_delete(config, tiles, "Tiles", max_parallel_requests)
 
 
-def deleteAttributeGroups(config: Config, attributegroups: list[str]) -> None:
+def deleteAttributeGroups(
+    config: Config, attributegroups: list[str], max_parallel_requests: int | None = None
+) -> None:
     """Deletes a list of AttributeGroups by their IDs."""
-    _generic_metadata_delete(config, attributegroups, "AttributeGroup")
+    _generic_metadata_delete(config, attributegroups, "AttributeGroup", max_parallel_requests)
 
 
-def deleteAttributeLinks(config: Config, attributelinks: list[str]) -> None:
+def deleteAttributeLinks(
+    config: Config, attributelinks: list[str], max_parallel_requests: int | None = None
+) -> None:
     """Deletes a list of AttributeLinks by their IDs."""
-    _generic_metadata_delete(config, attributelinks, "AttributeLink")
+    _generic_metadata_delete(config, attributelinks, "AttributeLink", max_parallel_requests)
 
 
-def deletePages(config: Config, pages: list[str]) -> None:
+def deletePages(
+    config: Config, pages: list[str], max_parallel_requests: int | None = None
+) -> None:
     """Deletes a list of Pages by their IDs."""
-    _generic_metadata_delete(config, pages, "Pages")
+    _generic_metadata_delete(config, pages, "Pages", max_parallel_requests)
 
 
-def deleteApplications(config: Config, applications: list[str]) -> None:
+def deleteApplications(
+    config: Config, applications: list[str], max_parallel_requests: int | None = None
+) -> None:
     """Deletes a list of Pages by their IDs."""
-    _generic_metadata_delete(config, applications, "Applications")
+    _generic_metadata_delete(config, applications, "Applications", max_parallel_requests)
 
 
-def deleteDiagrams(config: Config, diagrams: list[str]) -> None:
+def deleteDiagrams(
+    config: Config, diagrams: list[str], max_parallel_requests: int | None = None
+) -> None:
     """Deletes a list of Diagrams by their IDs."""
-    _generic_metadata_delete(config, diagrams, "Diagrams")
+    _generic_metadata_delete(config, diagrams, "Diagrams", max_parallel_requests)
 
 
-def deleteSubprocesses(config: Config, subprocesses: list[str]) -> None:
+def deleteSubprocesses(
+    config: Config, subprocesses: list[str], max_parallel_requests: int | None = None
+) -> None:
     """Deletes a list of SubProcesses by their IDs."""
-    _generic_metadata_delete(config, subprocesses, "SubProcess")
+    _generic_metadata_delete(config, subprocesses, "SubProcess", max_parallel_requests)
 
 
-def deleteReports(config: Config, reports: list[str]) -> None:
+def deleteReports(
+    config: Config, reports: list[str], max_parallel_requests: int | None = None
+) -> None:
     """Deletes a list of Reports by their IDs."""
-    _generic_metadata_delete(config, reports, "Reports")
+    _generic_metadata_delete(config, reports, "Reports", max_parallel_requests)
 
 
-def deleteRules(config: Config, rules: list[str]) -> None:
+def deleteRules(
+    config: Config, rules: list[str], max_parallel_requests: int | None = None
+) -> None:
     """Deletes a list of Rules by their IDs."""
-    _generic_metadata_delete(config, rules, "Rule")
+    _generic_metadata_delete(config, rules, "Rule", max_parallel_requests)
 
 
-def deleteVariances(config: Config, variances: list[str]) -> None:
+def deleteVariances(
+    config: Config, variances: list[str], max_parallel_requests: int | None = None
+) -> None:
     """Deletes a list of Variances by their IDs."""
-    _generic_metadata_delete(config, variances, "Variance")
+    _generic_metadata_delete(config, variances, "Variance", max_parallel_requests)
 
 
-def createColumns(config: Config, projectname: str, columns: list[Column]) -> None:
+def createColumns(
+    config: Config, projectname: str, columns: list[Column], max_parallel_requests: int | None = None
+) -> None:
     """Creates or updates a list of columns."""
     _generic_metadata_create_or_update(
         config=config,
@@ -538,10 +1097,13 @@ def createColumns(config: Config, projectname: str, columns: list[Column]) -> No
         objects=columns,
         endpoint="Columns",
         get_existing_func=getColumns,
+        max_parallel_requests=max_parallel_requests,
     )
 
 
-def createMetrics(config: Config, projectname: str, metrics: list[Metric]) -> None:
+def createMetrics(
+    config: Config, projectname: str, metrics: list[Metric], max_parallel_requests: int | None = None
+) -> None:
     """Creates or updates a list of Metrics."""
     _generic_metadata_create_or_update(
         config=config,
@@ -549,10 +1111,13 @@ def createMetrics(config: Config, projectname: str, metrics: list[Metric]) -> No
         objects=metrics,
         endpoint="Metrics",
         get_existing_func=getMetrics,
+        max_parallel_requests=max_parallel_requests,
     )
 
 
-def createTiles(config: Config, projectname: str, tiles: list[Tile]) -> None:
+def createTiles(
+    config: Config, projectname: str, tiles: list[Tile], max_parallel_requests: int | None = None
+) -> None:
     """Creates or updates a list of Tiles."""
     _generic_metadata_create_or_update(
         config=config,
@@ -560,11 +1125,12 @@ def createTiles(config: Config, projectname: str, tiles: list[Tile]) -> None:
         objects=tiles,
         endpoint="Tiles",
         get_existing_func=getTiles,
+        max_parallel_requests=max_parallel_requests,
     )
 
 
 def createAttributeGroups(
-    config: Config, projectname: str, attributegroups: list[AttributeGroup]
+    config: Config, projectname: str, attributegroups: list[AttributeGroup], max_parallel_requests: int | None = None
 ) -> None:
     """Creates or updates a list of AttributeGroups."""
     _generic_metadata_create_or_update(
@@ -573,11 +1139,12 @@ def createAttributeGroups(
         objects=attributegroups,
         endpoint="AttributeGroup",
         get_existing_func=getAttributeGroups,
+        max_parallel_requests=max_parallel_requests,
     )
 
 
 def createAttributeLinks(
-    config: Config, projectname: str, attributelinks: list[AttributeLink]
+    config: Config, projectname: str, attributelinks: list[AttributeLink], max_parallel_requests: int | None = None
 ) -> None:
     """Creates or updates a list of AttributeLinks."""
 
@@ -587,10 +1154,13 @@ def createAttributeLinks(
         objects=attributelinks,
         endpoint="AttributeLink",
         get_existing_func=getAttributeLinks,
+        max_parallel_requests=max_parallel_requests,
     )
 
 
-def createPages(config: Config, projectname: str, pages: list[Page]) -> None:
+def createPages(
+    config: Config, projectname: str, pages: list[Page], max_parallel_requests: int | None = None
+) -> None:
     """Creates or updates a list of Pages."""
     _generic_metadata_create_or_update(
         config=config,
@@ -598,11 +1168,12 @@ def createPages(config: Config, projectname: str, pages: list[Page]) -> None:
         objects=pages,
         endpoint="Pages",
         get_existing_func=getPages,
+        max_parallel_requests=max_parallel_requests,
     )
 
 
 def createApplications(
-    config: Config, projectname: str, applications: list[Application]
+    config: Config, projectname: str, applications: list[Application], max_parallel_requests: int | None = None
 ) -> None:
     """Creates or updates a list of Applications."""
     _generic_metadata_create_or_update(
@@ -611,10 +1182,13 @@ def createApplications(
         objects=applications,
         endpoint="Applications",
         get_existing_func=getApplications,
+        max_parallel_requests=max_parallel_requests,
     )
 
 
-def createDiagrams(config: Config, projectname: str, diagrams: list[Diagram]) -> None:
+def createDiagrams(
+    config: Config, projectname: str, diagrams: list[Diagram], max_parallel_requests: int | None = None
+) -> None:
     """Creates or updates a list of Diagrams."""
     _generic_metadata_create_or_update(
         config=config,
@@ -622,11 +1196,12 @@ def createDiagrams(config: Config, projectname: str, diagrams: list[Diagram]) ->
         objects=diagrams,
         endpoint="Diagrams",
         get_existing_func=getDiagrams,
+        max_parallel_requests=max_parallel_requests,
     )
 
 
 def createSubProcesses(
-    config: Config, projectname: str, subprocesses: list[SubProcess]
+    config: Config, projectname: str, subprocesses: list[SubProcess], max_parallel_requests: int | None = None
 ) -> None:
     """Creates or updates a list of SubProcesses."""
     _generic_metadata_create_or_update(
@@ -635,10 +1210,13 @@ def createSubProcesses(
         objects=subprocesses,
         endpoint="SubProcess",
         get_existing_func=getSubProcesses,
+        max_parallel_requests=max_parallel_requests,
     )
 
 
-def createReports(config: Config, projectname: str, reports: list[Report]) -> None:
+def createReports(
+    config: Config, projectname: str, reports: list[Report], max_parallel_requests: int | None = None
+) -> None:
     """Creates or updates a list of Reports."""
     _generic_metadata_create_or_update(
         config=config,
@@ -646,10 +1224,13 @@ def createReports(config: Config, projectname: str, reports: list[Report]) -> No
         objects=reports,
         endpoint="Reports",
         get_existing_func=getReports,
+        max_parallel_requests=max_parallel_requests,
     )
 
 
-def createRules(config: Config, projectname: str, rules: list[Rule]) -> None:
+def createRules(
+    config: Config, projectname: str, rules: list[Rule], max_parallel_requests: int | None = None
+) -> None:
     """Creates or updates a list of Rules."""
     _generic_metadata_create_or_update(
         config=config,
@@ -657,11 +1238,12 @@ def createRules(config: Config, projectname: str, rules: list[Rule]) -> None:
         objects=rules,
         endpoint="Rule",
         get_existing_func=getRules,
+        max_parallel_requests=max_parallel_requests,
     )
 
 
 def createVariances(
-    config: Config, projectname: str, variances: list[Variance]
+    config: Config, projectname: str, variances: list[Variance], max_parallel_requests: int | None = None
 ) -> None:
     """Creates or updates a list of Variances."""
     _generic_metadata_create_or_update(
@@ -670,6 +1252,7 @@ def createVariances(
         objects=variances,
         endpoint="Variance",
         get_existing_func=getVariances,
+        max_parallel_requests=max_parallel_requests,
     )
 
 
@@ -683,50 +1266,40 @@ def getProjects(
 
     # cannot use the generic meta data getter, since this is "above" the other object
 
-    headers = config.connection_get_headers()
-
-    response = requests.get(
-        config.get_config_nemo_url() + "/api/nemo-projects/projects", headers=headers
+    status_code, text = _get_list(
+        config, config.get_config_nemo_url() + "/api/nemo-projects/projects"
     )
-    if response.status_code != 200:
+    if status_code != 200:
         log_error(
-            f"request failed. Status: {response.status_code}, error: {response.text}"
+            f"request failed. Status: {status_code}, error: {text}"
         )
-    data = json.loads(response.text)
-
-    def match_filter(value: str, filter: str, filter_type: FilterType) -> bool:
-        """Applies the given filter to the value."""
-        if filter == "*":
-            return True
-        elif filter_type == FilterType.EQUAL:
-            return value == filter
-        elif filter_type == FilterType.STARTSWITH:
-            return value.startswith(filter)
-        elif filter_type == FilterType.ENDSWITH:
-            return value.endswith(filter)
-        elif filter_type == FilterType.CONTAINS:
-            return filter in value
-        elif filter_type == FilterType.REGEX:
-            return re.search(filter, value) is not None
-        return False
+    data = json.loads(text)
 
     # Apply filter to the data
-    filtered_data = [
-        item
-        for item in data
-        if match_filter(item.get(filter_value.value, ""), filter, filter_type)
-    ]
+    filtered_data = _filter_items(data, filter, filter_type, filter_value)
 
     return [_deserializeMetaDataObject(item, Project) for item in filtered_data]
 
 
-def deleteProjects(config: Config, projects: list[str]) -> None:
+def deleteProjects(
+    config: Config, projects: list[str], max_parallel_requests: int | None = None
+) -> None:
     """Deletes a list of projects by their IDs."""
-    _generic_metadata_delete(config, projects, "Project")
+    try:
+        _generic_metadata_delete(config, projects, "Project", max_parallel_requests)
+    finally:
+        clearProjectIDCache(config)
 
 
 def createProjects(config: Config, projects: list[Project]) -> None:
     """Creates or updates a list of Projects."""
+    try:
+        _create_projects(config, projects)
+    finally:
+        clearProjectIDCache(config)
+
+
+def _create_projects(config: Config, projects: list[Project]) -> None:
     # Initialize request
     headers = config.connection_get_headers()
 
@@ -746,7 +1319,7 @@ def createProjects(config: Config, projects: list[Project]) -> None:
         if len(existing_object) == 1:
             # Update existing object
             project.id = existing_object[0].id
-            response = requests.put(
+            response = get_session().put(
                 f"{config.get_config_nemo_url()}/api/nemo-projects/projects/{project.id}",
                 json=project.to_dict(),
                 headers=headers,
@@ -758,7 +1331,7 @@ def createProjects(config: Config, projects: list[Project]) -> None:
 
         else:
             # Create new object
-            response = requests.post(
+            response = get_session().post(
                 f"{config.get_config_nemo_url()}/api/nemo-persistence/metadata/Project",
                 json=project.to_dict(),
                 headers=headers,
@@ -774,7 +1347,7 @@ def getDependencyTree(config: Config, id: str) -> DependencyTree:
     headers = config.connection_get_headers()
     data = {"id": id}
 
-    response = requests.get(
+    response = get_session().get(
         f"{config.get_config_nemo_url()}/api/nemo-persistence/metadata/Metrics/DependencyTree",
         headers=headers,
         params=data,
@@ -846,7 +1419,7 @@ def _couple_columns(
         # url = f"{config.get_config_nemo_url()}/api/nemo-focus/infoscape/projects/{project_id}/attributes/couple"
 
         try:
-            response = requests.post(
+            response = get_session().post(
                 url,
                 json=request_as_json,
                 headers=headers,
@@ -907,7 +1480,7 @@ def _set_number_of_records(
     url = f"{config.get_config_nemo_url()}/api/nemo-persistence/ProjectProperty/project/{project_id}/ExpNumberOfRecords"
 
     try:
-        response = requests.put(
+        response = get_session().put(
             url,
             json=request_as_json,
             headers=headers,
@@ -0,0 +1,724 @@
+import asyncio
+import atexit
+import contextvars
+import json
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Mapping, Type, TypeVar
+
+import aiohttp
+
+from nemo_library.model.attribute_group import AttributeGroup
+from nemo_library.model.attribute_link import AttributeLink
+from nemo_library.model.column import Column
+from nemo_library.model.project import Project
+from nemo_library.utils.config import Config
+from nemo_library.utils.utils import FilterType, FilterValue, log_error
+from nemo_library_fox_reader.models.couple_attributes_request import CoupleAttributesRequest
+from nemo_library_fox_reader.foxmetadatasnapshot import FOXMetadataSnapshot
+from nemo_library_fox_reader.foxprogressmanager import FOXProgressManager
+from nemo_library_fox_reader.foxnemo_persistence_api import (
+    _cache_project_ids,
+    _dependency_waves,
+    _deserializeMetaDataObject,
+    _filter_items,
+    _get_cached_project_id,
+    _handle_list_response,
+    _index_by_internal_name,
+    _prepare_list_request,
+    clearProjectIDCache,
+)
+
+__all__ = [
+    "FOXAsyncClientSettings",
+    "FOXAsyncPersistenceClient",
+    "close_async_session",
+    "coupleAttributes",
+    "createAttributeGroups",
+    "createAttributeLinks",
+    "createColumns",
+    "createProjects",
+    "deleteAttributeGroups",
+    "deleteAttributeLinks",
+    "deleteColumns",
+    "deleteProjects",
+    "getAttributeGroups",
+    "getAttributeLinks",
+    "getColumns",
+    "getProjectID",
+    "getProjects",
+    "setNumberOfRecords",
+]
+
+T = TypeVar("T")
+
+_TRANSLATION_PARAMS = {"translationHandling": "UseAuxiliaryTranslationFields"}
+
+
+@dataclass
+class FOXAsyncClientSettings:
+    """
+    Connection limits, timeouts and retries of the asyncio client of the NEMO persistence API.
+    """
+
+    # open connections in total and per host
+    max_connections: int = 100
+    max_connections_per_host: int = 32
+
+    # requests waiting for a response at the same time. Further requests wait for a free slot
+    max_parallel_requests: int = 64
+
+    # seconds to wait for a connection and for the response
+    connect_timeout: float = 10.0
+    read_timeout: float = 300.0
+
+    # retries of failed requests with exponential backoff (backoff_factor * 2^n seconds), as in
+    # FOXHttpSettings: status codes are retried for idempotent methods only, connection errors always
+    retries: int = 3
+    backoff_factor: float = 0.5
+    retry_status_codes: tuple[int, ...] = (429, 502, 503, 504)
+    retry_methods: frozenset[str] = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+class FOXAsyncPersistenceClient:
+    """
+    asyncio counterpart of foxnemo_persistence_api for columns, attribute groups, attribute links,
+    projects, coupling and project properties. All calls of a client share one connection pool,
+    so thousands of requests can be sent from one thread:
+
+        async with FOXAsyncPersistenceClient(config) as client:
+            columns = await client.getColumns(projectname)
+
+    The methods take the same arguments as the functions of foxnemo_persistence_api (without config)
+    and share the project ID cache, the cached lists and the active FOXMetadataSnapshot with them.
+    Use the module functions to call it from synchronous code. A client given a session uses its
+    connections and leaves it open.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        settings: FOXAsyncClientSettings | None = None,
+        session: aiohttp.ClientSession | None = None,
+    ):
+        self.config = config
+        self.settings = settings or FOXAsyncClientSettings()
+        self._session = session
+        self._owns_session = False
+        self._semaphore: asyncio.Semaphore | None = None
+
+    async def __aenter__(self) -> "FOXAsyncPersistenceClient":
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def open(self) -> None:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(max(1, self.settings.max_parallel_requests))
+        if self._session is None:
+            self._session = _create_client_session(self.settings)
+            self._owns_session = True
+
+    async def close(self) -> None:
+        session, self._session = self._session, None
+        if session is not None and self._owns_session:
+            await session.close()
+        self._owns_session = False
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        headers: dict,
+        json_data: Any = None,
+        params: dict | None = None,
+    ) -> tuple[int, str]:
+        """
+        Sends a request and returns status code and response text.
+        """
+        status, text, _ = await self._request_with_headers(method, url, headers, json_data, params)
+        return status, text
+
+    async def _request_with_headers(
+        self,
+        method: str,
+        url: str,
+        headers: dict,
+        json_data: Any = None,
+        params: dict | None = None,
+    ) -> tuple[int, str, Mapping[str, str]]:
+        if self._session is None or self._semaphore is None:
+            await self.open()
+        attempt = 0
+        while True:
+            try:
+                async with self._semaphore:
+                    async with self._session.request(
+                        method, url, headers=headers, json=json_data, params=params
+                    ) as response:
+                        status, text = response.status, await response.text()
+                        # case-insensitive like the headers of requests
+                        response_headers = response.headers.copy()
+                if (
+                    status not in self.settings.retry_status_codes
+                    or method not in self.settings.retry_methods
+                    or attempt >= self.settings.retries
+                ):
+                    return status, text, response_headers
+                delay = _retry_delay(response_headers.get("Retry-After"), self.settings.backoff_factor, attempt)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt >= self.settings.retries:
+                    raise
+                delay = self.settings.backoff_factor * 2**attempt
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def _get_list(self, url: str, params: dict | None = None) -> tuple[int, str]:
+        """
+        Sends a GET request for a list of objects, sharing the cached bodies of
+        foxnemo_persistence_api._get_list: an unchanged list is not downloaded again.
+        """
+        key, headers, entry = _prepare_list_request(self.config, url, params)
+        status, text, response_headers = await self._request_with_headers("GET", url, headers, params=params)
+        return _handle_list_response(key, entry, status, response_headers.get("ETag"), text)
+
+    # projects
+
+    async def getProjects(
+        self,
+        filter: str = "*",
+        filter_type: FilterType = FilterType.STARTSWITH,
+        filter_value: FilterValue = FilterValue.DISPLAYNAME,
+    ) -> list[Project]:
+        """Fetches Projects metadata with the given filters."""
+        status, text = await self._get_list(f"{self.config.get_config_nemo_url()}/api/nemo-projects/projects")
+        if status != 200:
+            log_error(f"request failed. Status: {status}, error: {text}")
+        filtered_data = _filter_items(json.loads(text), filter, filter_type, filter_value)
+        return [_deserializeMetaDataObject(item, Project) for item in filtered_data]
+
+    async def getProjectID(self, projectname: str) -> str:
+        """Retrieves the unique project ID for a given project name, see foxnemo_persistence_api.getProjectID."""
+        found, project_id = _get_cached_project_id(self.config, projectname)
+        if found:
+            return project_id
+        return _cache_project_ids(self.config, await self.getProjects()).get(projectname)
+
+    async def createProjects(self, projects: list[Project]) -> None:
+        """Creates or updates a list of Projects."""
+        try:
+            errors = await _gather_errors(
+                [(f"Project {project.displayName}", self._create_project(project)) for project in projects]
+            )
+        finally:
+            clearProjectIDCache(self.config)
+        if errors:
+            log_error(f"Create/update of {len(errors)} Projects failed:\n" + "\n".join(errors))
+
+    async def _create_project(self, project: Project) -> None:
+        logging.info(f"Create/update Project '{project.displayName}'")
+        headers = self.config.connection_get_headers()
+        project.tenant = self.config.get_tenant()
+
+        existing_object = await self.getProjects(
+            filter=project.displayName,
+            filter_type=FilterType.EQUAL,
+            filter_value=FilterValue.DISPLAYNAME,
+        )
+        if len(existing_object) == 1:
+            project.id = existing_object[0].id
+            method, expected_status = "PUT", 200
+            url = f"{self.config.get_config_nemo_url()}/api/nemo-projects/projects/{project.id}"
+        else:
+            method, expected_status = "POST", 201
+            url = f"{self.config.get_config_nemo_url()}/api/nemo-persistence/metadata/Project"
+
+        status, text = await self._request(method, url, headers, json_data=project.to_dict())
+        if status != expected_status:
+            raise ValueError(
+                f"{method} Request failed.\nURL: {url}\nobject: {json.dumps(project.to_dict())}\nStatus: {status}, error: {text}"
+            )
+
+    async def deleteProjects(self, projects: list[str]) -> None:
+        """Deletes a list of projects by their IDs."""
+        try:
+            await self._delete(projects, "Project")
+        finally:
+            clearProjectIDCache(self.config)
+
+    # columns, attribute groups and attribute links
+
+    async def getColumns(
+        self,
+        projectname: str,
+        filter: str = "*",
+        filter_type: FilterType = FilterType.STARTSWITH,
+        filter_value: FilterValue = FilterValue.DISPLAYNAME,
+    ) -> list[Column]:
+        """Fetches columns metadata with the given filters."""
+        return await self._get(projectname, "Columns", "/all", Column, filter, filter_type, filter_value)
+
+    async def getAttributeGroups(
+        self,
+        projectname: str,
+        filter: str = "*",
+        filter_type: FilterType = FilterType.STARTSWITH,
+        filter_value: FilterValue = FilterValue.DISPLAYNAME,
+    ) -> list[AttributeGroup]:
+        """Fetches AttributeGroups metadata with the given filters."""
+        return await self._get(
+            projectname, "AttributeGroup", "/attributegroups", AttributeGroup, filter, filter_type, filter_value
+        )
+
+    async def getAttributeLinks(
+        self,
+        projectname: str,
+        filter: str = "*",
+        filter_type: FilterType = FilterType.STARTSWITH,
+        filter_value: FilterValue = FilterValue.DISPLAYNAME,
+    ) -> list[AttributeLink]:
+        """Fetches AttributeLinks metadata with the given filters."""
+        return await self._get(
+            projectname, "AttributeLink", "", AttributeLink, filter, filter_type, filter_value
+        )
+
+    async def createColumns(self, projectname: str, columns: list[Column]) -> None:
+        """Creates or updates a list of columns."""
+        await self._create_or_update(projectname, columns, "Columns", self.getColumns)
+
+    async def createAttributeGroups(self, projectname: str, attributegroups: list[AttributeGroup]) -> None:
+        """Creates or updates a list of AttributeGroups."""
+        await self._create_or_update(projectname, attributegroups, "AttributeGroup", self.getAttributeGroups)
+
+    async def createAttributeLinks(self, projectname: str, attributelinks: list[AttributeLink]) -> None:
+        """Creates or updates a list of AttributeLinks."""
+        await self._create_or_update(projectname, attributelinks, "AttributeLink", self.getAttributeLinks)
+
+    async def deleteColumns(self, columns: list[str]) -> None:
+        """Deletes a list of Columns by their IDs."""
+        await self._delete(columns, "Columns")
+
+    async def deleteAttributeGroups(self, attributegroups: list[str]) -> None:
+        """Deletes a list of AttributeGroups by their IDs."""
+        await self._delete(attributegroups, "AttributeGroup")
+
+    async def deleteAttributeLinks(self, attributelinks: list[str]) -> None:
+        """Deletes a list of AttributeLinks by their IDs."""
+        await self._delete(attributelinks, "AttributeLink")
+
+    async def _get(
+        self,
+        projectname: str,
+        endpoint: str,
+        endpoint_postfix: str,
+        return_type: Type[T],
+        filter: str,
+        filter_type: FilterType,
+        filter_value: FilterValue,
+    ) -> list[T]:
+        """
+        While a FOXMetadataSnapshot of the project is active, the objects are taken from it.
+        """
+        snapshot = FOXMetadataSnapshot.current(self.config, projectname)
+        data = snapshot.get_cached_objects(endpoint) if snapshot is not None else None
+        if data is None:
+            objects = await self._get_metadata_list(projectname, endpoint, endpoint_postfix)
+            data = snapshot.get_objects(endpoint, lambda: objects) if snapshot is not None else objects
+        filtered_data = _filter_items(data, filter, filter_type, filter_value)
+        return [_deserializeMetaDataObject(item, return_type) for item in filtered_data]
+
+    async def _get_metadata_list(self, projectname: str, endpoint: str, endpoint_postfix: str) -> list[dict]:
+        project_id = await self.getProjectID(projectname)
+        url = f"{self.config.get_config_nemo_url()}/api/nemo-persistence/metadata/{endpoint}/project/{project_id}{endpoint_postfix}"
+        status, text = await self._get_list(url, params=_TRANSLATION_PARAMS)
+        if status != 200:
+            log_error(f"GET Request failed.\nURL:{url}\nStatus: {status}, error: {text}")
+            return []
+        return json.loads(text)
+
+    async def _create_or_update(
+        self,
+        projectname: str,
+        objects: list[T],
+        endpoint: str,
+        get_existing: Callable[[str], Awaitable[list[T]]],
+    ) -> None:
+        """
+        Creates or updates objects in the same waves as foxnemo_persistence_api._generic_metadata_create_or_update:
+        parent attribute groups first, objects with the same internal name one after the other.
+        The active FOXMetadataSnapshot reads the objects of the endpoint again afterwards.
+        """
+        headers = self.config.connection_get_headers()
+        project_id = await self.getProjectID(projectname)
+        existing_objects = _index_by_internal_name(await get_existing(projectname))
+
+        async def _create_or_update_same_name(same_name_objects: list[T]) -> None:
+            existing_object = existing_objects.get(same_name_objects[0].internalName, [])
+            for i, obj in enumerate(same_name_objects):
+                obj.tenant = self.config.get_tenant()
+                obj.projectId = project_id
+                if i > 0:
+                    existing_object = _index_by_internal_name(await get_existing(projectname)).get(
+                        obj.internalName, []
+                    )
+
+                if len(existing_object) == 1:
+                    obj.id = existing_object[0].id
+                    await self._request(
+                        "PUT",
+                        f"{self.config.get_config_nemo_url()}/api/nemo-persistence/metadata/{endpoint}/{obj.id}",
+                        headers,
+                        json_data=obj.to_dict(),
+                        params=_TRANSLATION_PARAMS,
+                    )
+                else:
+                    status, _ = await self._request(
+                        "POST",
+                        f"{self.config.get_config_nemo_url()}/api/nemo-persistence/metadata/{endpoint}",
+                        headers,
+                        json_data=obj.to_dict(),
+                        params=_TRANSLATION_PARAMS,
+                    )
+                    logging.info(f"Persistence API POST Endpoint: {endpoint}  {obj.internalName}  Status: {status}")
+
+        errors = []
+        for wave in _dependency_waves(objects):
+            errors.extend(
+                await _gather_errors(
+                    [
+                        (f"{endpoint} {same_name_objects[0].internalName}", _create_or_update_same_name(same_name_objects))
+                        for same_name_objects in wave
+                    ]
+                )
+            )
+        snapshot = FOXMetadataSnapshot.current(self.config, projectname)
+        if snapshot is not None:
+            snapshot.invalidate(endpoint)
+        if errors:
+            log_error(f"Create/update of {len(errors)} {endpoint} failed:\n" + "\n".join(errors))
+
+    async def _delete(self, ids: list[str], endpoint: str) -> None:
+        headers = self.config.connection_get_headers()
+
+        async def _delete_one(obj_id: str) -> None:
+            url = f"{self.config.get_config_nemo_url()}/api/nemo-persistence/metadata/{endpoint}/{obj_id}"
+            status, text = await self._request("DELETE", url, headers, params=_TRANSLATION_PARAMS)
+            if status != 204:
+                raise ValueError(f"DELETE Request failed.\nURL: {url}\nStatus: {status}, error: {text}")
+
+        errors = await _gather_errors([(f"{endpoint} {obj_id}", _delete_one(obj_id)) for obj_id in ids])
+        snapshot = FOXMetadataSnapshot.current(self.config)
+        if snapshot is not None:
+            snapshot.invalidate(endpoint)
+        if errors:
+            log_error(f"Delete of {len(errors)} {endpoint} failed:\n" + "\n".join(errors))
+
+    # coupling and project properties
+
+    async def coupleAttributes(
+        self,
+        projectname: str,
+        request: list[CoupleAttributesRequest],
+        dictionary_internal_names_to_attribute_ids: dict[str, str] = None,
+    ) -> None:
+        """
+        Couples attributes, see foxnemo_persistence_api.coupleAttributes. The requests are sent one
+        after the other, because every request refers to the attributes placed by the previous ones.
+        """
+        headers = self.config.connection_get_headers()
+        project_id = await self.getProjectID(projectname)
+        url = f"{self.config.get_config_nemo_url()}/api/nemo-persistence/metadata/AttributeTree/projects/{project_id}/attributes/couple"
+
+        for item in request:
+            item.tenant = self.config.get_tenant()
+            item.projectId = project_id
+
+            attr_ids = []
+            for attr_nemo_name in item.attributeIds:
+                try:
+                    attr_ids.append(dictionary_internal_names_to_attribute_ids[attr_nemo_name])
+                except Exception:
+                    FOXProgressManager.warning(f"Coupling: Attribute name '{attr_nemo_name}' not found in columns.")
+            item.attributeIds = attr_ids
+
+            if item.previousElementId:
+                try:
+                    item.previousElementId = dictionary_internal_names_to_attribute_ids[item.previousElementId]
+                except Exception:
+                    FOXProgressManager.warning(f"Coupling: Attribute name previous '{item.previousElementId}' not found in columns.")
+                    continue
+
+            request_as_json = item.to_dict()
+            try:
+                status, text = await self._request(
+                    "POST", url, headers, json_data=request_as_json, params=_TRANSLATION_PARAMS
+                )
+                if status > 201:
+                    log_error(
+                        f"POST Request failed.\nURL: {url}\nObject: {request_as_json}\nStatus: {status}, error: {text}"
+                    )
+            except Exception as e:
+                FOXProgressManager.warning(
+                    f"POST Request failed.\nURL: {url}\nObject: {request_as_json}\nException: {str(e)}"
+                )
+
+    async def setNumberOfRecords(self, projectname: str, numberOfRecords: str) -> None:
+        """Sets the ProjectProperty ExpNumberOfRecords of a project."""
+        project_id = await self.getProjectID(projectname)
+        url = f"{self.config.get_config_nemo_url()}/api/nemo-persistence/ProjectProperty/project/{project_id}/ExpNumberOfRecords"
+        try:
+            status, text = await self._request(
+                "PUT",
+                url,
+                self.config.connection_get_headers(),
+                json_data=numberOfRecords,
+                params=_TRANSLATION_PARAMS,
+            )
+            if status > 201:
+                log_error(
+                    f"PUT Request failed.\nURL: {url}\nObject: {numberOfRecords}\nStatus: {status}, error: {text}"
+                )
+        except Exception as e:
+            FOXProgressManager.warning(
+                f"PUT Request failed.\nURL: {url}\nObject: {numberOfRecords}\nException: {str(e)}"
+            )
+
+
+def _retry_delay(retry_after: str | None, backoff_factor: float, attempt: int) -> float:
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+    return backoff_factor * 2**attempt
+
+
+async def _gather_errors(requests_to_run: list[tuple[str, Awaitable[None]]]) -> list[str]:
+    """
+    Awaits all requests and returns the errors of the failed ones; a failed request does not stop the others.
+    """
+    results = await asyncio.gather(*(request for _, request in requests_to_run), return_exceptions=True)
+    return [
+        f"{description}: {result}"
+        for (description, _), result in zip(requests_to_run, results)
+        if isinstance(result, Exception)
+    ]
+
+
+def _create_client_session(settings: FOXAsyncClientSettings) -> aiohttp.ClientSession:
+    connector = aiohttp.TCPConnector(
+        limit=settings.max_connections,
+        limit_per_host=settings.max_connections_per_host,
+    )
+    timeout = aiohttp.ClientTimeout(
+        sock_connect=settings.connect_timeout,
+        sock_read=settings.read_timeout,
+    )
+    # like the requests session (see foxhttp), the session may be shared by several tenants and users
+    return aiohttp.ClientSession(connector=connector, timeout=timeout, cookie_jar=aiohttp.DummyCookieJar())
+
+
+# event loop on a background thread and the session used by the synchronous wrappers, see _run
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_session: aiohttp.ClientSession | None = None
+_loop_lock = threading.Lock()
+
+
+def _get_loop() -> tuple[asyncio.AbstractEventLoop, aiohttp.ClientSession]:
+    global _loop, _loop_session
+    with _loop_lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="nemo-async", daemon=True).start()
+
+            async def _open() -> aiohttp.ClientSession:
+                return _create_client_session(FOXAsyncClientSettings())
+
+            _loop_session = asyncio.run_coroutine_threadsafe(_open(), loop).result()
+            _loop = loop
+        return _loop, _loop_session
+
+
+def close_async_session() -> None:
+    """
+    Closes the connections of the synchronous wrappers and stops their event loop. The next call
+    starts new ones.
+    """
+    global _loop, _loop_session
+    with _loop_lock:
+        loop, session, _loop, _loop_session = _loop, _loop_session, None, None
+    if loop is not None:
+        asyncio.run_coroutine_threadsafe(session.close(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+
+
+atexit.register(close_async_session)
+
+
+def _run(
+    config: Config,
+    call: Callable[[FOXAsyncPersistenceClient], Awaitable[T]],
+    max_parallel_requests: int | None = None,
+) -> T:
+    """
+    Runs a call to completion on the event loop of the synchronous wrappers. All calls share one
+    session, so connections are kept alive and reused from call to call. The call sees the context
+    variables of the caller (FOXMetadataSnapshot, FOXProgressManager).
+    """
+    settings = FOXAsyncClientSettings()
+    if max_parallel_requests:
+        settings.max_parallel_requests = max_parallel_requests
+
+    loop, session = _get_loop()
+    context = contextvars.copy_context()
+
+    try:
+        running_loop = asyncio.get_running_loop()
+    except RuntimeError:
+        running_loop = None
+    if running_loop is loop:
+        # called from a call on the loop, which cannot wait for another one: run it on an own loop
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="nemo-async") as executor:
+            return executor.submit(context.run, asyncio.run, _call(config, settings, call)).result()
+
+    async def _call_in_context() -> T:
+        return await loop.create_task(_call(config, settings, call, session), context=context)
+
+    return asyncio.run_coroutine_threadsafe(_call_in_context(), loop).result()
+
+
+async def _call(
+    config: Config,
+    settings: FOXAsyncClientSettings,
+    call: Callable[[FOXAsyncPersistenceClient], Awaitable[T]],
+    session: aiohttp.ClientSession | None = None,
+) -> T:
+    async with FOXAsyncPersistenceClient(config, settings, session=session) as client:
+        return await call(client)
+
+
+# synchronous wrappers with the signatures of foxnemo_persistence_api, so callers can switch modules
+
+
+def getProjects(
+    config: Config,
+    filter: str = "*",
+    filter_type: FilterType = FilterType.STARTSWITH,
+    filter_value: FilterValue = FilterValue.DISPLAYNAME,
+) -> list[Project]:
+    """Fetches Projects metadata with the given filters."""
+    return _run(config, lambda client: client.getProjects(filter, filter_type, filter_value))
+
+
+def getProjectID(config: Config, projectname: str) -> str:
+    """Retrieves the unique project ID for a given project name."""
+    return _run(config, lambda client: client.getProjectID(projectname))
+
+
+def createProjects(config: Config, projects: list[Project]) -> None:
+    """Creates or updates a list of Projects."""
+    _run(config, lambda client: client.createProjects(projects))
+
+
+def deleteProjects(
+    config: Config, projects: list[str], max_parallel_requests: int | None = None
+) -> None:
+    """Deletes a list of projects by their IDs."""
+    _run(config, lambda client: client.deleteProjects(projects), max_parallel_requests)
+
+
+def getColumns(
+    config: Config,
+    projectname: str,
+    filter: str = "*",
+    filter_type: FilterType = FilterType.STARTSWITH,
+    filter_value: FilterValue = FilterValue.DISPLAYNAME,
+) -> list[Column]:
+    """Fetches columns metadata with the given filters."""
+    return _run(config, lambda client: client.getColumns(projectname, filter, filter_type, filter_value))
+
+
+def getAttributeGroups(
+    config: Config,
+    projectname: str,
+    filter: str = "*",
+    filter_type: FilterType = FilterType.STARTSWITH,
+    filter_value: FilterValue = FilterValue.DISPLAYNAME,
+) -> list[AttributeGroup]:
+    """Fetches AttributeGroups metadata with the given filters."""
+    return _run(config, lambda client: client.getAttributeGroups(projectname, filter, filter_type, filter_value))
+
+
+def getAttributeLinks(
+    config: Config,
+    projectname: str,
+    filter: str = "*",
+    filter_type: FilterType = FilterType.STARTSWITH,
+    filter_value: FilterValue = FilterValue.DISPLAYNAME,
+) -> list[AttributeLink]:
+    """Fetches AttributeLinks metadata with the given filters."""
+    return _run(config, lambda client: client.getAttributeLinks(projectname, filter, filter_type, filter_value))
+
+
+def createColumns(
+    config: Config, projectname: str, columns: list[Column], max_parallel_requests: int | None = None
+) -> None:
+    """Creates or updates a list of columns."""
+    _run(config, lambda client: client.createColumns(projectname, columns), max_parallel_requests)
+
+
+def createAttributeGroups(
+    config: Config, projectname: str, attributegroups: list[AttributeGroup], max_parallel_requests: int | None = None
+) -> None:
+    """Creates or updates a list of AttributeGroups."""
+    _run(config, lambda client: client.createAttributeGroups(projectname, attributegroups), max_parallel_requests)
+
+
+def createAttributeLinks(
+    config: Config, projectname: str, attributelinks: list[AttributeLink], max_parallel_requests: int | None = None
+) -> None:
+    """Creates or updates a list of AttributeLinks."""
+    _run(config, lambda client: client.createAttributeLinks(projectname, attributelinks), max_parallel_requests)
+
+
+def deleteColumns(
+    config: Config, columns: list[str], max_parallel_requests: int | None = None
+) -> None:
+    """Deletes a list of Columns by their IDs."""
+    _run(config, lambda client: client.deleteColumns(columns), max_parallel_requests)
+
+
+def deleteAttributeGroups(
+    config: Config, attributegroups: list[str], max_parallel_requests: int | None = None
+) -> None:
+    """Deletes a list of AttributeGroups by their IDs."""
+    _run(config, lambda client: client.deleteAttributeGroups(attributegroups), max_parallel_requests)
+
+
+def deleteAttributeLinks(
+    config: Config, attributelinks: list[str], max_parallel_requests: int | None = None
+) -> None:
+    """Deletes a list of AttributeLinks by their IDs."""
+    _run(config, lambda client: client.deleteAttributeLinks(attributelinks), max_parallel_requests)
+
+
+def coupleAttributes(
+    config: Config,
+    projectname: str,
+    request: list[CoupleAttributesRequest],
+    dictionary_internal_names_to_attribute_ids: dict[str, str] = None,
+) -> None:
+    """Couples attributes, see FOXAsyncPersistenceClient.coupleAttributes."""
+    _run(
+        config,
+        lambda client: client.coupleAttributes(projectname, request, dictionary_internal_names_to_attribute_ids),
+    )
+
+
+def setNumberOfRecords(config: Config, projectname: str, numberOfRecords: str) -> None:
+    """Sets the ProjectProperty ExpNumberOfRecords of a project."""
+    _run(config, lambda client: client.setNumberOfRecords(projectname, numberOfRecords))
@@ -1,38 +1,91 @@
+
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
 import logging
+import threading
 from nemo_library_fox_reader.foxstatisticsinfo import FOXStatisticsInfo, IssueType
 
 
 class FOXProgressManager:
+    """
+    Collects the infos and warnings of an import. The static methods (info, warning, start, finish)
+    work on the progress manager that is active in the current context (see activate()), so
+    imports running in parallel threads keep their messages apart. Without an active progress
+    manager a process-wide default one is used.
+    """
 
-   
     def __init__(self):
         self.total_steps = 0
         self.current_step = 0
+        self._lock = threading.Lock()
+        self.allInfos: list[str] = []
+        self.allWarnings: list[str] = []
+        self.start_time: datetime = None
+        self.finish_time: datetime = None
+
+    @staticmethod
+    def current() -> "FOXProgressManager":
+        return _current_progress_manager.get() or _default_progress_manager
+
+    @contextmanager
+    def activate(self):
+        """
+        Makes this progress manager the current one until the with-block ends. New threads do not
+        inherit it; run their work with contextvars.copy_context().run to keep it.
+        """
+        token = _current_progress_manager.set(self)
+        try:
+            yield self
+        finally:
+            _current_progress_manager.reset(token)
+
+    def reset(self):
+        with self._lock:
+            self.allInfos = []
+            self.allWarnings = []
+            self.start_time = None
+            self.finish_time = None
+
+    def merge(self, other: "FOXProgressManager"):
+        if other is self:
+            return
+        with other._lock:
+            infos = list(other.allInfos)
+            warnings = list(other.allWarnings)
+        with self._lock:
+            self.allInfos.extend(infos)
+            self.allWarnings.extend(warnings)
 
     @staticmethod
     def info(message: str):
         logging.info(message)
-        FOXProgressManager.allInfos.append(message)
+        manager = FOXProgressManager.current()
+        with manager._lock:
+            manager.allInfos.append(message)
 
     @staticmethod
     def warning(message: str):
         logging.warning(message)
-        FOXProgressManager.allWarnings.append(message)
-        
+        manager = FOXProgressManager.current()
+        with manager._lock:
+            manager.allWarnings.append(message)
+
     @staticmethod
     def start():
-        FOXProgressManager.start_time = datetime.now().replace(microsecond=0)
-        
+        FOXProgressManager.current().start_time = datetime.now().replace(microsecond=0)
+
     @staticmethod
     def finish():
-        FOXProgressManager.finish_time = datetime.now().replace(microsecond=0)
-        duration = FOXProgressManager.finish_time - FOXProgressManager.start_time
-        logging.info(f"FileIngestion took {duration}   start={FOXProgressManager.start_time}   finish={FOXProgressManager.finish_time}  ")
-        
+        manager = FOXProgressManager.current()
+        manager.finish_time = datetime.now().replace(microsecond=0)
+        if manager.start_time is None:
+            return
+        duration = manager.finish_time - manager.start_time
+        logging.info(f"FileIngestion took {duration}   start={manager.start_time}   finish={manager.finish_time}  ")
 
-    allInfos: list[str] = []
-    allWarnings: list[str] = []
-    start_time: datetime = None 
-    finish_time: datetime = None
 
+_default_progress_manager = FOXProgressManager()
+_current_progress_manager: ContextVar[FOXProgressManager | None] = ContextVar(
+    "fox_progress_manager", default=None
+)
@@ -1,4 +1,5 @@
 import logging
+import threading
 from nemo_library_fox_reader.foxstatisticsinfo import FOXStatisticsInfo, IssueType
 from nemo_library_fox_reader.foxattribute import FoxAttribute
 from nemo_library_fox_reader.foxprogressmanager import FOXProgressManager
@@ -8,19 +9,81 @@ from nemo_library_fox_reader.models.couple_attributes_request import CoupleAttri
 class FOXReaderInfo:
     """
     class for storing statistics information about the implementation of InfoZoom features.
+
+    All collected information belongs to the instance, so every import should use its own
+    FOXReaderInfo. Results of several imports can be combined with merge().
     """
 
+    def __init__(self):
+        self._lock = threading.RLock()
+        self.progress_manager = FOXProgressManager()
+        self.current_file_name: str = ""
+        self.current_file_path: str = ""
+        self.current_fox_version: str = ""
+        self.statistics_infos: list[FOXStatisticsInfo] = []
+        self.reset_file_state()
+
     def add_progress_manager(self, progress_manager: FOXProgressManager):
         self.progress_manager = progress_manager
 
-    progress_manager = FOXProgressManager()
+    def reset_file_state(self):
+        """
+        Clears everything that is collected while a single file is read and imported.
+        The statistics infos and the operation modes are kept.
+        """
+        with self._lock:
+            self.attributes_with_multiple_values: list[str] = []
+            self.attributes_with_summary_function: list[str] = []
+            self.attributes_with_expression: list[str] = []
+            self.attributes_with_classification: list[str] = []
+            self.attributes_with_case_discrimination: list[str] = []
+            self.attributes_with_unsupported_format: list[str] = []
+            self.attributes_with_images_shown: list[str] = []
+            self.attributes_with_sort_order_used: list[str] = []
+            self.attributes_with_html_links_used: list[str] = []
 
+            self.max_string_length_in_fox_file: int = 0
 
-    current_file_name: str = ""
-    current_file_path: str = ""
-    current_fox_version: str = ""
+            self.coupled_attributes_in_fox_file: list[list[FoxAttribute]] = []
+            self.couple_attributes_requests: list[CoupleAttributesRequest] = []
+            self.dictionary_internal_names_to_attribute_ids: dict[str, str] = {}
+            self.dictionary_internal_names_to_data_types: dict[str, str] = {}
+            self.list_of_ids_permanently_hidden_columns: list[FoxAttribute] = []
 
-    statistics_infos: list[FOXStatisticsInfo] = []
+    def reset(self):
+        """
+        Clears all collected information including the statistics infos and the progress messages.
+        """
+        with self._lock:
+            self.current_file_name = ""
+            self.current_file_path = ""
+            self.current_fox_version = ""
+            self.statistics_infos = []
+            self.reset_file_state()
+            self.progress_manager.reset()
+
+    def merge(self, other: "FOXReaderInfo"):
+        """
+        Adds the statistics infos and the attribute lists collected by another instance
+        (e.g. of an import that ran in a different thread) to this instance.
+        """
+        if other is self:
+            return
+        with other._lock:
+            statistics_infos = list(other.statistics_infos)
+            attribute_lists = {
+                name: list(getattr(other, name))
+                for name in vars(other)
+                if name.startswith("attributes_with_")
+            }
+            max_string_length = other.max_string_length_in_fox_file
+        with self._lock:
+            self.statistics_infos.extend(statistics_infos)
+            for name, attributes in attribute_lists.items():
+                own = getattr(self, name)
+                own.extend(attribute for attribute in attributes if attribute not in own)
+            self.max_string_length_in_fox_file = max(self.max_string_length_in_fox_file, max_string_length)
+        self.progress_manager.merge(other.progress_manager)
 
     def add_exception(self, exception: Exception):
         info = FOXStatisticsInfo()
@@ -29,7 +92,8 @@ class FOXReaderInfo:
         info.file_name = self.current_file_name
         info.file_path = self.current_file_path.replace("\\", "\\\\")
         info.fox_version = self.current_fox_version
-        self.statistics_infos.append(info)
+        with self._lock:
+            self.statistics_infos.append(info)
 
 
     def add_issue(self, issue: str, attribute: str = "", formula: str = "", format: str = "", extra_info: str=""):
@@ -43,26 +107,11 @@ class FOXReaderInfo:
         info.file_name = self.current_file_name
         info.file_path = self.current_file_path.replace("\\", "\\\\")
         info.fox_version = self.current_fox_version
-        self.statistics_infos.append(info)
-
+        with self._lock:
+            self.statistics_infos.append(info)
 
-    attributes_with_multiple_values: list[str] = []
-    attributes_with_summary_function: list[str] = []
-    attributes_with_expression: list[str] = []
-    attributes_with_classification: list[str] = []
-    attributes_with_case_discrimination: list[str] = []
-    attributes_with_unsupported_format: list[str] = []
-    attributes_with_images_shown: list[str] = []
-    attributes_with_sort_order_used: list[str] = []
-    attributes_with_html_links_used: list[str] = []
-    
-    max_string_length_in_fox_file: int = 0
+    # operation modes are settings, not collected information: they can be set on the class
+    # for all imports or on an instance for a single import
     operation_mode_functioncall_names_as_attribute_name_prefix: bool = False
     operation_mode_not_moving_attributes: bool = True
     operation_mode_create_objects_in_attribute_order: bool = False
-    
-    coupled_attributes_in_fox_file: list[list[FoxAttribute]] = []
-    couple_attributes_requests: list[CoupleAttributesRequest] = []
-    dictionary_internal_names_to_attribute_ids: dict[str, str] = {} 
-    dictionary_internal_names_to_data_types: dict[str, str] = {}
-    list_of_ids_permanently_hidden_columns: list[FoxAttribute] = []
@@ -0,0 +1,255 @@
+import contextvars
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import BinaryIO, Callable
+
+import boto3
+from boto3.s3.transfer import TransferConfig
+
+from nemo_library.utils.config import Config
+from nemo_library_fox_reader.foxhttp import get_session
+from nemo_library_fox_reader.foxuploadsettings import FOXUploadSettings
+
+__all__ = [
+    "clear_s3_client_cache",
+    "delete_from_s3",
+    "get_s3_client",
+    "get_transfer_config",
+    "upload_file_to_s3",
+    "upload_stream_to_s3",
+]
+
+
+@dataclass
+class _CachedS3Client:
+    client: object
+    expires_at: float
+
+
+_s3_client_cache: dict[tuple, _CachedS3Client] = {}
+_s3_client_cache_lock = threading.Lock()
+
+
+def get_s3_client(config: Config, upload_settings: FOXUploadSettings | None = None):
+    """
+    Returns an S3 client for the NEMO upload bucket. The temporary credentials from the NEMO
+    token vendor and the client built from them are cached and renewed shortly before they expire.
+    """
+    upload_settings = upload_settings or FOXUploadSettings()
+    key = (
+        config.get_config_nemo_url(),
+        config.get_tenant(),
+        upload_settings.s3_endpoint_url,
+        upload_settings.s3_use_token_vendor,
+    )
+    with _s3_client_cache_lock:
+        cached = _s3_client_cache.get(key)
+        if cached is not None and time.time() < cached.expires_at:
+            return cached.client
+
+        if upload_settings.s3_use_token_vendor:
+            aws_credentials = _get_sts_credentials(config)
+            client = boto3.session.Session().client(
+                "s3",
+                aws_access_key_id=aws_credentials["accessKeyId"],
+                aws_secret_access_key=aws_credentials["secretAccessKey"],
+                aws_session_token=aws_credentials["sessionToken"],
+                endpoint_url=upload_settings.s3_endpoint_url,
+            )
+            expiration = _parse_expiration(
+                aws_credentials.get("expiration", aws_credentials.get("Expiration"))
+            )
+        else:
+            client = boto3.session.Session().client(
+                "s3", endpoint_url=upload_settings.s3_endpoint_url
+            )
+            expiration = None
+
+        if expiration is None:
+            expiration = time.time() + upload_settings.s3_credentials_ttl
+        _s3_client_cache[key] = _CachedS3Client(
+            client=client,
+            expires_at=expiration - upload_settings.s3_credentials_refresh_margin,
+        )
+        return client
+
+
+def clear_s3_client_cache() -> None:
+    """
+    Drops all cached S3 clients and credentials, e.g. after the credentials have been revoked.
+    """
+    with _s3_client_cache_lock:
+        _s3_client_cache.clear()
+
+
+def get_transfer_config(upload_settings: FOXUploadSettings | None = None) -> TransferConfig:
+    upload_settings = upload_settings or FOXUploadSettings()
+    return TransferConfig(
+        multipart_threshold=upload_settings.s3_multipart_threshold,
+        multipart_chunksize=upload_settings.s3_part_size,
+        max_concurrency=upload_settings.s3_max_concurrency,
+        use_threads=upload_settings.s3_max_concurrency > 1,
+    )
+
+
+def upload_file_to_s3(
+    config: Config,
+    filename: str,
+    s3filename: str,
+    upload_settings: FOXUploadSettings | None = None,
+) -> None:
+    """
+    Uploads a local file to the upload bucket using a multipart upload with parallel parts.
+    """
+    upload_settings = upload_settings or FOXUploadSettings()
+    s3 = get_s3_client(config, upload_settings)
+    start = time.perf_counter()
+    s3.upload_file(
+        filename,
+        upload_settings.s3_bucket,
+        s3filename,
+        Config=get_transfer_config(upload_settings),
+    )
+    _log_throughput(s3filename, os.path.getsize(filename), time.perf_counter() - start)
+
+
+def upload_stream_to_s3(
+    config: Config,
+    write_data: Callable[[BinaryIO], None],
+    s3filename: str,
+    upload_settings: FOXUploadSettings | None = None,
+) -> None:
+    """
+    Uploads data that is produced while the upload is running. write_data is called on a
+    separate thread with a writable binary stream; everything written to it is uploaded as one
+    object using a multipart upload. The object is removed again if write_data fails.
+    """
+    upload_settings = upload_settings or FOXUploadSettings()
+    s3 = get_s3_client(config, upload_settings)
+
+    read_fd, write_fd = os.pipe()
+    reader = _CountingReader(os.fdopen(read_fd, "rb"))
+    writer = os.fdopen(write_fd, "wb")
+    producer_errors: list[BaseException] = []
+
+    def produce() -> None:
+        try:
+            write_data(writer)
+        except BaseException as e:
+            producer_errors.append(e)
+        finally:
+            try:
+                writer.close()
+            except OSError as e:
+                # the reader is gone, the upload has failed already
+                if not producer_errors:
+                    producer_errors.append(e)
+
+    producer = threading.Thread(
+        target=contextvars.copy_context().run,
+        args=(produce,),
+        name="fox-upload-producer",
+        daemon=True,
+    )
+    start = time.perf_counter()
+    producer.start()
+    try:
+        s3.upload_fileobj(
+            reader,
+            upload_settings.s3_bucket,
+            s3filename,
+            Config=get_transfer_config(upload_settings),
+        )
+    finally:
+        # closing the read end unblocks the producer if the upload stopped early
+        reader.close()
+        producer.join()
+
+    if producer_errors:
+        # the stream ended early, so the uploaded object is incomplete
+        try:
+            s3.delete_object(Bucket=upload_settings.s3_bucket, Key=s3filename)
+        except Exception as e:
+            logging.warning(f"Could not remove incomplete upload {s3filename}: {e}")
+        raise producer_errors[0]
+
+    _log_throughput(s3filename, reader.bytes_read, time.perf_counter() - start)
+
+
+def delete_from_s3(
+    config: Config,
+    s3filename: str,
+    upload_settings: FOXUploadSettings | None = None,
+) -> None:
+    """
+    Removes uploaded data that is not needed anymore. A failure is only logged, the data has
+    served its purpose already.
+    """
+    upload_settings = upload_settings or FOXUploadSettings()
+    try:
+        get_s3_client(config, upload_settings).delete_object(
+            Bucket=upload_settings.s3_bucket, Key=s3filename
+        )
+    except Exception as e:
+        logging.warning(f"Could not remove uploaded data {s3filename}: {e}")
+
+
+class _CountingReader:
+    """
+    Minimal file-like wrapper that counts the bytes handed to the uploader.
+    """
+
+    def __init__(self, raw: BinaryIO):
+        self._raw = raw
+        self.bytes_read = 0
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._raw.read(size)
+        self.bytes_read += len(data)
+        return data
+
+    def close(self) -> None:
+        self._raw.close()
+
+
+def _get_sts_credentials(config: Config) -> dict:
+    # Retrieve temporary credentials from NEMO TVM
+    response = get_session().get(
+        config.get_config_nemo_url()
+        + "/api/nemo-tokenvendor/InternalTokenVendor/sts/s3_policy",
+        headers=config.connection_get_headers(),
+    )
+    if response.status_code != 200:
+        raise Exception(
+            f"Request failed. Status: {response.status_code}, error: {response.text}"
+        )
+    return json.loads(response.text)
+
+
+def _parse_expiration(value) -> float | None:
+    """
+    Converts the expiration reported by the token vendor (ISO timestamp or epoch seconds/milliseconds)
+    into epoch seconds. Returns None if there is no usable value.
+    """
+    if value is None:
+        return None
+    try:
+        if isinstance(value, (int, float)):
+            return value / 1000 if value > 1e11 else float(value)
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp()
+    except (TypeError, ValueError):
+        logging.warning(f"Unknown expiration format of S3 credentials: {value}")
+        return None
+
+
+def _log_throughput(s3filename: str, size_in_bytes: int, seconds: float) -> None:
+    size_in_mb = size_in_bytes / (1024 * 1024)
+    logging.info(
+        f"Uploaded {size_in_mb:.1f} MB to s3 ({s3filename}) in {seconds:.1f}s "
+        f"({size_in_mb / max(seconds, 1e-6):.1f} MB/s)"
+    )
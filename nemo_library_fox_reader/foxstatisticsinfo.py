@@ -18,6 +18,15 @@ class FOXStatisticsInfo:
     format: str = ""
     extra_info: str = ""
 
+    def to_csv_row(self) -> list[str]:
+        """
+        Returns the values in the order of STATISTICS_CSV_HEADER.
+        """
+        return [f"{self.file_name}",f"{self.file_path}",f"{self.fox_version}",f"{self.issue}",f"{self.exception}",f"{self.attribute}",f"{self.formula}",f"{self.format}",f"{self.extra_info}"]
+
+
+STATISTICS_CSV_HEADER = ["FileName","FilePath","FOX-Version","Issue","Exception","Attribute","Formula","Format","Extra-Info"]
+
 
 # IssueType = {
 #     1: "EXCEPTION",
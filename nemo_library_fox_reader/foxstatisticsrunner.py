@@ -0,0 +1,196 @@
+import csv
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from nemo_library_fox_reader.foxfile import FOXFile
+from nemo_library_fox_reader.foxfingerprint import FileFingerprint, sha256_of_file
+from nemo_library_fox_reader.foxmeta import FOXMeta
+from nemo_library_fox_reader.foxreaderinfo import FOXReaderInfo
+from nemo_library_fox_reader.foxstatisticsinfo import (
+    STATISTICS_CSV_HEADER,
+    FOXStatisticsInfo,
+)
+
+__all__ = ["collect_file_statistics", "write_statistics"]
+
+# increase when the collected statistics change, so cached rows of older versions are not reused
+MANIFEST_FORMAT_VERSION = 1
+
+
+def collect_file_statistics(
+    filename: str, config_file: str | None = None
+) -> list[FOXStatisticsInfo]:
+    """
+    Collects the statistics infos of a single FOX file. Only the schema is read and the metadata
+    is prepared (nothing is sent to NEMO and no DataFrame is built), which is all the statistics need.
+    Runs in a worker process, so the result contains picklable values only: exceptions are
+    reported as text.
+    """
+    foxReaderInfo = FOXReaderInfo()
+    foxReaderInfo.current_file_name = Path(filename).name
+    foxReaderInfo.current_file_path = filename
+    foxReaderInfo.current_fox_version = "unknown"
+
+    config = None
+    if filename.lower().startswith("s3://"):
+        # S3 files need the NEMO connection to get credentials
+        from nemo_library.utils.config import Config
+
+        config = Config(config_file=config_file or "config.ini")
+
+    with foxReaderInfo.progress_manager.activate():
+        foxfile = FOXFile(filename, config=config, foxReaderInfo=foxReaderInfo)
+        try:
+            if foxfile.read_schema():
+                FOXMeta(foxfile, foxReaderInfo=foxReaderInfo).prepare_metadata()
+        except Exception as exception:
+            logging.error(f"Error collecting statistics of {filename}: {exception}")
+            foxReaderInfo.add_exception(exception)
+        finally:
+            foxfile.close()
+
+    for info in foxReaderInfo.statistics_infos:
+        info.exception = f"{info.exception}"
+    return foxReaderInfo.statistics_infos
+
+
+def write_statistics(
+    filenames: list[str],
+    statistics_file: str,
+    max_workers: int | None = None,
+    config_file: str | None = None,
+    manifest_file: str | None = None,
+    full: bool = False,
+) -> int:
+    """
+    Collects the statistics of FOX files in worker processes and writes them into a CSV file.
+    Rows are written as soon as the result of a file arrives, so only the infos of the
+    files currently being processed are held in memory.
+
+    A manifest stores the fingerprint (size, modification time, sha256) and the rows of every file.
+    Files whose fingerprint did not change are not parsed again; their rows are taken from the
+    manifest. The content hash is only computed when size or modification time differ.
+
+    Args:
+        filenames (list[str]): The FOX files.
+        statistics_file (str): The CSV file to write.
+        max_workers (int, optional): Number of worker processes. Defaults to the number of CPUs.
+        config_file (str, optional): NEMO configuration, needed for files on S3 only.
+        manifest_file (str, optional): Defaults to "<statistics_file>.manifest.json".
+        full (bool, optional): If True, all files are parsed and the manifest is rebuilt.
+
+    Returns:
+        int: The number of statistics infos written.
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    manifest_file = manifest_file or f"{statistics_file}.manifest.json"
+    old_entries = {} if full else _load_manifest(manifest_file)
+    new_entries: dict[str, dict] = {}
+    rows_written = 0
+
+    with open(statistics_file, "w") as csv_file:
+        writer = csv.writer(csv_file, delimiter=';', lineterminator='\n', doublequote=True)
+        writer.writerow(STATISTICS_CSV_HEADER)
+
+        filenames_to_parse = []
+        for filename in filenames:
+            entry = _get_unchanged_entry(filename, old_entries.get(filename))
+            if entry is None:
+                filenames_to_parse.append(filename)
+                continue
+            writer.writerows(entry["rows"])
+            rows_written += len(entry["rows"])
+            new_entries[filename] = entry
+        logging.info(
+            f"{len(filenames) - len(filenames_to_parse)} of {len(filenames)} files unchanged, "
+            f"parsing {len(filenames_to_parse)} files"
+        )
+
+        if filenames_to_parse:
+            with ProcessPoolExecutor(max_workers=min(max_workers, len(filenames_to_parse))) as executor:
+                futures = {
+                    executor.submit(_collect_file_rows, filename, config_file): filename
+                    for filename in filenames_to_parse
+                }
+                for files_done, future in enumerate(as_completed(futures), start=1):
+                    filename = futures.pop(future)
+                    try:
+                        fingerprint, rows = future.result()
+                    except Exception as exception:
+                        # the worker process itself failed (e.g. it ran out of memory).
+                        # The file is not added to the manifest, so it is parsed again next time
+                        info = FOXStatisticsInfo()
+                        info.issue = "EXCEPTION"
+                        info.exception = f"{exception}"
+                        info.file_name = Path(filename).name
+                        info.file_path = filename.replace("\\", "\\\\")
+                        info.fox_version = "unknown"
+                        fingerprint, rows = None, [info.to_csv_row()]
+
+                    writer.writerows(rows)
+                    rows_written += len(rows)
+                    if fingerprint is not None:
+                        new_entries[filename] = {"fingerprint": fingerprint, "rows": rows}
+                    logging.info(f"[{files_done}/{len(filenames_to_parse)}] {filename}: {len(rows)} statistics infos")
+
+    _save_manifest(manifest_file, new_entries)
+    return rows_written
+
+
+def _collect_file_rows(filename: str, config_file: str | None) -> tuple[dict | None, list[list[str]]]:
+    # the fingerprint is taken before parsing, so a file changed in the meantime is parsed again next time
+    fingerprint = None if _is_s3(filename) else FileFingerprint.from_file(filename).to_dict()
+    rows = [info.to_csv_row() for info in collect_file_statistics(filename, config_file)]
+    return fingerprint, rows
+
+
+def _get_unchanged_entry(filename: str, entry: dict | None) -> dict | None:
+    """
+    Returns the manifest entry of a file if the file did not change since, else None.
+    """
+    if entry is None or _is_s3(filename):
+        return None
+    try:
+        current = FileFingerprint.from_file(filename, with_hash=False)
+    except OSError:
+        return None
+    stored = FileFingerprint.from_dict(entry["fingerprint"])
+    if current.same_stat(stored):
+        return entry
+    if current.size != stored.size or stored.sha256 is None:
+        return None
+    current.sha256 = sha256_of_file(filename)
+    if current.sha256 != stored.sha256:
+        return None
+    # same content with a new modification time: keep the rows, remember the new time
+    return {"fingerprint": current.to_dict(), "rows": entry["rows"]}
+
+
+def _is_s3(filename: str) -> bool:
+    return filename.lower().startswith("s3://")
+
+
+def _load_manifest(manifest_file: str) -> dict[str, dict]:
+    try:
+        with open(manifest_file, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logging.warning(f"Ignoring unreadable statistics manifest {manifest_file}: {e}")
+        return {}
+    if manifest.get("format_version") != MANIFEST_FORMAT_VERSION:
+        logging.info(f"Statistics manifest {manifest_file} has an old format, all files are parsed")
+        return {}
+    return manifest.get("files", {})
+
+
+def _save_manifest(manifest_file: str, entries: dict[str, dict]) -> None:
+    # written to a temporary file first, so an interrupted run keeps the previous manifest
+    temp_file = f"{manifest_file}.tmp"
+    with open(temp_file, "w", encoding="utf-8") as f:
+        json.dump({"format_version": MANIFEST_FORMAT_VERSION, "files": entries}, f)
+    os.replace(temp_file, manifest_file)
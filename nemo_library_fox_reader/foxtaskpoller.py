@@ -0,0 +1,235 @@
+import json
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+
+import requests
+
+from nemo_library.utils.config import Config
+from nemo_library_fox_reader.foxhttp import get_session
+from nemo_library_fox_reader.foxuploadsettings import FOXUploadSettings
+
+__all__ = ["FOXTaskPoller", "get_task_poller", "wait_for_task"]
+
+TASK_STATUS_FINISHED = "finished"
+TASK_STATUS_FAILED = "failed"
+
+# answers of the task list that are worth asking again
+_TRANSIENT_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+class _TaskPollError(Exception):
+    def __init__(self, message: str, status_code: int):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def _is_transient(error: BaseException) -> bool:
+    if isinstance(error, _TaskPollError):
+        return error.status_code in _TRANSIENT_STATUS_CODES
+    return isinstance(error, (requests.ConnectionError, requests.Timeout))
+
+
+@dataclass
+class _TrackedTask:
+    done: threading.Event = field(default_factory=threading.Event)
+    record: dict | None = None
+    status: str | None = None
+    error: BaseException | None = None
+    rounds_not_found: int = 0
+
+
+class FOXTaskPoller:
+    """
+    Tracks the status of NEMO queue tasks (ingestion, analyze_table, ...). All tasks that are
+    waited for are checked with the same requests to /api/nemo-queue/task_runs, so concurrent
+    imports share one poll per interval. The interval grows exponentially (with jitter) while
+    nothing changes and starts over when a status changes or a new task is added. A poll that
+    fails for a transient reason is repeated with the same backoff before the tasks fail.
+    """
+
+    def __init__(self, config: Config, upload_settings: FOXUploadSettings | None = None):
+        self.config = config
+        self.upload_settings = upload_settings or FOXUploadSettings()
+        self._tasks: dict[str, _TrackedTask] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def wait(self, task_id: str, timeout: float | None = None) -> dict:
+        """
+        Blocks until the task is finished or failed and returns its task record.
+        Raises:
+            TimeoutError: If the task is not done within timeout seconds.
+            Exception: If the task status cannot be retrieved.
+        """
+        with self._lock:
+            task = self._tasks.setdefault(task_id, _TrackedTask())
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="fox-task-poller", daemon=True
+                )
+                self._thread.start()
+        # a new task should be seen quickly, not after the current (long) interval
+        self._wakeup.set()
+
+        if not task.done.wait(timeout):
+            with self._lock:
+                self._tasks.pop(task_id, None)
+            raise TimeoutError(f"Task {task_id} not finished within {timeout} seconds")
+        if task.error is not None:
+            raise task.error
+        return task.record
+
+    def _run(self) -> None:
+        interval = self.upload_settings.task_poll_min_interval
+        failed_polls = 0
+        while True:
+            with self._lock:
+                pending = {task_id: task for task_id, task in self._tasks.items() if not task.done.is_set()}
+                if not pending:
+                    self._thread = None
+                    return
+
+            try:
+                changed = self._poll_once(pending)
+                failed_polls = 0
+            except Exception as e:
+                failed_polls += 1
+                if not _is_transient(e) or failed_polls >= self.upload_settings.task_poll_error_limit:
+                    for task_id, task in pending.items():
+                        self._complete(task_id, task, error=e)
+                    failed_polls = 0
+                    continue
+                logging.warning(f"Reading the status of the tasks failed ({failed_polls}x), trying again: {e}")
+                changed = False
+
+            if changed:
+                interval = self.upload_settings.task_poll_min_interval
+            else:
+                interval = min(
+                    interval * self.upload_settings.task_poll_backoff,
+                    self.upload_settings.task_poll_max_interval,
+                )
+            jitter = interval * self.upload_settings.task_poll_jitter
+            self._wakeup.wait(max(0.0, interval + random.uniform(-jitter, jitter)))
+            if self._wakeup.is_set():
+                self._wakeup.clear()
+                interval = self.upload_settings.task_poll_min_interval
+
+    def _poll_once(self, pending: dict[str, _TrackedTask]) -> bool:
+        records = self._fetch_records(set(pending))
+        changed = False
+        for task_id, task in pending.items():
+            record = records.get(task_id)
+            if record is None:
+                task.rounds_not_found += 1
+                if task.rounds_not_found >= self.upload_settings.task_poll_not_found_limit:
+                    self._complete(
+                        task_id,
+                        task,
+                        error=Exception(f"Task {task_id} not found in tasks list"),
+                    )
+                continue
+
+            task.rounds_not_found = 0
+            status = record.get("status")
+            if status != task.status:
+                logging.info(f"Status of task {task_id}: {status}")
+                task.status = status
+                changed = True
+            if status in (TASK_STATUS_FINISHED, TASK_STATUS_FAILED):
+                self._complete(task_id, task, record=record)
+        return changed
+
+    def _fetch_records(self, task_ids: set[str]) -> dict[str, dict]:
+        """
+        Reads the task list page by page (newest first) until all task_ids have been seen
+        or the list ends.
+        """
+        found = {}
+        headers = self.config.connection_get_headers()
+        page_size = self.upload_settings.task_poll_page_size
+        for page in range(1, self.upload_settings.task_poll_max_pages + 1):
+            data = {
+                "sort_by": "submit_at",
+                "is_sort_ascending": "False",
+                "page": page,
+                "page_size": page_size,
+            }
+            response = get_session().get(
+                self.config.get_config_nemo_url() + "/api/nemo-queue/task_runs",
+                headers=headers,
+                json=data,
+            )
+            if response.status_code != 200:
+                raise _TaskPollError(
+                    f"Request failed. Status: {response.status_code}, error: {response.text}",
+                    response.status_code,
+                )
+            records = json.loads(response.text).get("records") or []
+            for record in records:
+                if record.get("id") in task_ids:
+                    found[record["id"]] = record
+            if len(found) == len(task_ids) or len(records) < page_size:
+                break
+        return found
+
+    def _complete(
+        self,
+        task_id: str,
+        task: _TrackedTask,
+        record: dict | None = None,
+        error: BaseException | None = None,
+    ) -> None:
+        task.record = record
+        task.error = error
+        with self._lock:
+            self._tasks.pop(task_id, None)
+        task.done.set()
+
+
+_task_pollers: dict[tuple, FOXTaskPoller] = {}
+_task_pollers_lock = threading.Lock()
+
+
+def get_task_poller(config: Config, upload_settings: FOXUploadSettings | None = None) -> FOXTaskPoller:
+    """
+    Returns the task poller shared by all imports into the same NEMO environment and tenant by
+    the same user with the same poll settings. The poller sends its requests with the
+    credentials of the config it was created with.
+    """
+    upload_settings = upload_settings or FOXUploadSettings()
+    key = (
+        config.get_config_nemo_url(),
+        config.get_tenant(),
+        config.get_userid(),
+        upload_settings.task_poll_min_interval,
+        upload_settings.task_poll_max_interval,
+        upload_settings.task_poll_backoff,
+        upload_settings.task_poll_jitter,
+        upload_settings.task_poll_page_size,
+        upload_settings.task_poll_max_pages,
+        upload_settings.task_poll_not_found_limit,
+        upload_settings.task_poll_error_limit,
+    )
+    with _task_pollers_lock:
+        poller = _task_pollers.get(key)
+        if poller is None:
+            poller = FOXTaskPoller(config, upload_settings)
+            _task_pollers[key] = poller
+        return poller
+
+
+def wait_for_task(
+    config: Config,
+    task_id: str,
+    upload_settings: FOXUploadSettings | None = None,
+    timeout: float | None = None,
+) -> dict:
+    """
+    Waits until a NEMO queue task is finished or failed and returns its task record.
+    """
+    return get_task_poller(config, upload_settings).wait(task_id, timeout=timeout)
@@ -0,0 +1,111 @@
+import os
+import threading
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass, field
+
+# files below this size are not compressed when no compression level is configured
+SMALL_FILE_SIZE_IN_MB = 5
+
+
+def _default_compress_threads() -> int:
+    return max(1, min(8, os.cpu_count() or 1))
+
+
+@dataclass
+class FOXUploadSettings:
+    """
+    Tuning parameters for writing, compressing and uploading the data file of an import.
+    """
+
+    # gzip compression level 0-9. None keeps the old behaviour: level 0 for files below
+    # 5 MB and level 3 for larger files
+    compress_level: int | None = None
+
+    # number of worker threads compressing blocks in parallel (1 = compress in the calling thread)
+    compress_threads: int = field(default_factory=_default_compress_threads)
+
+    # size of the uncompressed blocks; every block becomes an independent gzip member
+    compress_block_size: int = 4 * 1024 * 1024
+
+    # maximum number of blocks being compressed or waiting to be written (0 = twice the threads)
+    compress_max_pending_blocks: int = 0
+
+    # reconcile the metadata of a FOX file on a worker thread while the data is converted,
+    # serialized and uploaded. If False, the stages run one after the other
+    pipelined_fox_import: bool = True
+
+    # compress and upload at the same time by streaming the gzip data into the multipart upload.
+    # If False, the compressed file is written to disk first and uploaded afterwards
+    stream_upload: bool = True
+
+    # multipart upload: size of the parts, number of parts uploaded in parallel and
+    # the file size from which on multipart uploads are used
+    s3_part_size: int = 16 * 1024 * 1024
+    s3_max_concurrency: int = 8
+    s3_multipart_threshold: int = 16 * 1024 * 1024
+
+    # target bucket and an optional endpoint, e.g. a local S3 stand-in (MinIO, moto) for measurements
+    s3_bucket: str = "nemoinfrastructurestack-nemouploadbucketa98fe899-1s2ocvunlg3vs"
+    s3_endpoint_url: str | None = None
+
+    # get the S3 credentials from the NEMO token vendor. If False, boto3 resolves the
+    # credentials itself (environment variables, profiles), which is useful for a local stand-in
+    s3_use_token_vendor: bool = True
+
+    # the cached STS credentials and S3 client are renewed this many seconds before they expire.
+    # If the token vendor does not report an expiration, they are kept for s3_credentials_ttl seconds
+    s3_credentials_refresh_margin: int = 300
+    s3_credentials_ttl: int = 900
+
+    # waiting for queue tasks (ingestion, analyze_table): the poll interval starts at the minimum
+    # and grows by the backoff factor (+/- jitter as a fraction) up to the maximum while nothing changes
+    task_poll_min_interval: float = 1.0
+    task_poll_max_interval: float = 15.0
+    task_poll_backoff: float = 1.5
+    task_poll_jitter: float = 0.1
+
+    # the task list is read page by page until all tracked tasks are found
+    task_poll_page_size: int = 50
+    task_poll_max_pages: int = 10
+
+    # a task that is not found in this many polls in a row is reported as an error
+    task_poll_not_found_limit: int = 3
+
+    # a poll that fails for a transient reason (connection error, timeout, status 429 or 5xx) is
+    # repeated with the backoff; the waiting tasks fail after this many failed polls in a row
+    task_poll_error_limit: int = 5
+
+    # limits shared by concurrent imports (see foxbatchimport): parsing FOX files (CPU) and
+    # uploading data (network). None = no limit
+    parse_slots: threading.Semaphore | None = None
+    upload_slots: threading.Semaphore | None = None
+
+    # create, update and delete requests of metadata objects sent to NEMO at the same time (1 = one after the other)
+    metadata_max_parallel_requests: int = 8
+
+    # send the metadata requests with the asyncio client (foxnemo_persistence_api_async, needs aiohttp)
+    async_metadata_client: bool = False
+
+    # read the metadata of the project once per import and keep it up to date with the own changes
+    # (see FOXMetadataSnapshot). If False, every step reads it again
+    metadata_snapshot: bool = True
+
+    # directory of the local import state (fingerprints of the last imports, see FOXImportStateStore).
+    # None = ~/.nemo_library_fox_reader/import_state
+    import_state_directory: str | None = None
+
+    def get_compress_level(self, filesize_in_mb: float) -> int:
+        if self.compress_level is not None:
+            return self.compress_level
+        return 0 if filesize_in_mb < SMALL_FILE_SIZE_IN_MB else 3
+
+    def parse_slot(self) -> AbstractContextManager:
+        return self.parse_slots if self.parse_slots is not None else nullcontext()
+
+    def upload_slot(self) -> AbstractContextManager:
+        return self.upload_slots if self.upload_slots is not None else nullcontext()
+
+    def get_max_pending_blocks(self) -> int:
+        if self.compress_max_pending_blocks > 0:
+            return self.compress_max_pending_blocks
+        return 2 * self.compress_threads
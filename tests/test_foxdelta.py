@@ -0,0 +1,180 @@
+from dataclasses import replace
+
+import pytest
+
+from nemo_library_fox_reader import foxfileingestion
+from nemo_library_fox_reader.foxattribute import FoxAttribute
+from nemo_library_fox_reader.foxdelta import create_delta_plan, fingerprint_attributes
+from nemo_library_fox_reader.foxuploadsettings import FOXUploadSettings
+from nemo_library_fox_reader.foxutils import FOXAttributeType
+
+
+def _attributes(**changes) -> list[FoxAttribute]:
+    return [
+        FoxAttribute(attribute_name="Customer", attribute_id=0, uuid="a", values=["A", "B"]),
+        replace(
+            FoxAttribute(
+                attribute_name="Revenue",
+                attribute_id=1,
+                uuid="b",
+                values=["1.5", "2.25"],
+                format="#,##0.00",
+                nemo_data_type="float",
+            ),
+            **changes,
+        ),
+    ]
+
+
+def _plan(previous_attributes, attributes):
+    previous = {"rows": 2, "attributes": fingerprint_attributes(previous_attributes)}
+    return create_delta_plan(previous, fingerprint_attributes(attributes, previous))
+
+
+def test_unchanged_file():
+    plan = _plan(_attributes(), _attributes())
+    assert plan.unchanged
+
+
+@pytest.mark.parametrize(
+    "changes",
+    [
+        {"format": "#,##0.000"},
+        {"nemo_data_type": "string"},
+        {"nemo_pandas_conversion_format": "%d.%m.%Y"},
+        {"nemo_decimal_point": ","},
+        {"nemo_numeric_separator": "."},
+    ],
+)
+def test_redefined_data_column_changes_data(changes):
+    plan = _plan(_attributes(), _attributes(**changes))
+    revenue = _attributes()[1].get_nemo_name()
+    assert plan.data_changed
+    assert revenue in plan.changed_columns
+    assert revenue in plan.redefined_attributes
+
+
+class _Config:
+    def get_config_nemo_url(self) -> str:
+        return "https://nemo.test"
+
+    def get_tenant(self) -> str:
+        return "tenant"
+
+    def get_foxreader_statistics_file(self) -> str | None:
+        return None
+
+
+def test_redefined_data_column_is_uploaded(tmp_path, monkeypatch):
+    attributes = _attributes()
+    calls = []
+
+    class _FOXFile:
+        def __init__(self, filename, config=None, foxReaderInfo=None):
+            self.attributes = attributes
+            self.attributes_converted_to_string = []
+
+        def read_schema(self) -> bool:
+            return True
+
+        def close(self) -> None:
+            pass
+
+    class _FOXMeta:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def reconcile_metadata(self, config, projectname, statistics_only=False):
+            calls.append("metadata")
+
+    monkeypatch.setattr(foxfileingestion, "FOXFile", _FOXFile)
+    monkeypatch.setattr(foxfileingestion, "FOXMeta", _FOXMeta)
+    monkeypatch.setattr(foxfileingestion, "getProjectID", lambda config, projectname: "project-id")
+    monkeypatch.setattr(foxfileingestion, "_update_project_after_ingestion", lambda *args: None)
+    monkeypatch.setattr(
+        foxfileingestion, "_pipelined_fox_import", lambda **kwargs: calls.append("upload") or True
+    )
+
+    filename = tmp_path / "data.fox"
+    filename.write_bytes(b"FOX")
+    settings = FOXUploadSettings(import_state_directory=str(tmp_path / "state"))
+
+    def _import() -> None:
+        foxfileingestion.ReUploadFile(
+            _Config(), "project", str(filename), upload_settings=settings, delta_import=True, force=True
+        )
+
+    _import()
+    assert calls == ["upload"]
+
+    calls.clear()
+    _import()
+    assert calls == []
+
+    attributes[1] = replace(attributes[1], format="#,##0.000")
+    _import()
+    assert calls == ["upload"]
+
+    calls.clear()
+    _import()
+    assert calls == []
+
+
+def test_converted_attribute_stays_string_on_metadata_update(tmp_path, monkeypatch):
+    attributes = _attributes()
+    data_types = []
+
+    class _FOXFile:
+        def __init__(self, filename, config=None, foxReaderInfo=None):
+            self.attributes = attributes
+            self.attributes_converted_to_string = []
+
+        def read_schema(self) -> bool:
+            return True
+
+        def close(self) -> None:
+            pass
+
+    class _FOXMeta:
+        def __init__(self, foxfile, *args, **kwargs):
+            self.foxfile = foxfile
+
+        def reconcile_metadata(self, config, projectname, statistics_only=False):
+            data_types.append(self.foxfile.attributes[1].nemo_data_type)
+
+    def _pipelined_fox_import(foxfile, **kwargs) -> bool:
+        # the values of Revenue could not be converted to float
+        foxfile.attributes_converted_to_string = [foxfile.attributes[1]]
+        return True
+
+    monkeypatch.setattr(foxfileingestion, "FOXFile", _FOXFile)
+    monkeypatch.setattr(foxfileingestion, "FOXMeta", _FOXMeta)
+    monkeypatch.setattr(foxfileingestion, "getProjectID", lambda config, projectname: "project-id")
+    monkeypatch.setattr(foxfileingestion, "_update_project_after_ingestion", lambda *args: None)
+    monkeypatch.setattr(foxfileingestion, "_pipelined_fox_import", _pipelined_fox_import)
+
+    filename = tmp_path / "data.fox"
+    filename.write_bytes(b"FOX")
+    settings = FOXUploadSettings(import_state_directory=str(tmp_path / "state"))
+
+    def _import() -> None:
+        foxfileingestion.ReUploadFile(
+            _Config(), "project", str(filename), upload_settings=settings, delta_import=True, force=True
+        )
+
+    _import()
+    attributes[:] = _attributes()
+
+    # a new header changes the definition only
+    attributes.append(
+        FoxAttribute(attribute_name="Group", attribute_id=2, uuid="c", attribute_type=FOXAttributeType.Header)
+    )
+    _import()
+    assert data_types == ["string"]
+
+    attributes[:] = _attributes() + [attributes[2]]
+    attributes.append(
+        FoxAttribute(attribute_name="Region", attribute_id=3, uuid="d", attribute_type=FOXAttributeType.Header)
+    )
+    _import()
+    assert data_types == ["string", "string"]
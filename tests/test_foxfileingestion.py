@@ -0,0 +1,118 @@
+import pytest
+
+from nemo_library_fox_reader import foxfileingestion
+from nemo_library_fox_reader.foximportstate import FOXImportStateStore
+from nemo_library_fox_reader.foxuploadsettings import FOXUploadSettings
+
+
+class _Config:
+    def get_config_nemo_url(self) -> str:
+        return "https://nemo.test"
+
+    def get_tenant(self) -> str:
+        return "tenant"
+
+    def get_foxreader_statistics_file(self) -> str | None:
+        return None
+
+
+class _UnreadableFOXFile:
+    def __init__(self, filename, config=None, foxReaderInfo=None):
+        self.attributes = []
+
+    def read_schema(self) -> bool:
+        return False
+
+    def read(self):
+        return None
+
+    def close(self) -> None:
+        pass
+
+
+@pytest.mark.parametrize(
+    "settings",
+    [
+        {"pipelined_fox_import": True},
+        {"pipelined_fox_import": False},
+        {"pipelined_fox_import": True, "delta_import": True},
+    ],
+)
+def test_unreadable_file_is_not_recorded(tmp_path, monkeypatch, settings):
+    monkeypatch.setattr(foxfileingestion, "FOXFile", _UnreadableFOXFile)
+    monkeypatch.setattr(foxfileingestion, "getProjectID", lambda config, projectname: "project-id")
+    calls = []
+    monkeypatch.setattr(foxfileingestion, "ReUploadDataFrame", lambda **kwargs: calls.append("upload"))
+
+    filename = tmp_path / "data.fox"
+    filename.write_bytes(b"FOX")
+    upload_settings = FOXUploadSettings(
+        import_state_directory=str(tmp_path / "state"),
+        pipelined_fox_import=settings["pipelined_fox_import"],
+    )
+    config = _Config()
+
+    for _ in range(2):
+        foxfileingestion.ReUploadFile(
+            config,
+            "project",
+            str(filename),
+            upload_settings=upload_settings,
+            delta_import=settings.get("delta_import", False),
+        )
+
+    assert calls == []
+    store = FOXImportStateStore(upload_settings.import_state_directory)
+    assert store.get_section(config, "project", foxfileingestion.CONTENT_STATE_SECTION) is None
+
+
+def test_imported_file_is_recorded_and_skipped(tmp_path, monkeypatch):
+    calls = []
+    monkeypatch.setattr(foxfileingestion, "getProjectID", lambda config, projectname: "project-id")
+    monkeypatch.setattr(foxfileingestion, "ReUploadDataFrame", lambda **kwargs: calls.append("upload"))
+
+    filename = tmp_path / "data.csv"
+    filename.write_text("a;b\n1;2\n")
+    upload_settings = FOXUploadSettings(import_state_directory=str(tmp_path / "state"))
+
+    for _ in range(2):
+        foxfileingestion.ReUploadFile(_Config(), "project", str(filename), upload_settings=upload_settings)
+
+    assert calls == ["upload"]
+
+
+def test_changed_fields_mapping_is_imported_again(tmp_path, monkeypatch):
+    calls = []
+    monkeypatch.setattr(foxfileingestion, "getProjectID", lambda config, projectname: "project-id")
+    monkeypatch.setattr(foxfileingestion, "ReUploadDataFrame", lambda **kwargs: calls.append("upload"))
+
+    filename = tmp_path / "data.csv"
+    filename.write_text("a;b\n1;2\n")
+    upload_settings = FOXUploadSettings(import_state_directory=str(tmp_path / "state"))
+
+    for mapping in ([], [{"globalFieldName": "customer", "importName": "a"}]):
+        foxfileingestion.ReUploadFile(
+            _Config(), "project", str(filename), upload_settings=upload_settings, global_fields_mapping=mapping
+        )
+
+    assert calls == ["upload", "upload"]
+
+
+@pytest.mark.parametrize("version, trigger_only, kept", [(2, False, 0), (3, False, 0), (3, True, 1)])
+def test_uploaded_data_is_removed_after_the_ingestion(version, trigger_only, kept):
+    pd = pytest.importorskip("pandas")
+    from nemo_library_fox_reader.foxmockserver import FOXMockNemoServer
+
+    with FOXMockNemoServer() as server:
+        server.add_project("project")
+        foxfileingestion.ReUploadDataFrame(
+            server.create_config(),
+            "project",
+            pd.DataFrame({"a": ["x", "y"], "b": [1, 2]}),
+            update_project_settings=False,
+            version=version,
+            trigger_only=trigger_only,
+            upload_settings=server.create_upload_settings(),
+        )
+        assert len(server.tasks) == 1
+        assert len(server.s3_objects) == kept
@@ -0,0 +1,97 @@
+import io
+import re
+
+import numpy as np
+import pandas as pd
+import pytest
+from nemo_library.features.import_configuration import ImportConfigurations
+
+from nemo_library_fox_reader.foxfileingestion import _format_data
+
+
+def _format_data_per_cell(df: pd.DataFrame, import_configuration: ImportConfigurations) -> pd.DataFrame:
+    """
+    _format_data before the distinct values were escaped with one translation table
+    """
+    SPECIAL_CHARS = [r'"', r"“", r"”", r"„", r"'", r"«", r"»", r"‹", r"›", r"‘", r"’"]
+    REMOVE_CHARS = ["\n", "\r"]
+
+    if import_configuration.optionally_enclosed_by in SPECIAL_CHARS:
+        SPECIAL_CHARS.remove(import_configuration.optionally_enclosed_by)
+
+    if import_configuration.escape_character not in SPECIAL_CHARS:
+        SPECIAL_CHARS.append(import_configuration.escape_character)
+
+    def escape_special_chars(value):
+        if isinstance(value, str):
+            for char in SPECIAL_CHARS:
+                value = re.sub(
+                    re.escape(char),
+                    f"{import_configuration.escape_character}{char}",
+                    value,
+                )
+            for char in REMOVE_CHARS:
+                value = value.replace(char, "")
+        return value
+
+    str_columns = df.select_dtypes(include=["object", "string"]).columns
+    for col in str_columns:
+        df[col] = df[col].map(escape_special_chars)
+
+    return df
+
+
+def _to_csv(df: pd.DataFrame, import_configuration: ImportConfigurations) -> bytes:
+    # the same options as the CSV written by ReUploadDataFrame
+    buffer = io.StringIO(newline="")
+    df.to_csv(
+        buffer,
+        index=False,
+        sep=import_configuration.field_delimiter,
+        na_rep="",
+        escapechar=import_configuration.escape_character,
+        lineterminator=import_configuration.record_delimiter,
+        quotechar=import_configuration.optionally_enclosed_by,
+        doublequote=False,
+    )
+    return buffer.getvalue().encode("utf-8")
+
+
+def _frame() -> pd.DataFrame:
+    rows = 60
+    repeated = ['say "hi"', "it's", "„quoted“", "«a» ‹b› ‘c’ ”d”", "back\\slash", "line\nbreak\r\n", ""]
+    return pd.DataFrame(
+        {
+            "repeated": [repeated[i % len(repeated)] for i in range(rows)],
+            "repeated_with_missing": [
+                None if i % 5 == 0 else np.nan if i % 7 == 0 else repeated[i % 3] for i in range(rows)
+            ],
+            "unique": [f'row {i} "{i}" \\ \n' for i in range(rows)],
+            "mixed": [[1, 2.5, "a'b", None, np.nan, pd.NaT, True, 'q"'][i % 8] for i in range(rows)],
+            "string_dtype": pd.array(
+                [None if i % 4 == 0 else repeated[i % len(repeated)] for i in range(rows)], dtype="string"
+            ),
+            "timestamps": pd.Series(
+                [pd.NaT if i % 6 == 0 else pd.Timestamp("2024-01-01") + pd.Timedelta(days=i) for i in range(rows)]
+            ),
+            "object_timestamps": pd.Series(
+                [pd.NaT if i % 3 == 0 else pd.Timestamp("2024-01-01") for i in range(rows)], dtype=object
+            ),
+            "numbers": [np.nan if i % 9 == 0 else i / 3 for i in range(rows)],
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    "import_configuration",
+    [
+        ImportConfigurations(),
+        ImportConfigurations(optionally_enclosed_by="'"),
+        ImportConfigurations(escape_character="'", optionally_enclosed_by='"'),
+        ImportConfigurations(escape_character="|", field_delimiter=",", record_delimiter="\r\n"),
+    ],
+)
+def test_format_data_writes_the_same_csv(import_configuration):
+    expected = _to_csv(_format_data_per_cell(_frame(), import_configuration), import_configuration)
+    actual = _to_csv(_format_data(_frame(), import_configuration), import_configuration)
+    assert actual == expected
@@ -0,0 +1,34 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from nemo_library_fox_reader.foxhttp import FOXHttpSettings, _create_session
+
+
+class _CookieHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.server.received_cookies.append(self.headers.get("Cookie"))
+        self.send_response(200)
+        self.send_header("Set-Cookie", "session=tenant-a; Path=/")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_session_does_not_keep_cookies():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _CookieHandler)
+    server.received_cookies = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        session = _create_session(FOXHttpSettings())
+        url = f"http://127.0.0.1:{server.server_address[1]}/"
+        session.get(url)
+        session.get(url)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert len(session.cookies) == 0
+    assert server.received_cookies == [None, None]
@@ -0,0 +1,31 @@
+import threading
+
+from nemo_library_fox_reader.foximportstate import FOXImportStateStore
+
+
+class _Config:
+    def get_config_nemo_url(self) -> str:
+        return "https://nemo.test"
+
+    def get_tenant(self) -> str:
+        return "tenant"
+
+
+def test_concurrent_stores_keep_all_sections(tmp_path):
+    config = _Config()
+    barrier = threading.Barrier(8)
+
+    def write(index: int) -> None:
+        barrier.wait()
+        for round in range(20):
+            FOXImportStateStore(tmp_path).set_section(config, "project", f"section{index}", {"round": round})
+
+    threads = [threading.Thread(target=write, args=(index,)) for index in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    state = FOXImportStateStore(tmp_path).load(config, "project")
+    assert {f"section{index}": {"round": 19} for index in range(8)}.items() <= state.items()
+    assert not list(tmp_path.glob("*.tmp"))
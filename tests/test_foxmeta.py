@@ -0,0 +1,78 @@
+from types import SimpleNamespace
+
+import pytest
+
+from nemo_library_fox_reader.foxattribute import FoxAttribute
+from nemo_library_fox_reader.foxmeta import FOXMeta
+from nemo_library_fox_reader.foxmockserver import FOXMockNemoServer
+from nemo_library_fox_reader.foxnemo_persistence_api import clearProjectIDCache
+from nemo_library_fox_reader.foxreaderinfo import FOXReaderInfo
+from nemo_library_fox_reader.foxutils import FOXAttributeType
+
+
+def _meta() -> FOXMeta:
+    attributes = [
+        FoxAttribute(
+            attribute_name="Order Date",
+            attribute_id=0,
+            uuid="a",
+            format="tt.mm.jjjj",
+            nemo_data_type="date",
+        ),
+        FoxAttribute(
+            attribute_name="Order Month",
+            attribute_id=1,
+            uuid="b",
+            format="mm",
+            attribute_type=FOXAttributeType.Link,
+            original_attribute_index=0,
+        ),
+    ]
+    fox = SimpleNamespace(global_information=SimpleNamespace(table_name="orders"), attributes=attributes)
+    foxReaderInfo = FOXReaderInfo()
+    foxReaderInfo.operation_mode_not_moving_attributes = True
+    return FOXMeta(fox, foxReaderInfo=foxReaderInfo)
+
+
+@pytest.fixture
+def server():
+    with FOXMockNemoServer() as server:
+        yield server
+        clearProjectIDCache(server.create_config())
+
+
+def test_link_to_converted_date_becomes_attribute_link(server):
+    config = server.create_config()
+    meta = _meta()
+    meta.apply_metadata(config, "project")
+    project_id = next(iter(server.projects))
+    month = meta.attributes[1].get_nemo_name()
+    assert month in {column["internalName"] for column in server.get_objects("Columns", project_id)}
+
+    date = meta.attributes[0]
+    date.nemo_data_type = "string"
+    meta.apply_converted_attributes(config, "project", [date])
+
+    columns = {column["internalName"]: column for column in server.get_objects("Columns", project_id)}
+    links = {link["internalName"]: link for link in server.get_objects("AttributeLink", project_id)}
+    assert month not in columns
+    assert links[month]["sourceAttributeInternalName"] == date.get_nemo_name()
+    assert columns[date.get_nemo_name()]["dataType"] == "string"
+
+    # the result is the metadata of an import that converted the attribute before the preparation
+    expected = _meta()
+    expected.attributes[0].nemo_data_type = "string"
+    expected.prepare_metadata()
+    assert [column.internalName for column in meta.columns_fox] == [
+        column.internalName for column in expected.columns_fox
+    ]
+    assert [link.internalName for link in meta.attributelinks_fox] == [
+        link.internalName for link in expected.attributelinks_fox
+    ]
+
+
+def test_other_links_are_kept():
+    meta = _meta()
+    meta.prepare_metadata()
+    other = FoxAttribute(attribute_name="Other", attribute_id=7, uuid="c")
+    assert meta._update_links_to_converted_attributes([other]) == (set(), [])
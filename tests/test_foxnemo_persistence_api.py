@@ -0,0 +1,34 @@
+import sys
+
+import pytest
+
+from nemo_library_fox_reader import foxnemo_persistence_api as persistence_api
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    yield
+    persistence_api.setListResponseCacheSize(64 * 1024 * 1024)
+    persistence_api.clearListResponseCache()
+
+
+def _cache(name: str, text: str) -> None:
+    persistence_api._handle_list_response((name, "tenant", "user"), None, 200, f'"{name}"', text)
+
+
+def test_list_response_cache_is_bounded_by_size():
+    body = "x" * 1000
+    persistence_api.setListResponseCacheSize(2 * sys.getsizeof(body))
+    for name in ("a", "b", "c"):
+        _cache(name, body)
+
+    assert [key[0] for key in persistence_api._list_response_cache] == ["b", "c"]
+    assert persistence_api._list_response_cache_bytes == 2 * sys.getsizeof(body)
+
+    # larger than the whole cache
+    _cache("d", body * 3)
+    assert "d" not in [key[0] for key in persistence_api._list_response_cache]
+
+    persistence_api.setListResponseCacheSize(0)
+    assert not persistence_api._list_response_cache
+    assert persistence_api._list_response_cache_bytes == 0
@@ -0,0 +1,73 @@
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from nemo_library.model.column import Column
+
+from nemo_library_fox_reader import foxnemo_persistence_api_async as persistence_api
+from nemo_library_fox_reader.foxmetadatasnapshot import FOXMetadataSnapshot
+from nemo_library_fox_reader.foxmockserver import FOXMockNemoServer
+from nemo_library_fox_reader.foxnemo_persistence_api import clearListResponseCache, clearProjectIDCache
+
+_GET_COLUMNS = "GET /api/nemo-persistence/metadata/{endpoint}/project/{project_id}{postfix}"
+
+
+@pytest.fixture
+def server():
+    with FOXMockNemoServer() as server:
+        server.add_project("project")
+        connections = []
+        process_request = server._httpd.process_request
+
+        def count_connection(request, client_address):
+            connections.append(client_address)
+            process_request(request, client_address)
+
+        server._httpd.process_request = count_connection
+        server.connections = connections
+        yield server
+        persistence_api.close_async_session()
+        clearProjectIDCache(server.create_config())
+        clearListResponseCache()
+
+
+def _create_column(config) -> None:
+    persistence_api.createColumns(
+        config,
+        "project",
+        [Column(displayName="Revenue", internalName="revenue", importName="revenue", columnType="ExportedColumn", dataType="float")],
+    )
+
+
+def test_calls_reuse_the_connection(server):
+    config = server.create_config()
+    _create_column(config)
+    for _ in range(3):
+        assert [column.internalName for column in persistence_api.getColumns(config, "project")] == ["revenue"]
+    assert len(server.connections) == 1
+
+
+def test_lists_are_taken_from_the_snapshot(server):
+    config = server.create_config()
+    _create_column(config)
+    server.reset_counts()
+    with FOXMetadataSnapshot(config, "project").activate():
+        for _ in range(3):
+            assert len(persistence_api.getColumns(config, "project")) == 1
+    assert server.request_counts[_GET_COLUMNS] == 1
+
+
+def test_unchanged_lists_are_not_downloaded_again(server, monkeypatch):
+    config = server.create_config()
+    _create_column(config)
+    statuses = []
+    handle_list_response = persistence_api._handle_list_response
+
+    def record_status(key, entry, status_code, etag, text):
+        statuses.append(status_code)
+        return handle_list_response(key, entry, status_code, etag, text)
+
+    monkeypatch.setattr(persistence_api, "_handle_list_response", record_status)
+    persistence_api.getColumns(config, "project")
+    persistence_api.getColumns(config, "project")
+    assert statuses[-1] == 304
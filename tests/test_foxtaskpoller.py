@@ -0,0 +1,89 @@
+import json
+
+import requests
+
+from nemo_library_fox_reader import foxtaskpoller
+from nemo_library_fox_reader.foxuploadsettings import FOXUploadSettings
+
+
+class _Config:
+    def __init__(self, userid: str = "user"):
+        self.userid = userid
+
+    def get_config_nemo_url(self) -> str:
+        return "https://nemo.test"
+
+    def get_tenant(self) -> str:
+        return "tenant"
+
+    def get_userid(self) -> str:
+        return self.userid
+
+    def connection_get_headers(self) -> dict[str, str]:
+        return {}
+
+
+class _Response:
+    def __init__(self, status_code: int, records: list[dict] | None = None):
+        self.status_code = status_code
+        self.text = json.dumps({"records": records or []})
+
+
+class _Session:
+    """
+    Answers the task list requests from a script: an exception is raised, a response returned.
+    """
+
+    def __init__(self, answers: list):
+        self.answers = answers
+        self.requests = 0
+
+    def get(self, url, headers=None, json=None):
+        answer = self.answers[min(self.requests, len(self.answers) - 1)]
+        self.requests += 1
+        if isinstance(answer, Exception):
+            raise answer
+        return answer
+
+
+def _upload_settings(**kwargs) -> FOXUploadSettings:
+    return FOXUploadSettings(task_poll_min_interval=0.001, task_poll_max_interval=0.01, **kwargs)
+
+
+def _poll(monkeypatch, answers: list, **settings) -> tuple[_Session, dict | BaseException]:
+    session = _Session(answers)
+    monkeypatch.setattr(foxtaskpoller, "get_session", lambda: session)
+    poller = foxtaskpoller.FOXTaskPoller(_Config(), _upload_settings(**settings))
+    try:
+        return session, poller.wait("task", timeout=5)
+    except Exception as e:
+        return session, e
+
+
+def test_transient_errors_are_retried(monkeypatch):
+    finished = _Response(200, [{"id": "task", "status": "finished"}])
+    session, result = _poll(
+        monkeypatch, [requests.ConnectionError("reset"), _Response(503), _Response(500), finished]
+    )
+    assert result == {"id": "task", "status": "finished"}
+    assert session.requests == 4
+
+
+def test_transient_errors_fail_after_the_limit(monkeypatch):
+    session, result = _poll(monkeypatch, [_Response(503)], task_poll_error_limit=3)
+    assert isinstance(result, Exception) and "503" in str(result)
+    assert session.requests == 3
+
+
+def test_other_errors_fail_at_once(monkeypatch):
+    session, result = _poll(monkeypatch, [_Response(401)])
+    assert isinstance(result, Exception) and "401" in str(result)
+    assert session.requests == 1
+
+
+def test_pollers_are_shared_per_user_and_settings():
+    settings = _upload_settings()
+    poller = foxtaskpoller.get_task_poller(_Config("a"), settings)
+    assert foxtaskpoller.get_task_poller(_Config("a"), _upload_settings()) is poller
+    assert foxtaskpoller.get_task_poller(_Config("b"), settings) is not poller
+    assert foxtaskpoller.get_task_poller(_Config("a"), _upload_settings(task_poll_page_size=10)) is not poller